@@ -0,0 +1,115 @@
+"""
+Vectorized Evaluation of Compute Expressions.
+
+A Compute node in vectorized mode evaluates its expression over whole arrays
+instead of single values, so one node can replace a For Loop that walks a
+MySQL Read result or a buffered signal element by element. This module
+provides the evaluation namespace for that mode: a whitelisted subset of
+NumPy exposed as `np`, a few harmless builtins, and the conversion of data
+connection values into arrays and of results back into plain Python values.
+"""
+import types
+import numpy as np
+
+COMPUTE_MODE_SCALAR = "Scalar"
+COMPUTE_MODE_VECTORIZED = "Vectorized"
+COMPUTE_MODES = (COMPUTE_MODE_SCALAR, COMPUTE_MODE_VECTORIZED)
+
+# The NumPy functions and constants vectorized expressions may use as `np.<name>`.
+_NUMPY_WHITELIST = (
+    # Construction and reshaping
+    'array', 'asarray', 'arange', 'linspace', 'zeros', 'ones', 'full', 'zeros_like', 'ones_like',
+    'concatenate', 'stack', 'hstack', 'vstack', 'reshape', 'ravel', 'transpose', 'flip', 'roll',
+    # Reductions and statistics
+    'sum', 'prod', 'mean', 'median', 'std', 'var', 'min', 'max', 'ptp', 'percentile', 'quantile',
+    'argmin', 'argmax', 'count_nonzero', 'any', 'all', 'cumsum', 'cumprod', 'diff', 'gradient',
+    'nansum', 'nanmean', 'nanmedian', 'nanstd', 'nanmin', 'nanmax', 'histogram', 'bincount',
+    # Element-wise math
+    'abs', 'sign', 'sqrt', 'square', 'power', 'exp', 'log', 'log10', 'log2',
+    'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'arctan2', 'hypot', 'degrees', 'radians',
+    'round', 'floor', 'ceil', 'trunc', 'clip', 'maximum', 'minimum', 'mod',
+    # Selection and logic
+    'where', 'select', 'nonzero', 'flatnonzero', 'isnan', 'isfinite', 'isclose', 'allclose',
+    'logical_and', 'logical_or', 'logical_not', 'logical_xor', 'isin', 'unique', 'sort', 'argsort',
+    'searchsorted',
+    # Signal processing
+    'convolve', 'correlate', 'interp', 'polyfit', 'polyval',
+    # Types and constants
+    'float64', 'int64', 'bool_', 'pi', 'e', 'nan', 'inf',
+)
+
+NUMPY_NAMESPACE = types.SimpleNamespace(**{name: getattr(np, name) for name in _NUMPY_WHITELIST})
+
+
+def _numpy_only_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """
+    An `__import__` that only resolves NumPy and its submodules.
+
+    Array methods such as `A.mean()` import their implementation lazily
+    through the caller's builtins, so the vectorized namespace needs an
+    importer; anything outside NumPy is refused.
+
+    Raises:
+        ImportError: If a module other than NumPy is requested.
+    """
+    if level == 0 and (name == "numpy" or name.startswith("numpy.")):
+        return __import__(name, globals, locals, fromlist, level)
+    raise ImportError(f"Importing '{name}' is not allowed in Compute expressions.")
+
+
+# Evaluation globals shared by all vectorized Compute nodes; `eval` does not
+# modify a globals dict that already defines __builtins__.
+VECTORIZED_GLOBALS = {
+    "__builtins__": {
+        'abs': abs, 'bool': bool, 'float': float, 'int': int, 'len': len,
+        'max': max, 'min': min, 'round': round, 'sum': sum,
+        '__import__': _numpy_only_import,
+    },
+    "np": NUMPY_NAMESPACE,
+}
+
+
+def as_array_input(value):
+    """
+    Converts a data connection value for use in a vectorized expression.
+
+    Lists and tuples of numbers (or of equally long rows) become NumPy
+    arrays. Arrays, scalars and other containers (e.g. DataFrames) are
+    passed through unchanged, as are sequences NumPy can only store as
+    objects, such as rows mixing strings and numbers.
+
+    Args:
+        value: The value received on a data input.
+
+    Returns:
+        The value to bind to the input name.
+    """
+    if not isinstance(value, (list, tuple)):
+        return value
+    try:
+        array = np.asarray(value)
+    except ValueError:
+        # Ragged nesting.
+        return value
+    return value if array.dtype.kind in "OUS" else array
+
+
+def to_output(result):
+    """
+    Converts the result of a vectorized expression for downstream nodes.
+
+    NumPy scalars (e.g. the result of `np.mean`) become plain Python values,
+    which OPC-UA writes, MySQL writes and conditions handle natively.
+    Arrays are returned unchanged.
+
+    Args:
+        result: The value the expression evaluated to.
+
+    Returns:
+        The value to store in the execution context.
+    """
+    if isinstance(result, np.generic):
+        return result.item()
+    if isinstance(result, np.ndarray) and result.ndim == 0:
+        return result.item()
+    return result
@@ -0,0 +1,266 @@
+"""
+Min/Max Decimation for Long Plot Histories.
+
+This module provides the MinMaxPyramid class, which reduces a time series to
+at most two points (the minimum and the maximum) per pixel column of the
+visible range. Drawing the resulting envelope looks the same as drawing every
+sample, including every spike, at a fraction of the cost.
+
+To keep zooming out over very long histories interactive, the pyramid
+precomputes block-wise min/max levels (each level aggregating `factor` blocks
+of the level below). A render then starts from the coarsest level that still
+has at least two blocks per pixel column, so its cost depends on the plot
+width rather than on the number of samples in view.
+
+Blocks are aligned to the absolute position of a sample in the stream rather
+than to the start of the window, so appending samples to a sliding window
+(e.g. a ring buffer) only recomputes the blocks at its newest end.
+"""
+import numpy as np
+
+
+class MinMaxPyramid:
+    """
+    A multi-resolution min/max summary of a sorted time series.
+
+    Level 0 is the window of raw samples. Level `k` holds one (start time,
+    minimum, maximum) block for every `factor ** k` samples of the stream.
+
+    Attributes:
+        factor (int): The number of blocks of one level aggregated per block
+                      of the next level.
+    """
+    def __init__(self, factor=8):
+        """
+        Initializes an empty MinMaxPyramid.
+
+        Args:
+            factor (int, optional): The aggregation factor between levels.
+        """
+        self.factor = max(2, int(factor))
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._total = 0
+        self._levels = []
+
+    @property
+    def levels(self):
+        """A list of (x, y_min, y_max) array triples, finest first."""
+        return [(self._x, self._y, self._y)] + [level.arrays() for level in self._levels]
+
+    def build(self, x, y):
+        """
+        (Re)builds the pyramid from a time series.
+
+        Args:
+            x (numpy.ndarray): The sample timestamps, sorted ascending.
+            y (numpy.ndarray): The sample values, same length as `x`.
+        """
+        self._total = 0
+        self._levels = []
+        self.extend(x, y, len(x))
+
+    def extend(self, x, y, count):
+        """
+        Updates the pyramid after samples were appended to the window.
+
+        Only the blocks covering the new samples are computed, so the cost
+        depends on `count` rather than on the length of the window.
+
+        Args:
+            x (numpy.ndarray): The whole window of sample timestamps, sorted
+                               ascending, after the append.
+            y (numpy.ndarray): The window's sample values, same length as `x`.
+            count (int): The number of samples appended at the end of the
+                         window since the last update. Samples dropped from
+                         its start are detected from the window length.
+        """
+        if count >= len(x):
+            self._total = 0
+            self._levels = []
+        self._x, self._y = x, y
+        if count <= 0:
+            return
+        self._total += min(count, len(x))
+        offset = self._total - len(x)
+
+        child_first, child_x, child_min, child_max = offset, x, y, y
+        new_children = min(count, len(x))
+        block_size, level_index = 1, 0
+        while level_index < len(self._levels) or len(child_x) >= 2 * self.factor:
+            if level_index == len(self._levels):
+                self._levels.append(_BlockLevel())
+                new_children = len(child_x)
+            block_size *= self.factor
+            level = self._levels[level_index]
+            # Recompute from the block holding the first new child; it may have been partial.
+            first_new = child_first + len(child_x) - new_children
+            first_block = max(first_new // self.factor, level.first) if len(level) else first_new // self.factor
+            level.write(first_block, *_reduce_blocks(child_first, child_x, child_min, child_max,
+                                                      first_block * self.factor, self.factor))
+            level.discard_before(offset // block_size)
+            new_children = level.first + len(level) - first_block
+            child_first, (child_x, child_min, child_max) = level.first, level.arrays()
+            level_index += 1
+
+    def decimate(self, columns, x_min=None, x_max=None):
+        """
+        Returns a min/max envelope of the samples in a time range.
+
+        Args:
+            columns (int): The number of pixel columns the range is drawn into.
+            x_min (float, optional): The start of the range. Defaults to the first sample.
+            x_max (float, optional): The end of the range. Defaults to the last sample.
+
+        Returns:
+            tuple: (x, y) arrays to plot. Ranges with few samples are returned
+                   undecimated. One sample beyond each end of the range is
+                   included so lines run to the edges of the view.
+        """
+        x, y = self._x, self._y
+        if len(x) == 0:
+            return np.empty(0), np.empty(0)
+        columns = max(1, int(columns))
+        x_min = x[0] if x_min is None else x_min
+        x_max = x[-1] if x_max is None else x_max
+
+        start = max(0, int(np.searchsorted(x, x_min, side='left')) - 1)
+        stop = min(len(x), int(np.searchsorted(x, x_max, side='right')) + 1)
+        count = stop - start
+        if count <= 2 * columns:
+            return x[start:stop], y[start:stop]
+
+        level, block_size = 0, 1
+        while level < len(self._levels) and count / (block_size * self.factor) >= 2 * columns:
+            level += 1
+            block_size *= self.factor
+
+        offset = self._total - len(x)
+        level_x, level_min, level_max = self._blocks(level, block_size, offset + start, offset + stop)
+
+        span = (x_max - x_min) or 1.0
+        column = np.floor((level_x - x_min) * (columns / span)).astype(np.int64)
+        np.clip(column, -1, columns, out=column)
+        group_starts = np.concatenate(([0], np.flatnonzero(np.diff(column)) + 1))
+
+        envelope_x = np.repeat(level_x[group_starts], 2)
+        envelope_y = np.empty(2 * len(group_starts), dtype=np.float64)
+        envelope_y[0::2] = np.fmin.reduceat(level_min, group_starts)
+        envelope_y[1::2] = np.fmax.reduceat(level_max, group_starts)
+        return envelope_x, envelope_y
+
+    def _blocks(self, level, block_size, start, stop):
+        """
+        Returns the blocks of a level covering a range of stream positions.
+
+        The oldest block of a level may still include samples that have left
+        the window; it is replaced by finer blocks of the part still in it.
+
+        Args:
+            level (int): The level to read, 0 for the raw samples.
+            block_size (int): The number of samples per block of that level.
+            start (int): The first stream position to cover.
+            stop (int): The stream position after the last one to cover.
+
+        Returns:
+            tuple: (x, y_min, y_max) arrays, oldest first.
+        """
+        offset = self._total - len(self._x)
+        if level == 0:
+            y = self._y[start - offset:stop - offset]
+            return self._x[start - offset:stop - offset], y, y
+        first, last = start // block_size, -(-stop // block_size)
+        head = None
+        if first * block_size < offset:
+            first += 1
+            head = self._blocks(level - 1, block_size // self.factor, start, min(first * block_size, stop))
+        blocks = self._levels[level - 1]
+        arrays = tuple(array[first - blocks.first:max(first, last) - blocks.first] for array in blocks.arrays())
+        if head is None:
+            return arrays
+        return tuple(np.concatenate(pair) for pair in zip(head, arrays))
+
+
+class _BlockLevel:
+    """
+    One level of a MinMaxPyramid: a sliding window of (start time, min, max) blocks.
+
+    Blocks are kept in preallocated arrays that are compacted or grown when
+    appends reach their end, so appending and discarding are amortized O(1)
+    per block and the live blocks are always a contiguous slice.
+
+    Attributes:
+        first (int): The absolute block index of the oldest kept block.
+    """
+    def __init__(self):
+        """Initializes an empty _BlockLevel."""
+        self.first = 0
+        self._head = 0
+        self._tail = 0
+        self._data = np.empty((3, 0), dtype=np.float64)
+
+    def __len__(self):
+        """Returns the number of kept blocks."""
+        return self._tail - self._head
+
+    def arrays(self):
+        """Returns the kept blocks as (x, y_min, y_max) views, oldest first."""
+        x, y_min, y_max = self._data[:, self._head:self._tail]
+        return x, y_min, y_max
+
+    def write(self, first_block, x, y_min, y_max):
+        """
+        Overwrites the blocks from `first_block` on and appends any beyond the end.
+
+        Args:
+            first_block (int): The absolute index of the first block written.
+                               It must lie within or right after the kept blocks.
+            x (numpy.ndarray): The start times of the blocks.
+            y_min (numpy.ndarray): The minimums of the blocks.
+            y_max (numpy.ndarray): The maximums of the blocks.
+        """
+        if not len(self):
+            self.first = first_block
+        keep = first_block - self.first
+        needed = keep + len(x)
+        if self._head + needed > self._data.shape[1]:
+            data = self._data
+            if 2 * needed > data.shape[1]:
+                data = np.empty((3, max(16, 2 * needed)), dtype=np.float64)
+            data[:, :keep] = self._data[:, self._head:self._head + keep]
+            self._data, self._head = data, 0
+        position = self._head + keep
+        self._data[0, position:position + len(x)] = x
+        self._data[1, position:position + len(x)] = y_min
+        self._data[2, position:position + len(x)] = y_max
+        self._tail = position + len(x)
+
+    def discard_before(self, block):
+        """Drops the blocks whose absolute index is below `block`."""
+        count = min(max(0, block - self.first), len(self))
+        self._head += count
+        self.first += count
+
+
+def _reduce_blocks(first, x, y_min, y_max, start, block_size):
+    """
+    Aggregates consecutive elements into blocks aligned to absolute positions.
+
+    Args:
+        first (int): The absolute position of the first element.
+        x (numpy.ndarray): The element start times.
+        y_min (numpy.ndarray): The element minimums.
+        y_max (numpy.ndarray): The element maximums.
+        start (int): The absolute position to start at, a multiple of
+                     `block_size`. Elements before `first` are skipped, so the
+                     first block may be partial, as may the last one.
+        block_size (int): The number of elements per block.
+
+    Returns:
+        tuple: (x, y_min, y_max) arrays with one entry per block, reduced with
+               NaN-ignoring ufuncs.
+    """
+    local = max(start, first) - first
+    boundaries = np.arange(start, first + len(x), block_size) - first
+    boundaries[0] = local
+    return x[boundaries], np.fmin.reduceat(y_min[local:], boundaries - local), np.fmax.reduceat(y_max[local:], boundaries - local)
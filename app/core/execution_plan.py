@@ -0,0 +1,196 @@
+"""
+Precompiled Execution Plans for Sequences.
+
+This module turns the serialized sequence dictionaries produced by the
+SequenceEditor into immutable ExecutionPlan objects. A plan holds lookup
+tables (outgoing execution edges, incoming data edges, join arities and
+loop-body entry points) so the SequenceEngine can follow the graph with
+dictionary lookups instead of scanning the connection lists on every step.
+It also provides a small cache so plans are only rebuilt when a sequence is
+actually edited.
+"""
+import logging
+from types import MappingProxyType
+from app.core.expressions import expression_cache
+
+LOOP_NODE_TYPES = ("For Loop", "While Loop")
+
+
+class ExecutionPlan:
+    """
+    An immutable, precompiled view of a single sequence graph.
+
+    Attributes:
+        name (str): The name of the sequence this plan was compiled from.
+        source (dict): The serialized sequence data the plan was built from.
+        nodes (Mapping): Maps node UUIDs to their node data.
+        start_node (dict): The node execution starts from, or None.
+        outgoing (Mapping): Maps node UUIDs to a tuple of their outgoing
+                            execution connections, in serialized order.
+        data_inputs (Mapping): Maps node UUIDs to a tuple of their incoming
+                               data connections, in serialized order.
+        incoming_data (Mapping): Maps (end_node_uuid, end_socket_label) to the
+                                 first data connection feeding that socket.
+        join_arity (Mapping): Maps node UUIDs to the number of incoming
+                              execution connections.
+        loop_body_entries (Mapping): Maps loop node UUIDs to the
+                                     (node_uuid, connection) pair that starts
+                                     the loop body.
+        expression_errors (tuple): (description, message) pairs for Compute
+                                   node and connection expressions that do
+                                   not compile. Valid expressions are left
+                                   compiled in the shared expression cache.
+    """
+    def __init__(self, name, sequence_data, condition_evaluator=None):
+        """
+        Compiles an ExecutionPlan from serialized sequence data.
+
+        Args:
+            name (str): The name of the sequence.
+            sequence_data (dict): The serialized sequence ('nodes',
+                                  'exec_connections', 'data_connections').
+            condition_evaluator (callable, optional): A function taking
+                (connection_data, result) and returning a bool. It is used to
+                resolve loop-body entry points at compile time. When omitted,
+                only unconditioned and 'Loop Body' connections qualify.
+        """
+        self.name = name
+        self.source = sequence_data
+        evaluate = condition_evaluator or _default_loop_body_condition
+
+        nodes = {}
+        for node_data in sequence_data.get('nodes', []):
+            nodes[node_data['uuid']] = node_data
+
+        outgoing = {}
+        join_arity = {}
+        for conn in sequence_data.get('exec_connections', []):
+            outgoing.setdefault(conn['start_node_uuid'], []).append(conn)
+            end_uuid = conn['end_node_uuid']
+            join_arity[end_uuid] = join_arity.get(end_uuid, 0) + 1
+
+        data_inputs = {}
+        incoming_data = {}
+        for conn in sequence_data.get('data_connections', []):
+            end_uuid = conn['end_node_uuid']
+            data_inputs.setdefault(end_uuid, []).append(conn)
+            incoming_data.setdefault((end_uuid, conn.get('end_socket_label')), conn)
+
+        loop_body_entries = {}
+        for node_uuid, node_data in nodes.items():
+            if node_data.get('config', {}).get('node_type') not in LOOP_NODE_TYPES:
+                continue
+            for conn in outgoing.get(node_uuid, []):
+                if evaluate(conn, "Loop Body"):
+                    loop_body_entries[node_uuid] = (conn['end_node_uuid'], conn)
+                    break
+
+        expression_errors = []
+        for node_data in nodes.values():
+            config = node_data.get('config', {})
+            if config.get('node_type') == "Compute" and config.get('expression'):
+                error = expression_cache.validate(config['expression'])
+                if error:
+                    expression_errors.append((f"Compute node '{config.get('label', node_data['uuid'])}'", error))
+        for conn in sequence_data.get('exec_connections', []):
+            condition = conn.get('condition') or {}
+            if condition.get('type') == 'expression' and condition.get('expression'):
+                error = expression_cache.validate(condition['expression'])
+                if error:
+                    expression_errors.append(("Connection condition", error))
+
+        self.nodes = MappingProxyType(nodes)
+        self.outgoing = MappingProxyType({k: tuple(v) for k, v in outgoing.items()})
+        self.data_inputs = MappingProxyType({k: tuple(v) for k, v in data_inputs.items()})
+        self.incoming_data = MappingProxyType(incoming_data)
+        self.join_arity = MappingProxyType(join_arity)
+        self.loop_body_entries = MappingProxyType(loop_body_entries)
+        self.expression_errors = tuple(expression_errors)
+        self.start_node = next((n for uuid, n in nodes.items() if uuid not in join_arity), None)
+
+    def __setattr__(self, key, value):
+        if key in self.__dict__:
+            raise AttributeError(f"ExecutionPlan attribute '{key}' is read-only.")
+        super().__setattr__(key, value)
+
+    def get_node(self, node_uuid):
+        """Returns the node data for a UUID, or None if it is not part of the plan."""
+        return self.nodes.get(node_uuid)
+
+    def get_outgoing(self, node_uuid):
+        """Returns the outgoing execution connections of a node as a tuple."""
+        return self.outgoing.get(node_uuid, ())
+
+    def get_data_inputs(self, node_uuid):
+        """Returns the incoming data connections of a node as a tuple."""
+        return self.data_inputs.get(node_uuid, ())
+
+    def get_data_source(self, node_uuid, socket_label=None):
+        """
+        Finds the data connection feeding a node.
+
+        Args:
+            node_uuid (str): The UUID of the consuming node.
+            socket_label (str, optional): The input socket label. If None, the
+                                          first incoming data connection is used.
+
+        Returns:
+            dict or None: The data connection, or None if nothing is connected.
+        """
+        if socket_label is None:
+            inputs = self.data_inputs.get(node_uuid)
+            return inputs[0] if inputs else None
+        return self.incoming_data.get((node_uuid, socket_label))
+
+
+class ExecutionPlanCache:
+    """
+    Caches ExecutionPlans per sequence name.
+
+    A cached plan is reused as long as it was compiled from the very same
+    sequence dictionary and the sequence has not been invalidated. Editors
+    call `invalidate` whenever their scene changes, and hand out the same
+    dictionary for every run until their revision changes.
+    """
+    def __init__(self):
+        """Initializes an empty ExecutionPlanCache."""
+        self._plans = {}
+
+    def get(self, name, sequence_data, condition_evaluator=None):
+        """
+        Returns the plan for a sequence, compiling it if necessary.
+
+        Args:
+            name (str): The sequence name.
+            sequence_data (dict): The current serialized sequence data.
+            condition_evaluator (callable, optional): Passed to ExecutionPlan
+                                                      when a compile is needed.
+
+        Returns:
+            ExecutionPlan: The cached or freshly compiled plan.
+        """
+        plan = self._plans.get(name)
+        if plan is not None and plan.source is sequence_data:
+            return plan
+        logging.debug(f"Compiling execution plan for sequence '{name}'.")
+        plan = ExecutionPlan(name, sequence_data, condition_evaluator)
+        for description, error in plan.expression_errors:
+            logging.error(f"Invalid expression in sequence '{name}' ({description}): {error}")
+        self._plans[name] = plan
+        return plan
+
+    def invalidate(self, name):
+        """Drops the cached plan for a sequence, if any."""
+        self._plans.pop(name, None)
+
+    def clear(self):
+        """Drops all cached plans."""
+        self._plans.clear()
+
+
+def _default_loop_body_condition(connection_data, result):
+    """Matches connections that have no condition or an explicit 'Loop Body' operator."""
+    condition = connection_data.get('condition')
+    if not condition:
+        return True
+    return condition.get('operator') in ('No Condition', result)
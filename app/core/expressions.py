@@ -0,0 +1,176 @@
+"""
+Compiled Expression and Script Caches.
+
+Compute nodes and conditional connections evaluate short Python expressions,
+often on every iteration of a loop. This module compiles each distinct
+expression text once and keeps the resulting code object, so evaluation no
+longer re-parses the string. The same cache validates expressions when they
+are entered in a dialog or when a sequence plan is compiled, turning syntax
+errors into readable messages before a sequence runs.
+
+Python Script nodes get the same treatment per node: the ScriptCache keeps
+each node's compiled script together with the names it references, so the
+engine only has to expose (and write back) the global variables a script
+actually uses.
+"""
+import logging
+import threading
+import types
+from collections import OrderedDict
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be compiled."""
+
+
+class ExpressionCache:
+    """
+    A thread-safe, size-bounded cache of compiled expressions.
+
+    Attributes:
+        max_size (int): The maximum number of code objects kept.
+    """
+    def __init__(self, max_size=1024):
+        """
+        Initializes an empty ExpressionCache.
+
+        Args:
+            max_size (int, optional): The maximum number of code objects kept.
+        """
+        self.max_size = max_size
+        self._code = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compile(self, expression):
+        """
+        Returns the code object of an expression, compiling it on first use.
+
+        Args:
+            expression (str): The Python expression.
+
+        Returns:
+            code: The compiled expression, ready for `eval`.
+
+        Raises:
+            ExpressionError: If the expression is not valid Python.
+        """
+        with self._lock:
+            code = self._code.get(expression)
+            if code is not None:
+                self._code.move_to_end(expression)
+                return code
+        try:
+            code = compile(expression.strip(), "<expression>", "eval")
+        except SyntaxError as e:
+            raise ExpressionError(_describe_syntax_error(expression, e)) from None
+        with self._lock:
+            self._code[expression] = code
+            if len(self._code) > self.max_size:
+                self._code.popitem(last=False)
+        logging.debug(f"Compiled expression '{expression}'.")
+        return code
+
+    def validate(self, expression):
+        """
+        Checks that an expression compiles.
+
+        Args:
+            expression (str): The Python expression.
+
+        Returns:
+            str or None: A readable error message, or None if it is valid.
+        """
+        try:
+            self.compile(expression)
+            return None
+        except ExpressionError as e:
+            return str(e)
+
+    def clear(self):
+        """Drops all compiled expressions."""
+        with self._lock:
+            self._code.clear()
+
+
+def _describe_syntax_error(expression, error):
+    """Formats a SyntaxError with the column it occurred at."""
+    if error.offset:
+        return f"{error.msg} at column {error.offset} of '{expression}'"
+    return f"{error.msg} in '{expression}'"
+
+
+class CompiledScript:
+    """
+    A Python Script node's compiled code.
+
+    Attributes:
+        source (str): The script text the code was compiled from.
+        code (code): The compiled module-level code.
+        names (frozenset): Every global name the script (including functions
+                           and comprehensions defined in it) may load or store.
+    """
+    def __init__(self, source, code):
+        self.source = source
+        self.code = code
+        self.names = frozenset(_referenced_names(code))
+
+
+class ScriptCache:
+    """
+    Caches the compiled script of each Python Script node.
+
+    An entry is reused as long as the node's script text is unchanged; editors
+    also call `invalidate` when a script is edited.
+    """
+    def __init__(self):
+        """Initializes an empty ScriptCache."""
+        self._scripts = {}
+        self._lock = threading.Lock()
+
+    def get(self, node_uuid, source, label=None):
+        """
+        Returns the compiled script of a node, compiling it if needed.
+
+        Args:
+            node_uuid (str): The Python Script node's UUID.
+            source (str): The node's current script text.
+            label (str, optional): The node label, used in tracebacks.
+
+        Returns:
+            CompiledScript: The compiled script.
+
+        Raises:
+            SyntaxError: If the script does not compile.
+        """
+        with self._lock:
+            script = self._scripts.get(node_uuid)
+        if script is not None and script.source == source:
+            return script
+        script = CompiledScript(source, compile(source, f"<script {label or node_uuid}>", "exec"))
+        with self._lock:
+            self._scripts[node_uuid] = script
+        logging.debug(f"Compiled Python script of node '{label or node_uuid}'.")
+        return script
+
+    def invalidate(self, node_uuid):
+        """Drops the compiled script of a node, if any."""
+        with self._lock:
+            self._scripts.pop(node_uuid, None)
+
+    def clear(self):
+        """Drops all compiled scripts."""
+        with self._lock:
+            self._scripts.clear()
+
+
+def _referenced_names(code):
+    """Yields the global names used by a code object and all code nested in it."""
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _referenced_names(const)
+
+
+# The caches shared by the sequence engine and the configuration dialogs.
+expression_cache = ExpressionCache()
+script_cache = ScriptCache()
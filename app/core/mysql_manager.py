@@ -1,12 +1,123 @@
+import asyncio
+import datetime
+import itertools
 import logging
+import numbers
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import numpy as np
 import mysql.connector
 from mysql.connector import errorcode
 
+# Error codes meaning the cached schema of a table no longer matches the server.
+SCHEMA_ERROR_CODES = (errorcode.ER_NO_SUCH_TABLE, errorcode.ER_BAD_FIELD_ERROR)
+
+
+def infer_column_type(value):
+    """
+    Chooses a MySQL column type for a Python value.
+
+    The type is decided from the first value written to a new column, so all
+    numbers map to DOUBLE: a column first fed `0` or `1` must still hold later
+    readings such as `1.5` without rounding them.
+
+    Args:
+        value: A sample value that will be stored in the column.
+
+    Returns:
+        str: The column type definition. Values of unknown type (and None)
+             map to VARCHAR(255).
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return "TINYINT(1)"
+    if isinstance(value, numbers.Real):
+        return "DOUBLE"
+    if isinstance(value, datetime.datetime):
+        return "DATETIME(6)"
+    if isinstance(value, datetime.date):
+        return "DATE"
+    if isinstance(value, (bytes, bytearray)):
+        return "BLOB"
+    return "VARCHAR(255)"
+
+
+class TableSchemaCache:
+    """
+    A thread-safe cache of table column names, shared by pooled connections.
+
+    Entries are filled on the first lookup of a table, extended when columns
+    are added and dropped whenever a statement fails in a way that suggests
+    the table changed behind our back.
+    """
+    def __init__(self):
+        """Initializes an empty TableSchemaCache."""
+        self._lock = threading.Lock()
+        self._tables = {}
+
+    def get(self, table_name):
+        """Returns the cached column names of a table as a list, or None."""
+        with self._lock:
+            columns = self._tables.get(table_name)
+            return list(columns) if columns is not None else None
+
+    def set(self, table_name, columns):
+        """Stores the column names of a table."""
+        with self._lock:
+            self._tables[table_name] = list(columns)
+
+    def add_column(self, table_name, column_name):
+        """Records a new column on a cached table."""
+        with self._lock:
+            columns = self._tables.get(table_name)
+            if columns is not None and column_name not in columns:
+                columns.append(column_name)
+
+    def invalidate(self, table_name=None):
+        """Drops the cached schema of one table, or of all tables if None."""
+        with self._lock:
+            if table_name is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table_name, None)
+
+
+class QueryResult:
+    """
+    The outcome of a statement run with `MySQLManager.execute`.
+
+    Attributes:
+        columns (list[str] or None): The column names, or None if the statement
+                                     produced no result set.
+        rows (list[tuple]): The fetched rows; empty for statements without a result set.
+        row_count (int): The number of rows returned or affected.
+        last_insert_id (int or None): The AUTO_INCREMENT value of an INSERT.
+    """
+    def __init__(self, columns=None, rows=None, row_count=0, last_insert_id=None):
+        self.columns = columns
+        self.rows = rows if rows is not None else []
+        self.row_count = row_count
+        self.last_insert_id = last_insert_id
+
+    @property
+    def has_result_set(self):
+        """True if the statement returned rows (e.g. SELECT, SHOW)."""
+        return self.columns is not None
+
+
 class MySQLManager:
     """
     A class to manage MySQL database connections and operations.
+
+    Attributes:
+        schema_cache (TableSchemaCache): The cache used by `get_cached_table_columns`.
     """
-    def __init__(self, host, user, password, database=None):
+    # The number of prepared statements kept open per connection.
+    PREPARED_STATEMENT_CACHE_SIZE = 64
+
+    def __init__(self, host, user, password, database=None, schema_cache=None):
         """
         Initializes the MySQLManager.
 
@@ -15,6 +126,8 @@ class MySQLManager:
             user (str): The database user.
             password (str): The user's password.
             database (str, optional): The database name. Defaults to None.
+            schema_cache (TableSchemaCache, optional): A cache shared with other
+                connections to the same database. Defaults to a private cache.
         """
         self.host = host
         self.user = user
@@ -22,18 +135,28 @@ class MySQLManager:
         self.database = database
         self.connection = None
         self.cursor = None
+        self.schema_cache = schema_cache if schema_cache is not None else TableSchemaCache()
+        self._prepared = OrderedDict()
 
-    def connect(self):
+    def connect(self, connection_timeout=None):
         """
         Establishes a connection to the MySQL server and optionally to a database.
+
+        Args:
+            connection_timeout (float, optional): Seconds to wait for the server.
+                                                  Defaults to the connector's default.
         """
         logging.info(f"Attempting to connect to database '{self.database}'.")
+        options = {}
+        if connection_timeout is not None:
+            options['connection_timeout'] = max(1, int(connection_timeout))
         try:
             self.connection = mysql.connector.connect(
                 host=self.host,
                 user=self.user,
                 password=self.password,
-                database=self.database
+                database=self.database,
+                **options
             )
             self.cursor = self.connection.cursor()
             logging.info("Connection successful.")
@@ -52,8 +175,93 @@ class MySQLManager:
         Closes the database connection.
         """
         if self.connection and self.connection.is_connected():
+            self._close_prepared()
             self.cursor.close()
             self.connection.close()
+        self._prepared.clear()
+
+    def is_healthy(self):
+        """
+        Checks that the connection is still usable with a lightweight ping.
+
+        Returns:
+            bool: True if the server answered the ping.
+        """
+        if not self.connection:
+            return False
+        try:
+            self.connection.ping(reconnect=False)
+            return True
+        except mysql.connector.Error:
+            return False
+
+    def execute(self, query, params=None, prepare=False):
+        """
+        Executes a SQL statement and returns a typed result.
+
+        Whether rows are fetched is decided by the server's response, not by
+        the statement text. Statements without a result set are committed.
+
+        Args:
+            query (str): The SQL statement with %s placeholders.
+            params (tuple, optional): The statement parameters.
+            prepare (bool, optional): True to run it as a server-side prepared
+                statement, cached on this connection so repeated executions of
+                the same text skip parsing.
+
+        Returns:
+            QueryResult: The rows or the affected-row count.
+
+        Raises:
+            mysql.connector.Error: If the statement fails.
+        """
+        cursor = self._prepared_cursor(query) if prepare else self.cursor
+        try:
+            cursor.execute(query, params or ())
+            if cursor.description is not None:
+                columns = [column[0] for column in cursor.description]
+                rows = cursor.fetchall()
+                return QueryResult(columns, rows, len(rows))
+            self.connection.commit()
+            return QueryResult(row_count=cursor.rowcount, last_insert_id=cursor.lastrowid)
+        except mysql.connector.Error as err:
+            self._invalidate_schema_on_error(err)
+            if prepare:
+                self._drop_prepared(query)
+            raise
+
+    def _prepared_cursor(self, query):
+        """Returns the cached prepared-statement cursor for a query, creating it if needed."""
+        cursor = self._prepared.get(query)
+        if cursor is not None:
+            self._prepared.move_to_end(query)
+            return cursor
+        cursor = self.connection.cursor(prepared=True)
+        self._prepared[query] = cursor
+        if len(self._prepared) > self.PREPARED_STATEMENT_CACHE_SIZE:
+            _, evicted = self._prepared.popitem(last=False)
+            self._close_cursor(evicted)
+        return cursor
+
+    def _drop_prepared(self, query):
+        """Removes and closes the prepared statement of a query after an error."""
+        cursor = self._prepared.pop(query, None)
+        if cursor is not None:
+            self._close_cursor(cursor)
+
+    def _close_prepared(self):
+        """Closes all cached prepared statements."""
+        while self._prepared:
+            _, cursor = self._prepared.popitem()
+            self._close_cursor(cursor)
+
+    @staticmethod
+    def _close_cursor(cursor):
+        """Closes a cursor, ignoring errors from a broken connection."""
+        try:
+            cursor.close()
+        except mysql.connector.Error:
+            pass
 
     def execute_query(self, query, params=None):
         """
@@ -64,17 +272,49 @@ class MySQLManager:
             params (tuple, optional): The parameters to pass to the query. Defaults to None.
 
         Returns:
-            list: The result of the query, if any.
+            list: The rows of the query if it returned a result set, None
+                  otherwise, or an error string.
         """
         try:
-            self.cursor.execute(query, params or ())
-            if query.strip().upper().startswith("SELECT"):
-                return self.cursor.fetchall()
-            else:
-                self.connection.commit()
-                return None
+            result = self.execute(query, params)
         except mysql.connector.Error as err:
             return f"Error: {err}"
+        return result.rows if result.has_result_set else None
+
+    def execute_many(self, query, rows):
+        """
+        Executes a SQL statement once for each row and commits once.
+
+        For INSERT statements the connector rewrites this into a single
+        multi-row (extended) INSERT. A single row is run as a cached prepared
+        statement instead, which is cheaper for the small batches of slow
+        loops.
+
+        Args:
+            query (str): The SQL statement with %s placeholders.
+            rows (list[tuple]): One parameter tuple per row.
+
+        Returns:
+            int: The number of affected rows.
+
+        Raises:
+            mysql.connector.Error: If the statement fails.
+        """
+        if len(rows) == 1:
+            return self.execute(query, rows[0], prepare=True).row_count
+        try:
+            self.cursor.executemany(query, rows)
+            self.connection.commit()
+            return self.cursor.rowcount
+        except mysql.connector.Error as err:
+            self._invalidate_schema_on_error(err)
+            raise
+
+    def _invalidate_schema_on_error(self, err):
+        """Drops the schema cache if a statement failed on a missing table or column."""
+        if err.errno in SCHEMA_ERROR_CODES:
+            logging.info(f"Invalidating the MySQL schema cache after error: {err}")
+            self.schema_cache.invalidate()
 
     def create_database_if_not_exists(self):
         """
@@ -121,10 +361,45 @@ class MySQLManager:
             cursor.execute(f"SHOW COLUMNS FROM `{table_name}`")
             columns = [row[0] for row in cursor.fetchall()]
             cursor.close()
+            self.schema_cache.set(table_name, columns)
             return columns
         except mysql.connector.Error as err:
+            self.schema_cache.invalidate(table_name)
             return f"Error: {err}"
 
+    def get_cached_table_columns(self, table_name):
+        """
+        Returns the column names of a table, querying the server only on a cache miss.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            list: A list of column names, or an error string.
+        """
+        columns = self.schema_cache.get(table_name)
+        if columns is not None:
+            return columns
+        return self.get_table_columns(table_name)
+
+    def create_table_if_not_exists(self, table_name):
+        """
+        Creates a table with only an auto-increment 'id' primary key.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            tuple: (bool, str) with the success flag and a message.
+        """
+        result = self.execute_query(f"CREATE TABLE IF NOT EXISTS `{table_name}` (id INT AUTO_INCREMENT PRIMARY KEY)")
+        if isinstance(result, str) and result.startswith("Error:"):
+            self.schema_cache.invalidate(table_name)
+            return False, result
+        # The table may have existed already, so read its real columns once.
+        self.schema_cache.invalidate(table_name)
+        return True, f"Table '{table_name}' created or already exists."
+
     def get_all_tables(self):
         """
         Retrieves the names of all tables in the current database.
@@ -143,6 +418,79 @@ class MySQLManager:
         except mysql.connector.Error as err:
             return f"Error: {err}"
 
+    def ensure_columns(self, table_name, column_types):
+        """
+        Creates a table and adds missing columns so a row can be inserted.
+
+        The server is only queried when the schema cache does not know the
+        table or lacks one of the columns.
+
+        Args:
+            table_name (str): The name of the table.
+            column_types (dict): Maps the needed column names to the type used
+                                 when a column has to be added.
+
+        Raises:
+            ConnectionError: If the database could not be reached.
+            mysql.connector.Error: If the server refused to read or change the
+                                   schema (e.g. access denied, too many columns).
+        """
+        columns = self.schema_cache.get(table_name)
+        if columns is not None and all(column in columns for column in column_types):
+            return
+        if not self.connection or not self.connection.is_connected():
+            raise ConnectionError("Not connected to a database.")
+        try:
+            cursor = self.connection.cursor()
+            try:
+                if columns is None:
+                    columns = self._read_or_create_columns(cursor, table_name)
+                for column_name, column_type in column_types.items():
+                    if column_name in columns:
+                        continue
+                    logging.info(f"Column '{column_name}' not found in table '{table_name}'. Adding it as {column_type}.")
+                    try:
+                        cursor.execute(f"ALTER TABLE `{table_name}` ADD COLUMN `{column_name}` {column_type}")
+                    except mysql.connector.Error as err:
+                        # Another connection may have added it since the schema was cached.
+                        if err.errno != errorcode.ER_DUP_FIELDNAME:
+                            raise
+                    self.schema_cache.add_column(table_name, column_name)
+                    columns.append(column_name)
+            finally:
+                cursor.close()
+        except (mysql.connector.InterfaceError, mysql.connector.OperationalError) as err:
+            self.schema_cache.invalidate(table_name)
+            raise ConnectionError(f"Failed to prepare table '{table_name}': {err}") from err
+        except mysql.connector.Error:
+            self.schema_cache.invalidate(table_name)
+            raise
+
+    def _read_or_create_columns(self, cursor, table_name):
+        """
+        Reads a table's columns into the schema cache, creating the table if it is missing.
+
+        Args:
+            cursor (MySQLCursor): The cursor to use.
+            table_name (str): The name of the table.
+
+        Returns:
+            list: The column names.
+
+        Raises:
+            mysql.connector.Error: If the table could not be read or created.
+        """
+        try:
+            cursor.execute(f"SHOW COLUMNS FROM `{table_name}`")
+        except mysql.connector.Error as err:
+            if err.errno != errorcode.ER_NO_SUCH_TABLE:
+                raise
+            cursor.execute(f"CREATE TABLE IF NOT EXISTS `{table_name}` (id INT AUTO_INCREMENT PRIMARY KEY)")
+            cursor.execute(f"SHOW COLUMNS FROM `{table_name}`")
+        columns = [row[0] for row in cursor.fetchall()]
+        self.schema_cache.set(table_name, columns)
+        return columns
+
     def add_column_to_table(self, table_name, column_name, column_type="VARCHAR(255)"):
         """
         Adds a new column to a specified table if it doesn't exist.
@@ -156,21 +504,882 @@ class MySQLManager:
             return False, "Error: Not connected to a database."
         try:
             # Check if column exists
-            columns = self.get_table_columns(table_name)
+            columns = self.get_cached_table_columns(table_name)
             if isinstance(columns, str) and columns.startswith("Error:"):
                 # Table might not exist, let's try to create it.
-                # A simple CREATE TABLE for now. A more robust solution might be needed.
-                self.execute_query(f"CREATE TABLE IF NOT EXISTS `{table_name}` (id INT AUTO_INCREMENT PRIMARY KEY)")
+                self.create_table_if_not_exists(table_name)
+                columns = self.get_cached_table_columns(table_name)
+                if isinstance(columns, str):
+                    return False, f"Error adding column: {columns}"
 
-            # Re-check columns after potential table creation
-            columns = self.get_table_columns(table_name)
             if column_name not in columns:
                 cursor = self.connection.cursor()
                 cursor.execute(f"ALTER TABLE `{table_name}` ADD COLUMN `{column_name}` {column_type}")
                 cursor.close()
                 self.connection.commit()
+                self.schema_cache.add_column(table_name, column_name)
                 return True, f"Column '{column_name}' added to table '{table_name}'."
             else:
                 return True, f"Column '{column_name}' already exists in table '{table_name}'."
         except mysql.connector.Error as err:
-            return False, f"Error adding column: {err}"
\ No newline at end of file
+            self.schema_cache.invalidate(table_name)
+            if err.errno == errorcode.ER_DUP_FIELDNAME:
+                # Another connection added it since the schema was cached.
+                return True, f"Column '{column_name}' already exists in table '{table_name}'."
+            return False, f"Error adding column: {err}"
+
+class MySQLConnectionPool:
+    """
+    A thread-safe pool of persistent MySQLManager connections.
+
+    Connections are opened on demand up to `max_size`, handed out with
+    `acquire` (or the `connection` context manager) and kept open for reuse
+    after `release`. Idle connections are pinged before reuse when they have
+    not been used for `health_check_interval` seconds; dead ones are replaced.
+
+    Attributes:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The user's password.
+        database (str): The database name.
+        max_size (int): The maximum number of open connections.
+        health_check_interval (float): Idle seconds after which a connection is
+                                       pinged before being reused.
+        schema_cache (TableSchemaCache): The table schemas shared by all pooled
+                                         connections.
+    """
+    def __init__(self, host=None, user=None, password=None, database=None, max_size=4, health_check_interval=30.0):
+        """
+        Initializes the MySQLConnectionPool. No connection is opened until one is needed.
+
+        Args:
+            host (str, optional): The database host.
+            user (str, optional): The database user.
+            password (str, optional): The user's password.
+            database (str, optional): The database name.
+            max_size (int, optional): The maximum number of open connections.
+            health_check_interval (float, optional): Idle seconds before a ping.
+        """
+        self._lock = threading.Condition()
+        self._idle = []
+        self._in_use = 0
+        self._generation = 0
+        self.health_check_interval = health_check_interval
+        self.schema_cache = TableSchemaCache()
+        self.configure(host, user, password, database, max_size)
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Creates a pool from the application's QSettings.
+
+        Args:
+            settings (QSettings): The settings holding the 'mysql/*' keys.
+
+        Returns:
+            MySQLConnectionPool: The configured pool.
+        """
+        pool = cls()
+        pool.configure_from_settings(settings)
+        return pool
+
+    def configure_from_settings(self, settings):
+        """
+        Reconfigures the pool from the application's QSettings.
+
+        Args:
+            settings (QSettings): The settings holding the 'mysql/*' keys.
+        """
+        self.configure(settings.value("mysql/host", ""), settings.value("mysql/user", ""),
+                       settings.value("mysql/password", ""), settings.value("mysql/database", ""),
+                       settings.value("mysql/pool_size", 4, type=int))
+
+    def configure(self, host, user, password, database, max_size=4):
+        """
+        Sets the connection parameters. Idle connections made with the old
+        parameters are closed; connections in use are closed when released.
+
+        Args:
+            host (str): The database host.
+            user (str): The database user.
+            password (str): The user's password.
+            database (str): The database name.
+            max_size (int, optional): The maximum number of open connections.
+        """
+        with self._lock:
+            self.host, self.user, self.password, self.database = host, user, password, database
+            self.max_size = max(1, int(max_size))
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self._lock.notify_all()
+        self.schema_cache.invalidate()
+        for manager, _ in idle:
+            manager.close()
+
+    @property
+    def is_configured(self):
+        """True if host, user and database are set."""
+        return all([self.host, self.user, self.database])
+
+    def acquire(self, timeout=10.0, connection_timeout=None):
+        """
+        Takes a connection from the pool, opening a new one if allowed.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free connection
+                                       when the pool is exhausted.
+            connection_timeout (float, optional): Seconds to wait for the server
+                                                  when a new connection is opened.
+
+        Returns:
+            MySQLManager: A connected manager. Return it with `release`.
+
+        Raises:
+            ConnectionError: If the pool is not configured, no connection became
+                             free in time, or a new connection failed.
+        """
+        if not self.is_configured:
+            raise ConnectionError("MySQL connection details are not configured in settings.")
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            while not self._idle and self._in_use >= self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionError(f"Timed out waiting for a free MySQL connection (pool size {self.max_size}).")
+                self._lock.wait(remaining)
+            entry = self._idle.pop() if self._idle else None
+            self._in_use += 1
+            generation = self._generation
+
+        try:
+            if entry is not None:
+                manager, last_used = entry
+                if time.monotonic() - last_used < self.health_check_interval or manager.is_healthy():
+                    manager._pool_generation = generation
+                    return manager
+                logging.info("Discarding a dead pooled MySQL connection.")
+                manager.close()
+            manager = MySQLManager(self.host, self.user, self.password, self.database, self.schema_cache)
+            success, message = manager.connect(connection_timeout)
+            if not success:
+                raise ConnectionError(f"MySQL connection failed: {message}")
+            manager._pool_generation = generation
+            return manager
+        except Exception:
+            with self._lock:
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+
+    def release(self, manager, discard=False):
+        """
+        Returns a connection to the pool.
+
+        Args:
+            manager (MySQLManager): The manager obtained from `acquire`.
+            discard (bool, optional): True to close the connection instead of
+                                      reusing it, e.g. after a connection error.
+        """
+        with self._lock:
+            self._in_use -= 1
+            keep = not discard and getattr(manager, '_pool_generation', None) == self._generation
+            if keep:
+                self._idle.append((manager, time.monotonic()))
+            self._lock.notify()
+        if not keep:
+            manager.close()
+
+    @contextmanager
+    def connection(self, timeout=10.0, connection_timeout=None):
+        """
+        Context manager yielding a pooled connection.
+
+        The connection is discarded instead of reused if the block raises a
+        MySQL or connection error.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free connection.
+            connection_timeout (float, optional): Seconds to wait for the server
+                                                  when a new connection is opened.
+
+        Yields:
+            MySQLManager: A connected manager.
+        """
+        manager = self.acquire(timeout, connection_timeout)
+        try:
+            yield manager
+        except (mysql.connector.Error, ConnectionError):
+            self.release(manager, discard=True)
+            raise
+        except BaseException:
+            self.release(manager)
+            raise
+        else:
+            self.release(manager)
+
+    def kill_query(self, manager):
+        """
+        Aborts the statement currently running on a connection.
+
+        A separate, unpooled connection issues `KILL QUERY`, so this works even
+        when the pool is exhausted.
+
+        Args:
+            manager (MySQLManager): The busy connection.
+        """
+        connection = manager.connection
+        if connection is None:
+            return
+        killer = MySQLManager(self.host, self.user, self.password, self.database)
+        success, message = killer.connect()
+        if not success:
+            logging.error(f"Could not connect to cancel a MySQL query: {message}")
+            return
+        try:
+            result = killer.execute_query(f"KILL QUERY {int(connection.connection_id)}")
+            if isinstance(result, str):
+                logging.warning(f"Failed to cancel MySQL query: {result}")
+        finally:
+            killer.close()
+
+    def close_all(self):
+        """Closes all idle connections. Connections in use are closed on release."""
+        with self._lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+        for manager, _ in idle:
+            manager.close()
+
+
+# Outcomes of writing one buffered batch.
+_BATCH_WRITTEN, _BATCH_RETRY, _BATCH_REJECTED = "written", "retry", "rejected"
+
+
+class FlushResult:
+    """
+    The outcome of a `MySQLWriteBuffer.flush`, in rows.
+
+    Attributes:
+        written (int): Rows written to the database.
+        spooled (int): Rows moved to the spool, to be replayed later.
+        retried (int): Rows kept in memory to be retried (no spool attached).
+        rejected (int): Rows the server refused; they are dropped.
+        abandoned (int): Rows dropped at shutdown because neither the database
+                         nor the spool could take them.
+    """
+    def __init__(self):
+        self.written = 0
+        self.spooled = 0
+        self.retried = 0
+        self.rejected = 0
+        self.abandoned = 0
+
+    @property
+    def all_written(self):
+        """True if every attempted row was written or safely spooled."""
+        return not (self.retried or self.rejected or self.abandoned)
+
+
+class MySQLWriteBuffer:
+    """
+    A write-behind buffer that batches rows into bulk INSERTs.
+
+    Rows are grouped by their INSERT statement, which identifies the table,
+    the column set and the INSERT/UPSERT form. A group is written with a single
+    `executemany` when it reaches `max_rows` or when its oldest row has waited
+    `max_delay` seconds. Writes happen on a background thread, so `enqueue`
+    returns immediately.
+
+    When the database cannot be reached, failed batches are moved to the
+    attached MySQLSpool and replayed in order by the same thread once it is
+    back; while the spool holds a backlog, newer batches queue behind it.
+    Without a spool, failed rows are kept in memory and retried, up to
+    `max_buffered_rows` in total. Batches the server rejects (e.g. bad data)
+    are dropped with an error, since retrying them cannot succeed.
+
+    Attributes:
+        pool (MySQLConnectionPool): The pool providing connections for flushes.
+        max_rows (int): The group size that triggers an immediate flush.
+        max_delay (float): The maximum seconds a row waits before being flushed.
+        max_buffered_rows (int): The maximum number of rows held in memory.
+        spool (MySQLSpool): The durable fallback for outages, or None.
+        retry_interval (float): Seconds between attempts to drain the spool.
+    """
+    def __init__(self, pool, max_rows=500, max_delay=1.0, max_buffered_rows=100000, spool=None, retry_interval=5.0):
+        """
+        Initializes the MySQLWriteBuffer and starts its flusher thread.
+
+        Args:
+            pool (MySQLConnectionPool): The pool providing connections for flushes.
+            max_rows (int, optional): The group size that triggers a flush.
+            max_delay (float, optional): The maximum seconds a row waits.
+            max_buffered_rows (int, optional): The maximum number of rows held.
+            spool (MySQLSpool, optional): The durable fallback for outages.
+            retry_interval (float, optional): Seconds between drain attempts.
+        """
+        self.pool = pool
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.max_buffered_rows = max_buffered_rows
+        self.spool = spool
+        self.retry_interval = retry_interval
+        self._next_drain = 0.0
+        self._groups = {}
+        self._buffered = 0
+        # Rows are stored as (sequence number, row) to find the globally oldest one.
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="MySQLWriteBuffer", daemon=True)
+        self._thread.start()
+
+    @property
+    def is_spooling(self):
+        """True while batches wait in the spool, i.e. after MySQL became unreachable."""
+        spool = self.spool
+        return spool is not None and len(spool) > 0
+
+    def set_spool(self, spool):
+        """
+        Switches to another spool, e.g. when a different project is opened.
+
+        The previous spool is closed; its unsent batches stay on disk and are
+        replayed when it is attached again.
+
+        Args:
+            spool (MySQLSpool): The new spool, or None to disable spooling.
+        """
+        with self._flush_lock:
+            old_spool, self.spool = self.spool, spool
+            self._next_drain = 0.0
+        if old_spool is not None and old_spool is not spool:
+            old_spool.close()
+        self._wakeup.set()
+
+    def enqueue(self, query, row, schema=None):
+        """
+        Buffers one row for the given INSERT statement.
+
+        Args:
+            query (str): The INSERT statement with %s placeholders.
+            row (tuple): The row's parameter values.
+            schema (tuple, optional): (table_name, {column: column_type}) the
+                statement needs. Missing columns are created before writing,
+                which matters for rows spooled before the table was checked.
+        """
+        with self._lock:
+            group = self._groups.get(query)
+            if group is None:
+                group = self._groups[query] = {'rows': deque(), 'since': time.monotonic(), 'schema': schema}
+            elif not group['rows']:
+                group['since'] = time.monotonic()
+            if schema is not None:
+                group['schema'] = schema
+            group['rows'].append((next(self._sequence), row))
+            self._buffered += 1
+            if self._buffered > self.max_buffered_rows:
+                self._drop_oldest_row()
+            full = len(group['rows']) >= self.max_rows
+        if full:
+            self._wakeup.set()
+
+    def _drop_oldest_row(self):
+        """Drops the oldest buffered row of any group to stay within `max_buffered_rows`."""
+        oldest = min((group['rows'] for group in self._groups.values() if group['rows']),
+                     key=lambda rows: rows[0][0], default=None)
+        if oldest is None:
+            return
+        oldest.popleft()
+        self._buffered -= 1
+        logging.error(f"MySQL write buffer is full ({self.max_buffered_rows} rows). Dropping the oldest row.")
+
+    def request_flush(self):
+        """Asks the flusher thread to write all buffered rows as soon as possible."""
+        with self._lock:
+            for group in self._groups.values():
+                group['since'] = 0.0
+        self._wakeup.set()
+
+    def flush(self, due_only=False, final=False, timeout=None):
+        """
+        Writes buffered rows to the database (or the spool), blocking until done.
+
+        Args:
+            due_only (bool, optional): If True, only groups that are full or
+                                       have waited `max_delay` are written.
+            final (bool, optional): If True, no write is attempted after the
+                                    first one fails because the database is
+                                    unreachable; the remaining rows are spooled
+                                    or, without a spool, abandoned.
+            timeout (float, optional): Seconds each write may wait for a pooled
+                                       connection and for the server. Defaults
+                                       to the pool's defaults.
+
+        Returns:
+            FlushResult: How many rows were written, spooled, kept for a retry,
+                         rejected by the server or abandoned.
+        """
+        with self._flush_lock:
+            batches = self._take_batches(due_only)
+            result = FlushResult()
+            unreachable = False
+            for query, entries, schema in batches:
+                if final and (unreachable or self.is_spooling):
+                    self._count_set_aside(result, len(entries), self._set_aside(query, entries, schema))
+                    continue
+                if self.is_spooling:
+                    # Keep the write order: newer rows queue behind the backlog.
+                    self._count_spooled(result, len(entries), self._spool_batch(query, entries, schema))
+                    continue
+                status = self._write_batch(query, [row for _, row in entries], schema, timeout)
+                if status == _BATCH_WRITTEN:
+                    result.written += len(entries)
+                elif status == _BATCH_RETRY and final:
+                    unreachable = True
+                    self._count_set_aside(result, len(entries), self._set_aside(query, entries, schema))
+                elif status == _BATCH_RETRY:
+                    if self.spool is not None:
+                        logging.warning(f"MySQL is unavailable. Spooling writes to '{self.spool.path}' until it is back.")
+                        self._next_drain = time.monotonic() + self.retry_interval
+                    self._count_spooled(result, len(entries), self._spool_batch(query, entries, schema))
+                else:
+                    result.rejected += len(entries)
+            return result
+
+    @staticmethod
+    def _count_spooled(result, rows, spooled):
+        """Records a batch handed to `_spool_batch`, which requeues what it cannot spool."""
+        if spooled:
+            result.spooled += rows
+        else:
+            result.retried += rows
+
+    @staticmethod
+    def _count_set_aside(result, rows, spooled):
+        """Records a batch handed to `_set_aside`, which abandons what it cannot spool."""
+        if spooled:
+            result.spooled += rows
+        else:
+            result.abandoned += rows
+
+    def _take_batches(self, due_only=False):
+        """
+        Removes the groups to write from the buffer.
+
+        Args:
+            due_only (bool, optional): If True, only full or overdue groups are taken.
+
+        Returns:
+            list: (query, entries, schema) tuples.
+        """
+        now = time.monotonic()
+        with self._lock:
+            batches = []
+            for query, group in self._groups.items():
+                entries = group['rows']
+                if entries and (not due_only or len(entries) >= self.max_rows or now - group['since'] >= self.max_delay):
+                    batches.append((query, entries, group['schema']))
+                    group['rows'] = deque()
+                    self._buffered -= len(entries)
+            return batches
+
+    def _set_aside(self, query, entries, schema):
+        """
+        Spools a batch without trying the database, or abandons it without a spool.
+
+        Returns:
+            bool: True if the batch was spooled.
+        """
+        if self.spool is not None:
+            try:
+                self.spool.append(query, [row for _, row in entries], schema)
+                return True
+            except Exception as e:
+                logging.error(f"Failed to spool {len(entries)} MySQL rows: {e}")
+        logging.error(f"MySQL is unreachable at shutdown. Abandoning {len(entries)} buffered rows: {query}")
+        return False
+
+    def _write_batch(self, query, rows, schema=None, timeout=None):
+        """
+        Writes one batch with a single executemany.
+
+        Args:
+            query (str): The INSERT statement.
+            rows (list[tuple]): The rows to write.
+            schema (tuple, optional): (table_name, {column: column_type}) to ensure first.
+            timeout (float, optional): Seconds to wait for a pooled connection
+                                       and for the server, or None for the
+                                       pool's defaults.
+
+        Returns:
+            str: _BATCH_WRITTEN, _BATCH_RETRY if the database was unreachable,
+                 or _BATCH_REJECTED if the server refused the batch.
+        """
+        try:
+            connection = self.pool.connection() if timeout is None else self.pool.connection(timeout, timeout)
+            with connection as manager:
+                if schema is not None:
+                    manager.ensure_columns(*schema)
+                manager.execute_many(query, rows)
+            logging.debug(f"Flushed {len(rows)} buffered rows: {query}")
+            return _BATCH_WRITTEN
+        except (ConnectionError, TimeoutError, mysql.connector.InterfaceError, mysql.connector.OperationalError) as e:
+            logging.error(f"Failed to flush {len(rows)} buffered MySQL rows: {e}")
+            return _BATCH_RETRY
+        except mysql.connector.Error as e:
+            logging.error(f"MySQL rejected {len(rows)} buffered rows, dropping them: {e}")
+            return _BATCH_REJECTED
+
+    def _spool_batch(self, query, entries, schema):
+        """
+        Moves a batch that could not be written to the spool, or back into memory.
+
+        Args:
+            query (str): The INSERT statement.
+            entries (deque): The batch's (sequence number, row) entries.
+            schema (tuple): (table_name, {column: column_type}) or None.
+
+        Returns:
+            bool: True if the batch was stored durably.
+        """
+        if self.spool is not None:
+            try:
+                self.spool.append(query, [row for _, row in entries], schema)
+                return True
+            except Exception as e:
+                logging.error(f"Failed to spool {len(entries)} MySQL rows: {e}")
+        self._requeue(query, entries, schema)
+        return False
+
+    def _requeue(self, query, entries, schema):
+        """Puts the entries of a failed batch back in front of newer rows."""
+        with self._lock:
+            group = self._groups.setdefault(query, {'rows': deque(), 'since': time.monotonic(), 'schema': schema})
+            entries.extend(group['rows'])
+            group['rows'] = entries
+            self._buffered += len(entries)
+            while self._buffered > self.max_buffered_rows:
+                self._drop_oldest_row()
+
+    def _drain_spool(self):
+        """Replays spooled batches oldest first until the spool is empty or a write fails."""
+        with self._flush_lock:
+            spool, replayed = self.spool, 0
+            while spool is not None and len(spool) and not self._closed:
+                batch_id, query, rows, schema = spool.peek()
+                status = self._write_batch(query, rows, schema)
+                if status == _BATCH_RETRY:
+                    self._next_drain = time.monotonic() + self.retry_interval
+                    break
+                spool.remove(batch_id)
+                replayed += 1
+            if replayed and not len(spool):
+                logging.info(f"MySQL is reachable again. Replayed {replayed} spooled batches.")
+
+    def pending_rows(self):
+        """Returns the number of rows waiting in memory to be written."""
+        with self._lock:
+            return self._buffered
+
+    def _run(self):
+        """The flusher thread: writes due groups and drains the spool until closed."""
+        while not self._closed:
+            self._wakeup.wait(self.max_delay / 2)
+            self._wakeup.clear()
+            if self._closed:
+                break
+            try:
+                self.flush(due_only=True)
+                if self.is_spooling and time.monotonic() >= self._next_drain:
+                    self._drain_spool()
+            except Exception as e:
+                logging.error(f"MySQL write buffer flush failed: {e}")
+
+    def close(self, timeout=5.0):
+        """
+        Stops the flusher thread, writes (or spools) all remaining rows and closes the spool.
+
+        This blocks, so GUI code should call it off the event loop thread (e.g.
+        with `asyncio.to_thread`). Each wait is bounded by `timeout`: joining
+        the flusher thread, and getting a connection for the final write. Once
+        a write finds the database unreachable, the remaining rows are spooled
+        (or abandoned without a spool) instead of being attempted one group at
+        a time, and if the flusher thread is still stuck in a write, no write
+        is attempted at all.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the flusher thread
+                                       and for each connection attempt.
+        """
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout=timeout)
+        if not self._thread.is_alive() and self._flush_lock.acquire(timeout=timeout):
+            self._flush_lock.release()
+            self.flush(final=True, timeout=timeout)
+        else:
+            logging.warning("MySQL write buffer is still busy writing. Setting the remaining rows aside.")
+            for query, entries, schema in self._take_batches():
+                self._set_aside(query, entries, schema)
+        if self.spool is not None:
+            self.spool.close()
+
+
+class MySQLTaskRunner:
+    """
+    Runs blocking MySQL work on a bounded thread pool for asyncio callers.
+
+    `run` hands a function a pooled connection on a worker thread and awaits
+    the result, so the event loop (and with it the UI and OPC-UA callbacks)
+    keeps running while the server is slow. At most `max_concurrency`
+    operations run at once; further calls wait for a free worker. When an
+    operation times out or its awaiting task is cancelled, the running
+    statement is killed on the server and the connection is discarded.
+
+    Attributes:
+        pool (MySQLConnectionPool): The pool providing connections.
+        max_concurrency (int): The number of worker threads.
+        query_timeout (float): The default timeout in seconds; 0 disables it.
+    """
+    def __init__(self, pool, max_concurrency=4, query_timeout=30.0):
+        """
+        Initializes the MySQLTaskRunner.
+
+        Args:
+            pool (MySQLConnectionPool): The pool providing connections.
+            max_concurrency (int, optional): The number of worker threads.
+            query_timeout (float, optional): The default timeout in seconds.
+        """
+        self.pool = pool
+        self.query_timeout = query_timeout
+        self.max_concurrency = 0
+        self._executor = None
+        self.set_max_concurrency(max_concurrency)
+
+    @classmethod
+    def from_settings(cls, pool, settings):
+        """
+        Creates a runner from the application's QSettings.
+
+        Args:
+            pool (MySQLConnectionPool): The pool providing connections.
+            settings (QSettings): The settings holding the 'mysql/*' keys.
+
+        Returns:
+            MySQLTaskRunner: The configured runner.
+        """
+        runner = cls(pool)
+        runner.configure_from_settings(settings)
+        return runner
+
+    def configure_from_settings(self, settings):
+        """
+        Applies the concurrency (pool size) and query timeout settings.
+
+        Args:
+            settings (QSettings): The settings holding the 'mysql/*' keys.
+        """
+        self.query_timeout = settings.value("mysql/query_timeout", 30, type=int)
+        self.set_max_concurrency(settings.value("mysql/pool_size", 4, type=int))
+
+    def set_max_concurrency(self, max_concurrency):
+        """
+        Changes the number of worker threads. Running operations are not affected.
+
+        Args:
+            max_concurrency (int): The new number of workers. Clamped to at least 1.
+        """
+        max_concurrency = max(1, int(max_concurrency))
+        if max_concurrency == self.max_concurrency:
+            return
+        old_executor = self._executor
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="MySQL")
+        if old_executor is not None:
+            old_executor.shutdown(wait=False)
+
+    async def run(self, func, timeout=None):
+        """
+        Runs `func(manager)` with a pooled connection on a worker thread.
+
+        Args:
+            func (callable): Called with a MySQLManager; its return value is returned.
+            timeout (float, optional): Seconds before the operation is aborted.
+                                       Defaults to `query_timeout`.
+
+        Returns:
+            The return value of `func`.
+
+        Raises:
+            TimeoutError: If the operation did not finish in time.
+            asyncio.CancelledError: If the awaiting task was cancelled.
+        """
+        state = {'manager': None, 'cancelled': False}
+        return await self._submit(state, timeout, self._call, func, state)
+
+    async def open_stream(self, query, params=None, timeout=None):
+        """
+        Executes a query whose rows are fetched incrementally.
+
+        The rows stay on the server until they are fetched, so memory use is
+        bounded by the chunk size rather than by the size of the result. The
+        stream holds its pooled connection until it is closed.
+
+        Args:
+            query (str): The SELECT statement.
+            params (tuple, optional): The query parameters.
+            timeout (float, optional): Seconds allowed for executing the query
+                                       and for each fetch. Defaults to `query_timeout`.
+
+        Returns:
+            MySQLRowStream: The open stream. Close it with `close`.
+        """
+        state = {'manager': None, 'cancelled': False}
+
+        def execute():
+            manager = self.pool.acquire()
+            state['manager'] = manager
+            try:
+                # An unbuffered cursor leaves the result set on the server until fetched.
+                cursor = manager.connection.cursor(buffered=False)
+                cursor.execute(query, params or ())
+            except BaseException:
+                state['manager'] = None
+                self.pool.release(manager, discard=True)
+                raise
+            stream = MySQLRowStream(self, manager, cursor, state, timeout)
+            if state['cancelled']:
+                stream._close()
+            return stream
+
+        return await self._submit(state, timeout, execute)
+
+    async def _submit(self, state, timeout, func, *args):
+        """
+        Runs a function on a worker thread, enforcing the timeout.
+
+        Args:
+            state (dict): The operation's 'manager'/'cancelled' state, used to
+                          kill the running statement on timeout or cancellation.
+            timeout (float): Seconds allowed, None for `query_timeout`, 0 for none.
+            func (callable): The blocking function.
+            *args: Arguments for `func`.
+
+        Returns:
+            The return value of `func`.
+        """
+        timeout = self.query_timeout if timeout is None else timeout
+        future = asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        try:
+            return await asyncio.wait_for(future, timeout or None)
+        except asyncio.TimeoutError:
+            self._cancel(state)
+            raise TimeoutError(f"MySQL operation timed out after {timeout} s.")
+        except asyncio.CancelledError:
+            self._cancel(state)
+            raise
+
+    def _call(self, func, state):
+        """Worker-thread body of `run`: acquires a connection and calls `func`."""
+        if state['cancelled']:
+            return None
+        manager = self.pool.acquire()
+        state['manager'] = manager
+        discard = False
+        try:
+            return func(manager)
+        except (mysql.connector.Error, ConnectionError):
+            discard = True
+            raise
+        finally:
+            state['manager'] = None
+            self.pool.release(manager, discard=discard or state['cancelled'])
+
+    def _cancel(self, state):
+        """Marks an operation as cancelled and kills its statement if it is running."""
+        state['cancelled'] = True
+        manager = state['manager']
+        if manager is not None:
+            threading.Thread(target=self.pool.kill_query, args=(manager,), name="MySQLKillQuery", daemon=True).start()
+
+    def shutdown(self):
+        """Stops accepting work. Operations already running finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class MySQLRowStream:
+    """
+    An open result set whose rows are fetched in chunks on the runner's threads.
+
+    Attributes:
+        columns (list[str]): The column names of the result.
+        exhausted (bool): True once every row has been fetched.
+    """
+    def __init__(self, runner, manager, cursor, state, timeout=None):
+        """
+        Initializes a MySQLRowStream. Use `MySQLTaskRunner.open_stream` instead.
+
+        Args:
+            runner (MySQLTaskRunner): The runner executing fetches.
+            manager (MySQLManager): The pooled connection owning the result.
+            cursor: The unbuffered cursor holding the result set.
+            state (dict): The runner's cancellation state of this stream.
+            timeout (float, optional): Seconds allowed for each fetch.
+        """
+        self.runner = runner
+        self.manager = manager
+        self.cursor = cursor
+        self.columns = [column[0] for column in cursor.description or ()]
+        self.exhausted = False
+        self._state = state
+        self._timeout = timeout
+        self._closed = False
+
+    @property
+    def closed(self):
+        """True once the stream has released its connection."""
+        return self._closed
+
+    async def fetch(self, size):
+        """
+        Fetches the next chunk of rows. The stream closes itself when exhausted.
+
+        Args:
+            size (int): The maximum number of rows to fetch.
+
+        Returns:
+            list[tuple]: The rows; an empty list once the result is exhausted.
+        """
+        if self._closed:
+            return []
+        try:
+            rows = await self.runner._submit(self._state, self._timeout, self.cursor.fetchmany, size)
+        except BaseException:
+            await self.close()
+            raise
+        if not rows:
+            self.exhausted = True
+            await self.close()
+        return rows
+
+    async def close(self):
+        """Releases the connection. An unfinished result discards the connection."""
+        if not self._closed:
+            await asyncio.get_running_loop().run_in_executor(None, self._close)
+
+    def _close(self):
+        """Blocking part of `close`."""
+        if self._closed:
+            return
+        self._closed = True
+        discard = not self.exhausted or self._state['cancelled']
+        try:
+            if not discard:
+                self.cursor.close()
+        except mysql.connector.Error:
+            discard = True
+        finally:
+            self._state['manager'] = None
+            self.runner.pool.release(self.manager, discard=discard)
@@ -0,0 +1,149 @@
+"""
+Durable Local Spool for MySQL Writes.
+
+This module provides the MySQLSpool class, an append-only queue of INSERT
+batches stored in a local SQLite file. The MySQLWriteBuffer moves batches
+into the spool when the database cannot be reached, and replays them in
+insertion order once it is back, so logged data survives MySQL outages and
+application restarts.
+
+Row values are stored as JSON. Types JSON cannot represent (datetimes,
+dates, times, decimals and bytes) are tagged so they round-trip exactly.
+"""
+import base64
+import datetime
+import decimal
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+
+class MySQLSpool:
+    """
+    An append-only, SQLite-backed queue of pending INSERT batches.
+
+    Each entry holds the INSERT statement, the rows and the column types the
+    target table needs, so the table can be created or extended before a
+    batch is replayed. Entries are read and removed strictly oldest first.
+
+    Attributes:
+        path (str): The SQLite file the spool is stored in.
+    """
+    def __init__(self, path):
+        """
+        Opens (and if necessary creates) a spool file.
+
+        Args:
+            path (str): The SQLite file to use.
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS batches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                query TEXT NOT NULL,
+                table_name TEXT,
+                column_types TEXT,
+                rows TEXT NOT NULL
+            )""")
+        self._pending_batches = self._db.execute("SELECT COUNT(*) FROM batches").fetchone()[0]
+        if self._pending_batches:
+            logging.info(f"MySQL spool '{path}' holds {self._pending_batches} unsent batches.")
+
+    def __len__(self):
+        """Returns the number of batches waiting in the spool."""
+        return self._pending_batches
+
+    def append(self, query, rows, schema=None):
+        """
+        Durably appends a batch.
+
+        Args:
+            query (str): The INSERT statement.
+            rows (list[tuple]): The rows of the batch.
+            schema (tuple, optional): (table_name, {column: column_type}) the
+                                      statement needs.
+        """
+        table_name, column_types = schema if schema else (None, None)
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO batches (query, table_name, column_types, rows) VALUES (?, ?, ?, ?)",
+                (query, table_name, json.dumps(column_types) if column_types else None,
+                 json.dumps([list(row) for row in rows], default=_encode_value)))
+            self._pending_batches += 1
+
+    def peek(self):
+        """
+        Returns the oldest batch without removing it.
+
+        Returns:
+            tuple or None: (batch_id, query, rows, schema), or None if the spool is empty.
+        """
+        with self._lock:
+            record = self._db.execute(
+                "SELECT id, query, table_name, column_types, rows FROM batches ORDER BY id LIMIT 1").fetchone()
+        if record is None:
+            return None
+        batch_id, query, table_name, column_types, rows = record
+        schema = (table_name, json.loads(column_types)) if table_name and column_types else None
+        rows = [tuple(row) for row in json.loads(rows, object_hook=_decode_value)]
+        return batch_id, query, rows, schema
+
+    def remove(self, batch_id):
+        """
+        Removes a batch after it has been written to MySQL.
+
+        Args:
+            batch_id (int): The id returned by `peek`.
+        """
+        with self._lock:
+            if self._db.execute("DELETE FROM batches WHERE id = ?", (batch_id,)).rowcount:
+                self._pending_batches -= 1
+
+    def close(self):
+        """Closes the spool file. Pending batches stay on disk."""
+        with self._lock:
+            self._db.close()
+
+
+def _encode_value(value):
+    """Tags values the JSON encoder cannot represent."""
+    if isinstance(value, datetime.datetime):
+        return {'__spool_type__': 'datetime', 'value': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'__spool_type__': 'date', 'value': value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {'__spool_type__': 'time', 'value': value.isoformat()}
+    if isinstance(value, decimal.Decimal):
+        return {'__spool_type__': 'decimal', 'value': str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {'__spool_type__': 'bytes', 'value': base64.b64encode(value).decode('ascii')}
+    # Anything else (e.g. OPC-UA structures) is stored the way MySQL would see it.
+    return str(value)
+
+
+def _decode_value(obj):
+    """Restores values tagged by `_encode_value`."""
+    kind = obj.get('__spool_type__')
+    if kind is None:
+        return obj
+    value = obj['value']
+    if kind == 'datetime':
+        return datetime.datetime.fromisoformat(value)
+    if kind == 'date':
+        return datetime.date.fromisoformat(value)
+    if kind == 'time':
+        return datetime.time.fromisoformat(value)
+    if kind == 'decimal':
+        return decimal.Decimal(value)
+    if kind == 'bytes':
+        return base64.b64decode(value)
+    return obj
@@ -8,7 +8,10 @@ subscriptions. It is designed to be completely separate from the UI, ensuring
 a clean separation of concerns.
 """
 import asyncio
+import itertools
 import logging
+import time
+from datetime import timezone
 from asyncua import Client, ua
 from asyncua.ua.uaerrors import UaError
 
@@ -40,13 +43,15 @@ class SubscriptionHandler:
 
         This method is called by `asyncua` whenever a subscribed node's value changes.
         It forwards the node and its new value to the logic instance for processing.
+        Dispatching is synchronous; subscriber callbacks are expected to be cheap
+        (dashboard widgets only buffer the value until the next UI tick).
 
         Args:
             node (asyncua.Node): The node that triggered the notification.
             val: The new value of the node.
-            data: The full data change notification object (not used).
+            data: The full data change notification object, used for its timestamps.
         """
-        asyncio.create_task(self.logic_instance.dispatch_data_change(node, val))
+        self.logic_instance.dispatch_data_change(node, val, _notification_timestamp(data))
 
     def status_change_notification(self, status):
         """
@@ -70,14 +75,329 @@ class SubscriptionHandler:
         """
         Handles event notifications from the server.
 
-        Currently, this method only logs the received event.
+        Model change events invalidate the client's metadata cache, since
+        nodes may have been added, removed or retyped. Other events are logged.
 
         Args:
             event: The event notification object.
         """
+        if getattr(event, 'EventType', None) in MODEL_CHANGE_EVENT_TYPES:
+            logging.info("Server address space changed. Invalidating the node metadata cache.")
+            self.logic_instance.metadata_cache.clear()
+            return
         logging.info(f"Received event notification: {event}")
 
 
+MODEL_CHANGE_EVENT_TYPES = (
+    ua.NodeId(ua.ObjectIds.BaseModelChangeEventType),
+    ua.NodeId(ua.ObjectIds.GeneralModelChangeEventType),
+    ua.NodeId(ua.ObjectIds.SemanticChangeEventType),
+)
+
+
+class NodeMetadataCache:
+    """
+    Caches node metadata that rarely changes for the lifetime of a connection.
+
+    The cache holds resolved Node objects, method nodes keyed by their parent
+    and browse name, VariantTypes, access levels and browse names. It is
+    cleared on every (re)connect and whenever the server reports a model change.
+
+    Attributes:
+        nodes (dict): Maps node identifier strings to asyncua Node objects.
+        methods (dict): Maps (parent NodeId, method browse name) to the method's NodeId.
+        variant_types (dict): Maps NodeIds to their ua.VariantType.
+        access_levels (dict): Maps NodeIds to their UserAccessLevel value.
+        browse_names (dict): Maps NodeIds to their ua.QualifiedName browse name.
+    """
+    def __init__(self):
+        """Initializes an empty NodeMetadataCache."""
+        self.nodes = {}
+        self.methods = {}
+        self.variant_types = {}
+        self.access_levels = {}
+        self.browse_names = {}
+
+    def clear(self):
+        """Drops all cached metadata."""
+        self.nodes.clear()
+        self.methods.clear()
+        self.variant_types.clear()
+        self.access_levels.clear()
+        self.browse_names.clear()
+
+
+# The publishing interval (ms) of the default subscription, used when a caller
+# does not request a specific rate.
+DEFAULT_PUBLISHING_INTERVAL = 500
+
+
+class SubscriptionManager:
+    """
+    Pools monitored items into one subscription per publishing interval.
+
+    Callers request a rate (e.g. 10 ms for a fast plot, 1000 ms for a status
+    label) and a queue size. All monitored items sharing a rate live in the same
+    server-side subscription, which is created on first use and deleted when
+    its last monitored item is removed, unless it was requested as persistent
+    (the default group, which also carries the model change events).
+
+    Args:
+        logic_instance (OpcuaClientLogic): The client logic owning the connection.
+    """
+    def __init__(self, logic_instance):
+        """
+        Initializes the SubscriptionManager.
+
+        Args:
+            logic_instance (OpcuaClientLogic): The client logic owning the connection.
+        """
+        self.logic_instance = logic_instance
+        self.groups = {}
+        self.item_counts = {}
+        self.persistent = set()
+
+    async def get_subscription(self, publishing_interval, persistent=False):
+        """
+        Returns the subscription for a publishing interval, creating it if needed.
+
+        Args:
+            publishing_interval (int): The publishing interval in milliseconds.
+            persistent (bool, optional): If True, the subscription is kept when
+                                         its last data item is removed, e.g.
+                                         because it also carries event items.
+
+        Returns:
+            asyncua.Subscription: The subscription for this rate group.
+        """
+        subscription = self.groups.get(publishing_interval)
+        if subscription is None:
+            logic = self.logic_instance
+            subscription = await logic._call_with_error_handling(
+                logic.client.create_subscription(publishing_interval, logic.subscription_handler)
+            )
+            self.groups[publishing_interval] = subscription
+            logging.info(f"OPC-UA Subscription created for the {publishing_interval} ms rate group.")
+        if persistent:
+            self.persistent.add(publishing_interval)
+        return subscription
+
+    async def subscribe(self, node, publishing_interval=DEFAULT_PUBLISHING_INTERVAL, queue_size=1):
+        """
+        Adds a monitored item for a node to the matching rate group.
+
+        Args:
+            node (asyncua.Node): The node to monitor.
+            publishing_interval (int, optional): The publishing and sampling
+                                                 interval in milliseconds.
+            queue_size (int, optional): The server-side queue size of the item.
+
+        Returns:
+            tuple: An opaque (publishing_interval, handle) pair for `unsubscribe`.
+        """
+        subscription = await self.get_subscription(publishing_interval)
+        handle = await self.logic_instance._call_with_error_handling(
+            subscription.subscribe_data_change(node, queuesize=queue_size, sampling_interval=publishing_interval)
+        )
+        self.item_counts[publishing_interval] = self.item_counts.get(publishing_interval, 0) + 1
+        return publishing_interval, handle
+
+    async def unsubscribe(self, subscription_handle):
+        """
+        Removes a monitored item created by `subscribe`.
+
+        The rate group's subscription is deleted along with its last item, so
+        unused publishing intervals do not keep server resources and publish
+        requests alive. Persistent groups are kept.
+
+        Args:
+            subscription_handle (tuple): The pair returned by `subscribe`.
+        """
+        publishing_interval, handle = subscription_handle
+        subscription = self.groups.get(publishing_interval)
+        if subscription is None:
+            return
+        try:
+            await self.logic_instance._call_with_error_handling(subscription.unsubscribe(handle))
+        finally:
+            remaining = self.item_counts.get(publishing_interval, 1) - 1
+            if remaining > 0:
+                self.item_counts[publishing_interval] = remaining
+            elif publishing_interval in self.persistent:
+                self.item_counts.pop(publishing_interval, None)
+            elif self.groups.get(publishing_interval) is subscription:
+                # Forget the group before awaiting, so a concurrent `subscribe` creates a new one.
+                del self.groups[publishing_interval]
+                self.item_counts.pop(publishing_interval, None)
+                try:
+                    await subscription.delete()
+                    logging.info(f"OPC-UA Subscription of the {publishing_interval} ms rate group deleted.")
+                except Exception as e:
+                    logging.warning(f"Error deleting the {publishing_interval} ms subscription: {e}")
+
+    async def delete_all(self):
+        """Deletes every rate group subscription on the server."""
+        for publishing_interval, subscription in list(self.groups.items()):
+            try:
+                await subscription.delete()
+            except Exception as e:
+                logging.warning(f"Error deleting the {publishing_interval} ms subscription: {e}")
+        self.groups.clear()
+        self.item_counts.clear()
+        self.persistent.clear()
+
+
+class MonitoredItem:
+    """
+    A single server-side monitored item shared by any number of subscribers.
+
+    Attributes:
+        node (asyncua.Node): The monitored node.
+        handle (tuple): The SubscriptionManager handle of the monitored item.
+        publishing_interval (int): The rate group the item currently lives in.
+        queue_size (int): The queue size the item was created with.
+        subscribers (dict): Maps subscriber tokens to (callback,
+                            publishing_interval, queue_size, include_timestamp) tuples.
+    """
+    def __init__(self, node):
+        """
+        Initializes a MonitoredItem without a server-side handle.
+
+        Args:
+            node (asyncua.Node): The monitored node.
+        """
+        self.node = node
+        self.handle = None
+        self.publishing_interval = None
+        self.queue_size = None
+        self.subscribers = {}
+
+    def required_options(self):
+        """
+        Returns the fastest rate and deepest queue requested by any subscriber.
+
+        Returns:
+            tuple: (publishing_interval, queue_size)
+        """
+        options = list(self.subscribers.values())
+        return min(o[1] for o in options), max(o[2] for o in options)
+
+
+class MonitoredItemRegistry:
+    """
+    A reference-counted registry of monitored items keyed by NodeId.
+
+    Several subscribers to the same node share one monitored item. The item
+    runs at the fastest rate any subscriber asked for. It moves to another rate
+    group when the requirements change, and it is removed from the server only
+    when its last subscriber leaves.
+
+    Args:
+        subscription_manager (SubscriptionManager): Creates and removes the
+                                                    server-side monitored items.
+    """
+    def __init__(self, subscription_manager):
+        """
+        Initializes an empty MonitoredItemRegistry.
+
+        Args:
+            subscription_manager (SubscriptionManager): The rate group manager.
+        """
+        self.subscription_manager = subscription_manager
+        self.items = {}
+        self._tokens = itertools.count(1)
+        self._lock = asyncio.Lock()
+
+    async def add(self, node, callback, publishing_interval, queue_size, include_timestamp=False):
+        """
+        Registers a subscriber, creating the monitored item if necessary.
+
+        Args:
+            node (asyncua.Node): The node to monitor.
+            callback (callable): Called with each new value.
+            publishing_interval (int): The requested rate in milliseconds.
+            queue_size (int): The requested queue size.
+            include_timestamp (bool, optional): True to call `callback` with
+                                                (value, timestamp) pairs.
+
+        Returns:
+            int: A subscriber token for `remove`.
+        """
+        async with self._lock:
+            item = self.items.get(node.nodeid)
+            if item is None:
+                item = MonitoredItem(node)
+                self.items[node.nodeid] = item
+            token = next(self._tokens)
+            item.subscribers[token] = (callback, publishing_interval, queue_size, include_timestamp)
+            try:
+                await self._apply_options(item)
+            except Exception:
+                del item.subscribers[token]
+                if not item.subscribers:
+                    del self.items[node.nodeid]
+                raise
+            return token
+
+    async def remove(self, node, token):
+        """
+        Unregisters a subscriber, deleting the monitored item after the last one.
+
+        Args:
+            node (asyncua.Node): The monitored node.
+            token (int): The token returned by `add`.
+
+        Returns:
+            bool: True if the monitored item was removed from the server.
+        """
+        async with self._lock:
+            item = self.items.get(node.nodeid)
+            if item is None or item.subscribers.pop(token, None) is None:
+                return False
+            if item.subscribers:
+                await self._apply_options(item)
+                return False
+            del self.items[node.nodeid]
+            await self.subscription_manager.unsubscribe(item.handle)
+            return True
+
+    async def _apply_options(self, item):
+        """
+        (Re)creates a monitored item if its required rate or queue size changed.
+
+        The replacement is created before the old item is removed, so no
+        notifications are missed during the move.
+
+        Args:
+            item (MonitoredItem): The item to update.
+        """
+        publishing_interval, queue_size = item.required_options()
+        if item.handle is not None and (publishing_interval, queue_size) == (item.publishing_interval, item.queue_size):
+            return
+        old_handle = item.handle
+        item.handle = await self.subscription_manager.subscribe(item.node, publishing_interval, queue_size)
+        item.publishing_interval, item.queue_size = publishing_interval, queue_size
+        if old_handle is not None:
+            await self.subscription_manager.unsubscribe(old_handle)
+
+    def get_callbacks(self, node):
+        """
+        Returns the callbacks subscribed to a node.
+
+        Args:
+            node (asyncua.Node): The node that changed.
+
+        Returns:
+            list[tuple]: (callback, include_timestamp) pairs, empty if the node is unknown.
+        """
+        item = self.items.get(node.nodeid)
+        return [(subscriber[0], subscriber[3]) for subscriber in item.subscribers.values()] if item else []
+
+    def clear(self):
+        """Forgets all monitored items without contacting the server."""
+        self.items.clear()
+
+
 class OpcuaClientLogic:
     """
     Handles all business logic for interacting with an OPC-UA server.
@@ -90,11 +410,16 @@ class OpcuaClientLogic:
     Attributes:
         client (asyncua.Client): The `asyncua` client instance.
         is_connected (bool): True if a connection is active, False otherwise.
-        subscription (asyncua.Subscription): The subscription object.
+        subscription (asyncua.Subscription): The default-rate subscription object.
         subscription_handler (SubscriptionHandler): The handler for subscription notifications.
-        node_callback_map (dict): Maps subscribed nodes to their respective UI callbacks.
+        subscription_manager (SubscriptionManager): Pools monitored items per publishing interval.
+        monitored_items (MonitoredItemRegistry): Shares one monitored item per
+                                                 NodeId between all its subscribers.
         connection_lost_callback (callable): A callback to be executed when the
                                              connection is lost.
+        max_nodes_per_read (int): The server's MaxNodesPerRead limit (0 = unlimited).
+        max_nodes_per_write (int): The server's MaxNodesPerWrite limit (0 = unlimited).
+        metadata_cache (NodeMetadataCache): Per-connection cache of node metadata.
     """
     def __init__(self):
         """Initializes the OpcuaClientLogic."""
@@ -102,8 +427,12 @@ class OpcuaClientLogic:
         self.is_connected = False
         self.subscription = None
         self.subscription_handler = None
-        self.node_callback_map = {}
+        self.subscription_manager = SubscriptionManager(self)
+        self.monitored_items = MonitoredItemRegistry(self.subscription_manager)
         self.connection_lost_callback = None
+        self.max_nodes_per_read = 0
+        self.max_nodes_per_write = 0
+        self.metadata_cache = NodeMetadataCache()
 
     async def connect(self, url, username=None, password=None):
         """
@@ -136,10 +465,15 @@ class OpcuaClientLogic:
 
             await self.client.connect()
             self.is_connected = True
+            self.metadata_cache.clear()
 
             self.subscription_handler = SubscriptionHandler(self)
-            self.subscription = await self.client.create_subscription(500, self.subscription_handler)
-            logging.info("OPC-UA Subscription created.")
+            # The model change events live on this subscription, so it must outlive its data items.
+            self.subscription = await self.subscription_manager.get_subscription(
+                DEFAULT_PUBLISHING_INTERVAL, persistent=True
+            )
+            await self._read_operation_limits()
+            await self._subscribe_to_model_changes()
             return True
         except Exception as e:
             self.client = None
@@ -153,12 +487,8 @@ class OpcuaClientLogic:
         This includes deleting the subscription, disconnecting the client, and
         clearing any internal state.
         """
-        if self.subscription:
-            try:
-                await self.subscription.delete()
-            except Exception as e:
-                logging.warning(f"Error deleting subscription: {e}")
-            self.subscription = None
+        await self.subscription_manager.delete_all()
+        self.subscription = None
 
         if self.client and self.client.uaclient:
             try:
@@ -168,7 +498,43 @@ class OpcuaClientLogic:
 
         self.client = None
         self.is_connected = False
-        self.node_callback_map.clear()
+        self.monitored_items.clear()
+        self.metadata_cache.clear()
+        self.max_nodes_per_read = 0
+        self.max_nodes_per_write = 0
+
+    async def _subscribe_to_model_changes(self):
+        """
+        Subscribes to the server's model change events.
+
+        These events invalidate the metadata cache. Servers that do not support
+        event subscriptions are tolerated; the cache is then only invalidated
+        on reconnect.
+        """
+        try:
+            await self.subscription.subscribe_events(ua.ObjectIds.Server, ua.ObjectIds.BaseModelChangeEventType)
+        except Exception as e:
+            logging.warning(f"Could not subscribe to model change events: {e}")
+
+    async def _read_operation_limits(self):
+        """
+        Reads the server's MaxNodesPerRead/MaxNodesPerWrite operation limits.
+
+        Servers that do not expose these properties are treated as unlimited.
+        """
+        limit_nodes = [
+            self.client.get_node(ua.NodeId(ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerRead)),
+            self.client.get_node(ua.NodeId(ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerWrite)),
+        ]
+        try:
+            results = await self.client.uaclient.read_attributes([node.nodeid for node in limit_nodes], ua.AttributeIds.Value)
+            limits = [result.Value.Value if result.StatusCode.is_good() and result.Value.Value else 0 for result in results]
+            self.max_nodes_per_read, self.max_nodes_per_write = int(limits[0]), int(limits[1])
+        except Exception as e:
+            logging.warning(f"Could not read server operation limits, assuming unlimited: {e}")
+            self.max_nodes_per_read = self.max_nodes_per_write = 0
+        logging.info(f"Server operation limits - MaxNodesPerRead: {self.max_nodes_per_read or 'unlimited'}, "
+                     f"MaxNodesPerWrite: {self.max_nodes_per_write or 'unlimited'}")
 
     async def _call_with_error_handling(self, coro):
         """
@@ -197,15 +563,28 @@ class OpcuaClientLogic:
                 self.connection_lost_callback()
             raise
 
-    async def subscribe_to_node_change(self, node, callback):
+    async def subscribe_to_node_change(self, node, callback, publishing_interval=DEFAULT_PUBLISHING_INTERVAL, queue_size=1,
+                                       include_timestamp=False):
         """
         Subscribes to data changes for a specific node.
 
+        Subscribers of the same node share a single monitored item on the server.
+
         Args:
             node (asyncua.Node): The node to subscribe to.
             callback (callable): The function to call when the node's value changes.
                                  This callback will receive the new value as its
                                  only argument.
+            publishing_interval (int, optional): The requested update rate in
+                                                 milliseconds. Items with the same
+                                                 rate share one subscription.
+            queue_size (int, optional): The server-side queue size, so fast
+                                        samples are not lost between publishes.
+            include_timestamp (bool, optional): If True, the callback receives a
+                                                (value, timestamp) pair instead,
+                                                where timestamp is the sample's
+                                                source (or server) time in epoch
+                                                seconds.
 
         Returns:
             int: The subscription handle, which can be used to unsubscribe.
@@ -215,11 +594,8 @@ class OpcuaClientLogic:
             logging.warning("Cannot subscribe, no active subscription exists.")
             return None
 
-        self.node_callback_map[node] = callback
-        handle = await self._call_with_error_handling(
-            self.subscription.subscribe_data_change(node)
-        )
-        logging.info(f"Subscribed to node {node}. Handle: {handle}")
+        handle = await self.monitored_items.add(node, callback, publishing_interval, queue_size, include_timestamp)
+        logging.info(f"Subscribed to node {node} at {publishing_interval} ms. Handle: {handle}")
         return handle
 
     async def unsubscribe_from_node_change(self, node, handle):
@@ -231,27 +607,29 @@ class OpcuaClientLogic:
             handle (int): The handle returned by `subscribe_to_node_change`.
         """
         if self.subscription and handle:
-            await self._call_with_error_handling(
-                self.subscription.unsubscribe(handle)
-            )
-            logging.info(f"Unsubscribed from node {node}. Handle: {handle}")
-
-        if node in self.node_callback_map:
-            del self.node_callback_map[node]
+            removed = await self.monitored_items.remove(node, handle)
+            logging.info(f"Unsubscribed from node {node}. Handle: {handle}. Monitored item removed: {removed}")
 
-    async def dispatch_data_change(self, node, val):
+    def dispatch_data_change(self, node, val, timestamp=None):
         """
-        Calls the appropriate callback for a data change notification.
+        Calls every subscriber callback for a data change notification.
 
         Args:
             node (asyncua.Node): The node whose value has changed.
             val: The new value of the node.
+            timestamp (float, optional): The sample time in epoch seconds.
+                                         Defaults to the time of arrival.
         """
-        if node in self.node_callback_map:
-            callback = self.node_callback_map[node]
-            callback(val)
-        else:
+        callbacks = self.monitored_items.get_callbacks(node)
+        if not callbacks:
             logging.warning(f"Received data change for an unmapped node: {node}")
+        if timestamp is None:
+            timestamp = time.time()
+        for callback, include_timestamp in callbacks:
+            try:
+                callback((val, timestamp) if include_timestamp else val)
+            except Exception as e:
+                logging.error(f"Subscriber callback for node {node} failed: {e}")
 
     async def find_node(self, identifier, search_type):
         """
@@ -271,12 +649,19 @@ class OpcuaClientLogic:
         """
         if not self.client:
             raise ConnectionError("Cannot find node, client is not connected.")
-        return self.client.get_node(identifier)
+        node = self.metadata_cache.nodes.get(identifier)
+        if node is None:
+            node = self.client.get_node(identifier)
+            self.metadata_cache.nodes[identifier] = node
+        return node
 
     async def get_method_node(self, parent_node, method_bname):
         """
         Finds a method node by its browse name among the children of a parent node.
 
+        The methods of a parent are resolved with a single Browse request and
+        cached, so later lookups need no round trip at all.
+
         Args:
             parent_node (asyncua.Node): The parent node (object) to search within.
             method_bname (str): The browse name of the method to find.
@@ -284,18 +669,55 @@ class OpcuaClientLogic:
         Returns:
             asyncua.Node: The method node if found, otherwise None.
         """
-        children = await self._call_with_error_handling(parent_node.get_children())
-        for child_node in children:
-            node_class = await child_node.read_node_class()
-            if node_class == ua.NodeClass.Method:
-                bname = await child_node.read_browse_name()
-                if bname.Name == method_bname:
-                    return child_node
-        return None
+        key = (parent_node.nodeid, method_bname)
+        method_id = self.metadata_cache.methods.get(key)
+        if method_id is None:
+            descriptions = await self._call_with_error_handling(
+                parent_node.get_children_descriptions(nodeclassmask=ua.NodeClass.Method)
+            )
+            for description in descriptions:
+                self.metadata_cache.methods[(parent_node.nodeid, description.BrowseName.Name)] = description.NodeId
+                self.metadata_cache.browse_names[description.NodeId] = description.BrowseName
+            method_id = self.metadata_cache.methods.get(key)
+            if method_id is None:
+                return None
+        return self.client.get_node(method_id)
+
+    async def get_variant_type(self, node):
+        """
+        Returns the ua.VariantType of a variable node, using the metadata cache.
+
+        Args:
+            node (asyncua.Node): The variable node.
+
+        Returns:
+            ua.VariantType: The node's variant type.
+        """
+        variant_type = self.metadata_cache.variant_types.get(node.nodeid)
+        if variant_type is None:
+            variant_type = await self._call_with_error_handling(node.read_data_type_as_variant_type())
+            self.metadata_cache.variant_types[node.nodeid] = variant_type
+        return variant_type
+
+    async def get_browse_name(self, node):
+        """
+        Returns the browse name of a node, using the metadata cache.
+
+        Args:
+            node (asyncua.Node): The node.
+
+        Returns:
+            ua.QualifiedName: The node's browse name.
+        """
+        browse_name = self.metadata_cache.browse_names.get(node.nodeid)
+        if browse_name is None:
+            browse_name = await self._call_with_error_handling(node.read_browse_name())
+            self.metadata_cache.browse_names[node.nodeid] = browse_name
+        return browse_name
 
     async def get_node_properties(self, node):
         """
-        Reads the UserAccessLevel attribute of a node.
+        Reads the UserAccessLevel attribute of a node, using the metadata cache.
 
         Args:
             node (asyncua.Node): The node to read from.
@@ -303,9 +725,13 @@ class OpcuaClientLogic:
         Returns:
             The value of the UserAccessLevel attribute.
         """
-        return await self._call_with_error_handling(
-             node.read_attribute(ua.AttributeIds.UserAccessLevel)
-        )
+        access_level = self.metadata_cache.access_levels.get(node.nodeid)
+        if access_level is None:
+            access_level = await self._call_with_error_handling(
+                 node.read_attribute(ua.AttributeIds.UserAccessLevel)
+            )
+            self.metadata_cache.access_levels[node.nodeid] = access_level
+        return access_level
 
     async def read_value(self, node):
         """
@@ -334,13 +760,87 @@ class OpcuaClientLogic:
         variant = ua.Variant(value, datatype)
         return await self._call_with_error_handling(node.write_value(variant))
 
+    async def read_values(self, nodes):
+        """
+        Reads the values of many nodes using as few Read service calls as possible.
+
+        The nodes are packed into single Read requests, split into chunks that
+        respect the server's MaxNodesPerRead limit.
+
+        Args:
+            nodes (list[asyncua.Node]): The nodes to read from.
+
+        Returns:
+            list: The values, in the same order as `nodes`.
+        """
+        values = []
+        for chunk in _chunks(list(nodes), self.max_nodes_per_read):
+            values.extend(await self._call_with_error_handling(self.client.read_values(chunk)))
+        return values
+
+    async def write_values(self, items):
+        """
+        Writes many values using as few Write service calls as possible.
+
+        The writes are packed into single Write requests, split into chunks
+        that respect the server's MaxNodesPerWrite limit.
+
+        Args:
+            items (list[tuple]): A list of (node, value, datatype) tuples. The
+                datatype is a ua.VariantType, or None to let asyncua infer it.
+
+        Raises:
+            UaStatusCodeError: If any of the writes is rejected by the server.
+        """
+        for chunk in _chunks(list(items), self.max_nodes_per_write):
+            nodes = [node for node, _, _ in chunk]
+            variants = [ua.Variant(value, datatype) if datatype is not None else value for _, value, datatype in chunk]
+            await self._call_with_error_handling(self.client.write_values(nodes, variants))
+
+    async def read_variant_types(self, nodes):
+        """
+        Resolves the ua.VariantType of many variable nodes.
+
+        Cached types are reused. The DataType attributes of the remaining nodes
+        are read in batched requests. Built-in types map directly to a
+        VariantType; other (derived or structured) types fall back to a
+        per-node lookup.
+
+        Args:
+            nodes (list[asyncua.Node]): The variable nodes.
+
+        Returns:
+            list[ua.VariantType]: The variant types, in the same order as `nodes`.
+        """
+        nodes = list(nodes)
+        cache = self.metadata_cache.variant_types
+        missing = [node for node in nodes if node.nodeid not in cache]
+        datatype_ids = []
+        for chunk in _chunks(missing, self.max_nodes_per_read):
+            results = await self._call_with_error_handling(
+                self.client.uaclient.read_attributes([node.nodeid for node in chunk], ua.AttributeIds.DataType)
+            )
+            for result in results:
+                result.StatusCode.check()
+                datatype_ids.append(result.Value.Value)
+
+        for node, datatype_id in zip(missing, datatype_ids):
+            if datatype_id.NamespaceIndex == 0 and isinstance(datatype_id.Identifier, int) and datatype_id.Identifier in _BUILTIN_VARIANT_TYPES:
+                cache[node.nodeid] = ua.VariantType(datatype_id.Identifier)
+            else:
+                cache[node.nodeid] = await self._call_with_error_handling(node.read_data_type_as_variant_type())
+        return [cache[node.nodeid] for node in nodes]
+
     async def call_method(self, parent_node_id, method_node_id, *args):
         """
         Calls a method on an OPC-UA object.
 
+        When Node objects are passed, no lookups are needed and the call is a
+        single Call service request.
+
         Args:
-            parent_node_id (str): The node ID of the parent object.
-            method_node_id (str): The node ID of the method to call.
+            parent_node_id (str or asyncua.Node): The parent object or its node ID.
+            method_node_id (str or asyncua.Node): The method node or its node ID.
             *args: A variable number of arguments to pass to the method.
 
         Returns:
@@ -350,3 +850,46 @@ class OpcuaClientLogic:
         return await self._call_with_error_handling(
             parent_node.call_method(method_node_id, *args)
         )
+
+
+def _notification_timestamp(data):
+    """
+    Extracts the sample time of a data change notification.
+
+    Args:
+        data: The asyncua DataChangeNotif object.
+
+    Returns:
+        float: The source timestamp (or, failing that, the server timestamp) in
+               epoch seconds, or None if the notification carries neither.
+    """
+    try:
+        data_value = data.monitored_item.Value
+        stamp = data_value.SourceTimestamp or data_value.ServerTimestamp
+    except AttributeError:
+        return None
+    if stamp is None:
+        return None
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.timestamp()
+
+
+# Numeric identifiers of the built-in DataTypes that map one-to-one to a VariantType.
+_BUILTIN_VARIANT_TYPES = {vt.value for vt in ua.VariantType if 0 < vt.value <= 25}
+
+
+def _chunks(items, size):
+    """
+    Splits a list into consecutive chunks of at most `size` items.
+
+    Args:
+        items (list): The items to split.
+        size (int): The maximum chunk size. 0 or None means a single chunk.
+
+    Returns:
+        list[list]: The chunks. An empty input yields no chunks.
+    """
+    if not size or size <= 0:
+        return [items] if items else []
+    return [items[i:i + size] for i in range(0, len(items), size)]
@@ -0,0 +1,69 @@
+"""
+Materialization of Database Result Sets.
+
+This module converts rows fetched from MySQL into the container chosen on a
+MySQL Read node: the plain list of row tuples, a NumPy structured array (one
+named field per column) or a pandas DataFrame. The array and DataFrame forms
+let Compute and Python Script nodes process whole columns with vectorized
+operations instead of Python loops over rows.
+"""
+import numpy as np
+
+OUTPUT_ROWS = "Rows"
+OUTPUT_NUMPY = "NumPy Array"
+OUTPUT_DATAFRAME = "DataFrame"
+OUTPUT_FORMATS = (OUTPUT_ROWS, OUTPUT_NUMPY, OUTPUT_DATAFRAME)
+
+
+def materialize(rows, columns, output_format=OUTPUT_ROWS):
+    """
+    Converts fetched rows into the requested container.
+
+    Args:
+        rows (list[tuple]): The fetched rows.
+        columns (list[str]): The column names, in row order.
+        output_format (str, optional): One of OUTPUT_FORMATS.
+
+    Returns:
+        list, numpy.ndarray or pandas.DataFrame: The converted result.
+
+    Raises:
+        ValueError: If the output format is unknown.
+    """
+    if output_format == OUTPUT_ROWS:
+        return rows
+    if output_format == OUTPUT_NUMPY:
+        return to_structured_array(rows, columns)
+    if output_format == OUTPUT_DATAFRAME:
+        # pandas is only needed (and only imported) when a node asks for it.
+        import pandas as pd
+        return pd.DataFrame.from_records(rows, columns=columns)
+    raise ValueError(f"Unknown result format '{output_format}'.")
+
+
+def to_structured_array(rows, columns):
+    """
+    Builds a NumPy structured array with one field per column.
+
+    Numeric columns get a numeric dtype; columns holding strings, dates,
+    decimals or NULLs fall back to the object dtype.
+
+    Args:
+        rows (list[tuple]): The fetched rows.
+        columns (list[str]): The column names, in row order.
+
+    Returns:
+        numpy.ndarray: A structured array of len(rows) records.
+    """
+    if not rows:
+        return np.empty(0, dtype=[(name, object) for name in columns])
+    fields = []
+    for index, name in enumerate(columns):
+        column = np.array([row[index] for row in rows])
+        if column.dtype.kind not in "biuf":
+            column = column.astype(object)
+        fields.append((name, column))
+    array = np.empty(len(rows), dtype=[(name, column.dtype) for name, column in fields])
+    for name, column in fields:
+        array[name] = column
+    return array
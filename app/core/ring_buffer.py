@@ -0,0 +1,120 @@
+"""
+Preallocated NumPy Ring Buffer for Time Series.
+
+This module provides the TimeSeriesRingBuffer class, a fixed-capacity buffer
+of (timestamp, value) samples backed by preallocated NumPy arrays. Every sample
+is stored twice, half a buffer apart, so that the most recent samples are always
+available as a single contiguous slice. Reading the window therefore never
+copies or allocates, and appending a batch of samples is a handful of
+vectorized slice assignments regardless of the buffer size.
+"""
+import numpy as np
+
+
+class TimeSeriesRingBuffer:
+    """
+    A fixed-capacity ring buffer of timestamped float samples.
+
+    Attributes:
+        capacity (int): The maximum number of samples kept.
+    """
+    def __init__(self, capacity):
+        """
+        Initializes an empty TimeSeriesRingBuffer.
+
+        Args:
+            capacity (int): The maximum number of samples kept. Must be positive.
+        """
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be at least 1.")
+        self.capacity = int(capacity)
+        self._timestamps = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._values = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._index = 0
+        self._size = 0
+
+    def __len__(self):
+        """Returns the number of samples currently stored."""
+        return self._size
+
+    def clear(self):
+        """Removes all samples without releasing the preallocated memory."""
+        self._index = 0
+        self._size = 0
+
+    def append(self, timestamp, value):
+        """
+        Appends a single sample.
+
+        Args:
+            timestamp (float): The sample time in epoch seconds.
+            value (float): The sample value.
+        """
+        index = self._index
+        self._timestamps[index] = self._timestamps[index + self.capacity] = timestamp
+        self._values[index] = self._values[index + self.capacity] = value
+        self._index = (index + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def extend(self, timestamps, values):
+        """
+        Appends a batch of samples with vectorized writes.
+
+        If the batch is larger than the capacity, only its newest samples are kept.
+
+        Args:
+            timestamps (array-like): The sample times in epoch seconds.
+            values (array-like): The sample values, same length as `timestamps`.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if timestamps.shape != values.shape:
+            raise ValueError("Timestamps and values must have the same length.")
+        count = len(values)
+        if count == 0:
+            return
+        if count > self.capacity:
+            timestamps, values = timestamps[-self.capacity:], values[-self.capacity:]
+            count = self.capacity
+
+        self._write(self._timestamps, timestamps)
+        self._write(self._values, values)
+        self._index = (self._index + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+
+    def _write(self, data, samples):
+        """Writes samples at the current index into both halves of a backing array."""
+        count = len(samples)
+        start = self._index
+        first = min(count, self.capacity - start)
+        for offset in (0, self.capacity):
+            data[offset + start:offset + start + first] = samples[:first]
+            if count > first:
+                data[offset:offset + count - first] = samples[first:]
+
+    def timestamps(self):
+        """
+        Returns the stored timestamps, oldest first.
+
+        Returns:
+            numpy.ndarray: A contiguous read-only view; it is only valid until
+                           the next append.
+        """
+        return self._view(self._timestamps)
+
+    def values(self):
+        """
+        Returns the stored values, oldest first.
+
+        Returns:
+            numpy.ndarray: A contiguous read-only view; it is only valid until
+                           the next append.
+        """
+        return self._view(self._values)
+
+    def _view(self, data):
+        """Returns the contiguous window of the newest samples in a backing array."""
+        end = self._index + self.capacity
+        view = data[end - self._size:end]
+        view.flags.writeable = False
+        return view
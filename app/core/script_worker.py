@@ -0,0 +1,327 @@
+"""
+Worker-Process Execution for Python Script Nodes.
+
+CPU-heavy Python Script nodes (image inspection, signal analysis) would block
+the qasync event loop, and with it the GUI, OPC-UA subscriptions and every
+other running sequence. This module runs such scripts in a pool of
+persistent worker processes instead.
+
+Values are exchanged by pickling, except for large NumPy arrays: those are
+copied once into a shared-memory block and rebuilt on the other side as an
+array over that block, which avoids pushing megabytes through the pool's
+pipes. Each worker keeps its own cache of compiled scripts.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+import numpy as np
+
+# Arrays at least this large travel through shared memory instead of the pipe.
+SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
+# The modules (and their submodules) scripts may import.
+ALLOWED_SCRIPT_MODULES = frozenset({
+    'numpy', 'cv2', 'scipy', 'math', 'cmath', 'statistics', 'datetime', 're', 'json',
+})
+
+
+def _script_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """
+    An `__import__` for scripts that only resolves ALLOWED_SCRIPT_MODULES.
+
+    Besides explicit imports in scripts, NumPy array methods (e.g.
+    `arr.sum()`) import their implementation lazily through it.
+
+    Raises:
+        ImportError: If the module is not allowed.
+    """
+    if level == 0 and name.partition('.')[0] in ALLOWED_SCRIPT_MODULES:
+        return __import__(name, globals, locals, fromlist, level)
+    raise ImportError(f"Importing '{name}' is not allowed in Python Script nodes. "
+                      f"Allowed modules: {', '.join(sorted(ALLOWED_SCRIPT_MODULES))}.")
+
+
+def script_globals_for(variables, input_value):
+    """
+    Builds the globals a script runs with.
+
+    Args:
+        variables (dict): The global variables exposed to the script.
+        input_value: The INPUT value.
+
+    Returns:
+        dict: The variables plus INPUT, output, `np` (unless a variable of
+              that name exists) and the restricted builtins.
+    """
+    script_globals = {'np': np}
+    script_globals.update(variables)
+    script_globals['INPUT'] = input_value
+    script_globals['output'] = None
+    script_globals['__builtins__'] = dict(SCRIPT_BUILTINS)
+    return script_globals
+
+
+# The builtins available to scripts, shared by inline and worker execution.
+SCRIPT_BUILTINS = {
+    '__import__': _script_import,
+    'abs': abs, 'all': all, 'any': any, 'bool': bool, 'dict': dict,
+    'float': float, 'int': int, 'len': len, 'list': list, 'max': max,
+    'min': min, 'pow': pow, 'range': range, 'round': round, 'set': set,
+    'str': str, 'sum': sum, 'tuple': tuple, 'True': True, 'False': False,
+    'None': None
+}
+
+
+class SharedArray:
+    """
+    A picklable reference to a NumPy array stored in a shared-memory block.
+
+    Attributes:
+        name (str): The shared-memory block name.
+        shape (tuple): The array shape.
+        dtype (str): The array dtype string.
+    """
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+def pack_value(value, blocks):
+    """
+    Replaces a large NumPy array by a SharedArray; other values pass through.
+
+    Args:
+        value: The value to send.
+        blocks (list): Receives the SharedMemory blocks created; the caller
+                       must close and unlink them once the receiver is done.
+
+    Returns:
+        The value, or a SharedArray referencing a copy of it.
+    """
+    if not isinstance(value, np.ndarray) or value.nbytes < SHARED_MEMORY_THRESHOLD or value.dtype.hasobject:
+        return value
+    block = shared_memory.SharedMemory(create=True, size=value.nbytes)
+    blocks.append(block)
+    np.ndarray(value.shape, dtype=value.dtype, buffer=block.buf)[...] = value
+    return SharedArray(block.name, value.shape, value.dtype.str)
+
+
+def unpack_value(value, blocks, copy=False):
+    """
+    Rebuilds an array from a SharedArray; other values pass through.
+
+    Args:
+        value: The received value.
+        blocks (list): Receives the attached SharedMemory blocks; the caller
+                       must close them when the arrays are no longer used.
+        copy (bool, optional): True to return a private copy of the data.
+
+    Returns:
+        The value, or a NumPy array.
+    """
+    if not isinstance(value, SharedArray):
+        return value
+    block = shared_memory.SharedMemory(name=value.name)
+    blocks.append(block)
+    array = np.ndarray(value.shape, dtype=np.dtype(value.dtype), buffer=block.buf)
+    return array.copy() if copy else array
+
+
+def release_blocks(blocks, unlink=False):
+    """
+    Closes (and optionally unlinks) shared-memory blocks.
+
+    Args:
+        blocks (list): The blocks to release.
+        unlink (bool, optional): True for the creating side, to free the memory.
+    """
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # An array still references the block; it is freed with the process.
+            pass
+        if unlink:
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+    blocks.clear()
+
+
+# Per-process cache of compiled scripts, keyed by source text.
+_compiled_scripts = {}
+
+
+def run_script(source, label, input_value, shared_values, writable_keys):
+    """
+    Executes a Python Script node in a worker process.
+
+    Args:
+        source (str): The script text.
+        label (str): The node label, used in tracebacks.
+        input_value: The packed INPUT value.
+        shared_values (dict): The packed global variables the script references.
+        writable_keys (list): The variables whose new values are sent back.
+
+    Returns:
+        tuple: (output, updates, names) with the packed 'output' value, a dict
+               of packed new values for `writable_keys`, and the names of the
+               shared-memory blocks created for them, which the caller unlinks.
+    """
+    code = _compiled_scripts.get(source)
+    if code is None:
+        code = _compiled_scripts[source] = compile(source, f"<script {label}>", "exec")
+
+    received = []
+    try:
+        variables = {}
+        for key, value in shared_values.items():
+            value = unpack_value(value, received)
+            if key not in writable_keys and isinstance(value, np.ndarray):
+                # Like inline execution, only unwrapped variables may be modified.
+                value.flags.writeable = False
+            variables[key] = value
+        value = None
+        script_globals = script_globals_for(variables, unpack_value(input_value, received))
+        del variables
+        exec(code, script_globals)
+
+        created = []
+        output = pack_value(script_globals.get('output'), created)
+        updates = {key: pack_value(script_globals.get(key), created) for key in writable_keys}
+        names = [block.name for block in created]
+        # The receiver attaches by name; closing here keeps the memory alive until it unlinks.
+        release_blocks(created)
+        del script_globals
+        return output, updates, names
+    finally:
+        release_blocks(received)
+
+
+def _warm_up():
+    """Imports NumPy in a fresh worker so the first real script starts fast."""
+    return os.getpid()
+
+
+class ScriptProcessPool:
+    """
+    A persistent pool of worker processes for Python Script nodes.
+
+    Worker processes are started on first use (or by `warm_up`) and kept
+    alive, so later scripts do not pay the process start-up cost.
+
+    Attributes:
+        max_workers (int): The number of worker processes.
+    """
+    def __init__(self, max_workers=None):
+        """
+        Initializes the pool without starting any process.
+
+        Args:
+            max_workers (int, optional): The number of worker processes.
+                                         Defaults to the CPU count minus one, at most 4.
+        """
+        self.max_workers = max_workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._executor = None
+
+    def _get_executor(self):
+        """Returns the executor, creating it on first use."""
+        if self._executor is None:
+            # 'spawn' avoids forking a process that runs Qt and asyncio threads.
+            context = multiprocessing.get_context("spawn")
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            logging.info(f"Started a pool of {self.max_workers} script worker processes.")
+        return self._executor
+
+    def warm_up(self):
+        """Starts all worker processes in the background."""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_warm_up)
+
+    async def run(self, source, label, input_value, variables, writable_keys):
+        """
+        Runs a script in a worker process and awaits its results.
+
+        Args:
+            source (str): The script text.
+            label (str): The node label, used in tracebacks.
+            input_value: The INPUT value.
+            variables (dict): The global variables the script references.
+            writable_keys (set): The variables whose new values are returned.
+
+        Returns:
+            tuple: (output, updates) with the script's 'output' value and a
+                   dict of the new values of `writable_keys`.
+        """
+        sent = []
+        try:
+            packed_input = pack_value(input_value, sent)
+            packed_variables = {key: pack_value(value, sent) for key, value in variables.items()}
+            for attempt in range(2):
+                executor = self._get_executor()
+                try:
+                    future = executor.submit(
+                        run_script, source, label, packed_input, packed_variables, list(writable_keys))
+                    try:
+                        output, updates, names = await asyncio.wrap_future(future)
+                    except asyncio.CancelledError:
+                        if not future.cancel():
+                            # The script is already running; free its results when it finishes.
+                            future.add_done_callback(_discard_result)
+                        raise
+                    break
+                except BrokenProcessPool:
+                    # A worker died (e.g. a crash in native code); start a fresh pool.
+                    self._reset_executor(executor)
+                    if attempt:
+                        raise
+                    logging.warning(f"Script worker pool broke while running '{label}'. Restarting it and retrying once.")
+        finally:
+            release_blocks(sent, unlink=True)
+
+        received = []
+        try:
+            output = unpack_value(output, received, copy=True)
+            updates = {key: unpack_value(value, received, copy=True) for key, value in updates.items()}
+        finally:
+            release_blocks(received)
+            for name in names:
+                _unlink_block(name)
+        return output, updates
+
+    def _reset_executor(self, executor):
+        """Discards a broken executor so the next call creates a new one."""
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Stops the worker processes without waiting for running scripts."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def _discard_result(future):
+    """Frees the shared memory of a script result nobody is waiting for."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    for name in future.result()[2]:
+        _unlink_block(name)
+
+
+def _unlink_block(name):
+    """Frees a shared-memory block created by a worker."""
+    try:
+        block = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    block.close()
+    block.unlink()
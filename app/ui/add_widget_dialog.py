@@ -10,6 +10,12 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QComboBox,
 from PyQt6.QtCore import pyqtSignal
 from .error_dialog import show_error_message
 
+# Widget types that monitor their node through a subscription, and the update
+# rates (ms) offered for them. Plotters default to a faster rate and deeper queue.
+SUBSCRIBED_WIDGET_TYPES = ["Numerical Display", "Text Display", "Switch", "Plotter"]
+UPDATE_RATES = [10, 50, 100, 250, 500, 1000, 5000]
+DEFAULT_SUBSCRIPTION_OPTIONS = {"Plotter": (100, 10)}
+
 class AddWidgetDialog(QDialog):
     """
     A dialog for users to add a new widget or edit an existing one.
@@ -85,6 +91,22 @@ class AddWidgetDialog(QDialog):
         self.buffer_size_input.setPlaceholderText("e.g., 100")
         self.form_layout.addRow(self.buffer_size_label, self.buffer_size_input)
 
+        self.extra_identifiers_label = QLabel("Overlay Node IDs:")
+        self.extra_identifiers_input = QLineEdit()
+        self.extra_identifiers_input.setPlaceholderText("Optional, comma-separated, e.g., ns=2;i=1235, ns=2;i=1236")
+        self.form_layout.addRow(self.extra_identifiers_label, self.extra_identifiers_input)
+
+        self.update_rate_label = QLabel("Update Rate:")
+        self.update_rate_combo = QComboBox()
+        for rate in UPDATE_RATES:
+            self.update_rate_combo.addItem(f"{rate} ms", rate)
+        self.form_layout.addRow(self.update_rate_label, self.update_rate_combo)
+
+        self.queue_size_label = QLabel("Queue Size:")
+        self.queue_size_input = QLineEdit()
+        self.queue_size_input.setPlaceholderText("Samples buffered on the server between updates, e.g., 1")
+        self.form_layout.addRow(self.queue_size_label, self.queue_size_input)
+
         layout.addLayout(self.form_layout)
 
         # --- Dialog Buttons ---
@@ -94,6 +116,8 @@ class AddWidgetDialog(QDialog):
         layout.addWidget(button_box)
 
         self.widget_type_combo.currentTextChanged.connect(self.update_form)
+        self.widget_type_combo.currentTextChanged.connect(self.reset_subscription_options)
+        self.reset_subscription_options(self.widget_type_combo.currentText())
 
         if self.is_edit_mode:
             self.populate_form(self.config_to_edit)
@@ -145,10 +169,17 @@ class AddWidgetDialog(QDialog):
         is_sequence = (widget_type == "Sequence Button")
         is_plotter = (widget_type == "Plotter")
         is_standard_node = not is_button and not is_sequence and not is_plotter
+        is_subscribed = widget_type in SUBSCRIBED_WIDGET_TYPES
 
         # Toggle visibility based on widget type
         self.buffer_size_label.setVisible(is_plotter)
         self.buffer_size_input.setVisible(is_plotter)
+        self.extra_identifiers_label.setVisible(is_plotter)
+        self.extra_identifiers_input.setVisible(is_plotter)
+        self.update_rate_label.setVisible(is_subscribed)
+        self.update_rate_combo.setVisible(is_subscribed)
+        self.queue_size_label.setVisible(is_subscribed)
+        self.queue_size_input.setVisible(is_subscribed)
 
         self.method_bname_label.setVisible(is_button)
         self.method_bname_input.setVisible(is_button)
@@ -167,6 +198,31 @@ class AddWidgetDialog(QDialog):
         else:
             self.identifier_label.setText("Node ID:")
 
+    def reset_subscription_options(self, widget_type):
+        """
+        Resets the update rate and queue size fields to the defaults of a widget type.
+
+        Args:
+            widget_type (str): The selected widget type.
+        """
+        rate, queue_size = DEFAULT_SUBSCRIPTION_OPTIONS.get(widget_type, (500, 1))
+        self.set_subscription_options(rate, queue_size)
+
+    def set_subscription_options(self, rate, queue_size):
+        """
+        Sets the update rate and queue size fields.
+
+        Args:
+            rate (int): The update rate in milliseconds.
+            queue_size (int): The monitored item queue size.
+        """
+        index = self.update_rate_combo.findData(rate)
+        if index < 0:
+            self.update_rate_combo.addItem(f"{rate} ms", rate)
+            index = self.update_rate_combo.count() - 1
+        self.update_rate_combo.setCurrentIndex(index)
+        self.queue_size_input.setText(str(queue_size))
+
     def populate_form(self, config):
         """
         Fills the form with data from an existing widget's configuration.
@@ -181,6 +237,10 @@ class AddWidgetDialog(QDialog):
         self.identifier_input.setText(config.get("identifier", ""))
         self.sequence_name_input.setText(config.get("sequence_name", ""))
         self.buffer_size_input.setText(str(config.get("buffer_size", 100)))
+        self.extra_identifiers_input.setText(", ".join(config.get("extra_identifiers", [])))
+        default_rate, default_queue_size = DEFAULT_SUBSCRIPTION_OPTIONS.get(config.get("widget_type"), (500, 1))
+        self.set_subscription_options(config.get("publishing_interval", default_rate),
+                                      config.get("queue_size", default_queue_size))
 
         if self.is_from_tree:
             self.identifier_input.setReadOnly(True)
@@ -217,5 +277,11 @@ class AddWidgetDialog(QDialog):
             config["has_argument"] = self.has_argument_checkbox.isChecked()
         elif widget_type == "Plotter":
             config["buffer_size"] = int(self.buffer_size_input.text()) if self.buffer_size_input.text().isdigit() else 100
+            config["extra_identifiers"] = [i.strip() for i in self.extra_identifiers_input.text().split(",") if i.strip()]
+
+        if widget_type in SUBSCRIBED_WIDGET_TYPES:
+            config["publishing_interval"] = self.update_rate_combo.currentData()
+            queue_size = self.queue_size_input.text()
+            config["queue_size"] = max(1, int(queue_size)) if queue_size.isdigit() else 1
 
         return config
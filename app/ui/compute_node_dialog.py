@@ -2,10 +2,23 @@
 Provides a configuration dialog for the Compute Node in the sequencer.
 
 This module contains the ComputeNodeDialog class, which allows users to
-input a Python expression to be evaluated by a ComputeNode.
+input a Python expression to be evaluated by a ComputeNode, either on single
+values or, in vectorized mode, on whole arrays.
 """
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLineEdit,
-                             QDialogButtonBox, QLabel)
+                             QDialogButtonBox, QLabel, QComboBox)
+from app.core.expressions import expression_cache
+from app.core.array_expressions import COMPUTE_MODES, COMPUTE_MODE_SCALAR, COMPUTE_MODE_VECTORIZED
+
+_MODE_HELP = {
+    COMPUTE_MODE_SCALAR: "Use 'A', 'B', and 'C' as variables from the data inputs.\n"
+                         "The expression should evaluate to a single value.\n"
+                         "Example: (A * 2) + B > C",
+    COMPUTE_MODE_VECTORIZED: "Use 'A', 'B', and 'C' as variables from the data inputs; lists\n"
+                             "are converted to NumPy arrays and 'np' offers common NumPy functions.\n"
+                             "The expression may evaluate to an array or a single value.\n"
+                             "Example: np.where(A > C, A - B, 0)[10:]",
+}
 
 class ComputeNodeDialog(QDialog):
     """
@@ -32,18 +45,27 @@ class ComputeNodeDialog(QDialog):
         layout = QVBoxLayout(self)
         form_layout = QFormLayout()
 
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems(COMPUTE_MODES)
+        self.mode_combo.setToolTip("Vectorized mode evaluates the expression once over whole arrays.")
+
         # Add a label explaining how to use the inputs
-        info_label = QLabel("Use 'A', 'B', and 'C' as variables from the data inputs.\n"
-                            "The expression should evaluate to a single value.\n"
-                            "Example: (A * 2) + B > C")
-        info_label.setWordWrap(True)
+        self.info_label = QLabel()
+        self.info_label.setWordWrap(True)
 
         self.expression_input = QLineEdit()
         self.expression_input.setPlaceholderText("e.g., A - B == 5")
         self.expression_input.setStyleSheet("font-family: Consolas, Courier New, monospace;")
 
-        form_layout.addRow(info_label)
+        self.error_label = QLabel()
+        self.error_label.setWordWrap(True)
+        self.error_label.setStyleSheet("color: #e06c75;")
+        self.error_label.hide()
+
+        form_layout.addRow("Mode:", self.mode_combo)
+        form_layout.addRow(self.info_label)
         form_layout.addRow("Expression:", self.expression_input)
+        form_layout.addRow(self.error_label)
 
         layout.addLayout(form_layout)
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -52,19 +74,47 @@ class ComputeNodeDialog(QDialog):
         layout.addWidget(button_box)
 
         # Load existing settings
+        self.mode_combo.currentTextChanged.connect(self.update_help)
+        self.mode_combo.setCurrentText(self.config.get('mode', COMPUTE_MODE_SCALAR))
+        self.update_help()
         self.expression_input.setText(self.config.get('expression', ''))
+        self.expression_input.textChanged.connect(self.validate_expression)
+        self.validate_expression()
+
+    def update_help(self):
+        """Shows the usage hint of the selected mode."""
+        self.info_label.setText(_MODE_HELP[self.mode_combo.currentText()])
+
+    def validate_expression(self):
+        """
+        Compiles the expression and shows the syntax error, if any.
+
+        Returns:
+            bool: True if the expression is empty or valid.
+        """
+        expression = self.expression_input.text()
+        error = expression_cache.validate(expression) if expression.strip() else None
+        self.error_label.setText(error or "")
+        self.error_label.setVisible(bool(error))
+        return error is None
+
+    def accept(self):
+        """Accepts the dialog only if the expression compiles."""
+        if self.validate_expression():
+            super().accept()
 
     def get_config(self):
         """
         Retrieves the updated configuration from the dialog.
 
-        This method reads the text from the expression input field, updates
-        the configuration dictionary, and also generates a descriptive label
+        This method reads the mode and the expression, updates the
+        configuration dictionary, and also generates a descriptive label
         for the node based on a snippet of the expression.
 
         Returns:
             dict: The updated configuration dictionary for the ComputeNode.
         """
+        self.config['mode'] = self.mode_combo.currentText()
         self.config['expression'] = self.expression_input.text()
         # Update the node's label to show a snippet of the expression
         expr_snippet = self.config['expression']
@@ -7,6 +7,7 @@ traversed. It supports both simple comparisons and complex Python expressions.
 """
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QComboBox,
                              QLineEdit, QDialogButtonBox, QWidget, QLabel)
+from app.core.expressions import expression_cache
 
 class ConditionDialog(QDialog):
     """
@@ -92,8 +93,14 @@ class ConditionDialog(QDialog):
         self.expression_input = QLineEdit()
         self.expression_input.setPlaceholderText("e.g., INPUT > 10 and INPUT < 20")
         self.expression_input.setStyleSheet("font-family: Consolas, Courier New, monospace;")
+        self.error_label = QLabel()
+        self.error_label.setWordWrap(True)
+        self.error_label.setStyleSheet("color: #e06c75;")
+        self.error_label.hide()
+        self.expression_input.textChanged.connect(self.validate_expression)
         expr_layout.addWidget(info_label)
         expr_layout.addWidget(self.expression_input)
+        expr_layout.addWidget(self.error_label)
 
     def update_ui(self):
         """
@@ -105,6 +112,29 @@ class ConditionDialog(QDialog):
         self.expression_widget.setVisible(not is_simple)
         if is_simple:
             self._update_simple_ui()
+        else:
+            self.validate_expression()
+
+    def validate_expression(self):
+        """
+        Compiles the custom expression and shows the syntax error, if any.
+
+        Returns:
+            bool: True if the dialog is in simple mode or the expression is
+                  empty or valid.
+        """
+        expression = self.expression_input.text()
+        error = None
+        if self.mode_combo.currentText() == "Custom Expression" and expression.strip():
+            error = expression_cache.validate(expression)
+        self.error_label.setText(error or "")
+        self.error_label.setVisible(bool(error))
+        return error is None
+
+    def accept(self):
+        """Accepts the dialog only if a custom expression compiles."""
+        if self.validate_expression():
+            super().accept()
 
     def _update_simple_ui(self):
         """
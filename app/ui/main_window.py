@@ -17,16 +17,20 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLi
                              QInputDialog, QSizePolicy, QMenuBar, QDialog, QFormLayout, 
                              QDialogButtonBox, QCheckBox)
 from PyQt6.QtGui import QAction, QIcon, QPainter, QPen, QColor, QKeySequence, QCursor, QPixmap
-from PyQt6.QtCore import pyqtSignal, QObject, Qt, QSize, QTimer, QSettings, QPoint, QLine
+from PyQt6.QtCore import pyqtSignal, QObject, Qt, QSize, QTimer, QSettings, QPoint, QLine, QStandardPaths
 
 # --- Local Imports ---
 from app.utils.paths import resource_path
 from app.core.opcua_logic import OpcuaClientLogic
+from app.core.execution_plan import ExecutionPlanCache
+from app.core.mysql_manager import MySQLConnectionPool, MySQLWriteBuffer, MySQLTaskRunner
+from app.core.mysql_spool import MySQLSpool
+from app.core.script_worker import ScriptProcessPool
 from app.ui.add_widget_dialog import AddWidgetDialog
 from app.utils.logger import LogWidget, QtLogHandler
 from app.ui.error_dialog import show_error_message, show_info_message
 from app.ui.server_tree import ServerTreeView
-from app.ui.sequencer_editor import SequenceEditor, SequenceEngine
+from app.ui.sequencer_editor import SequenceEditor, SequenceEngine, ExecutionProfile
 from app.ui.sequence_tree import SequenceTreeView
 from app.ui.settings_dialog import SettingsDialog
 from app.ui.widgets.sequence_widget import SequenceWidget
@@ -38,6 +42,7 @@ from app.ui.widgets.switch_widget import SwitchWidget
 from app.ui.widgets.input_widget import InputWidget
 from app.ui.widgets.button_widget import ButtonWidget
 from app.ui.widgets.plotter_widget import PlotterWidget
+from app.ui.widgets.update_dispatcher import UpdateDispatcher, DEFAULT_FRAME_RATE
 from app.ui.global_variables_widget import GlobalVariablesWidget
 
 class ServerSettingsDialog(QDialog):
@@ -345,6 +350,9 @@ class MainWindow(QMainWindow):
         self.opcua_logic = OpcuaClientLogic()
         self.opcua_logic.connection_lost_callback = self.on_connection_lost
         self.async_runner = AsyncRunner()
+        # Coalesces subscription updates of dashboard widgets into UI ticks.
+        app_settings = QSettings("MyCompany", "NodeFlow")
+        self.update_dispatcher = UpdateDispatcher(app_settings.value("ui_frame_rate", DEFAULT_FRAME_RATE, type=int), self)
         self.pages = []
         self.current_page_index = -1
         self.sequences = {}
@@ -365,6 +373,15 @@ class MainWindow(QMainWindow):
         # The engine is now created on-demand for each run.
         # This dictionary holds all currently running sequence engines.
         self.running_sequences = {}
+        # Compiled execution plans, shared by all engines and rebuilt only on edit.
+        self.plan_cache = ExecutionPlanCache()
+        # Persistent MySQL connections, shared by all engines and configured from settings.
+        self.mysql_pool = MySQLConnectionPool.from_settings(app_settings)
+        self.mysql_writer = MySQLWriteBuffer(self.mysql_pool)
+        self.mysql_runner = MySQLTaskRunner.from_settings(self.mysql_pool, app_settings)
+        self._attach_mysql_spool()
+        # Worker processes for Python Script nodes, shared by all engines and started on first use.
+        self.script_pool = ScriptProcessPool()
         # Central key-value store for the entire project.
         self.global_variables = {}
 
@@ -578,6 +595,7 @@ class MainWindow(QMainWindow):
         self.add_new_sequence("Default Sequence")
         self.open_sequence_in_tab("Default Sequence")
         self.current_project_path = None
+        self._attach_mysql_spool()
         self.project_is_active = True
         self.set_project_dirty(False)
         self.update_window_title()
@@ -595,6 +613,7 @@ class MainWindow(QMainWindow):
             
             # --- FEATURE: GLOBAL VARIABLES ---
             self.global_variables.clear()
+            self.plan_cache.clear()
 
             self.clear_all_pages()
             self.close_all_sequence_tabs()
@@ -628,6 +647,7 @@ class MainWindow(QMainWindow):
 
                 self.go_to_page(0)
                 self.current_project_path = file_path
+                self._attach_mysql_spool()
                 logging.info(f"Project loaded from {file_path}")
                 self.add_to_recent_projects(file_path)
                 self.project_is_active = True
@@ -648,6 +668,25 @@ class MainWindow(QMainWindow):
                 show_error_message("File Load Error", "The selected project file could not be loaded.", str(e))
                 self.show_start_page()
 
+    def _mysql_spool_path(self):
+        """Returns the spool file for the current project, next to the project file."""
+        if self.current_project_path:
+            return os.path.splitext(self.current_project_path)[0] + ".mysql_spool.sqlite"
+        data_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        return os.path.join(data_dir, "mysql_spool.sqlite")
+
+    def _attach_mysql_spool(self):
+        """Points the MySQL write buffer at the current project's outage spool."""
+        path = self._mysql_spool_path()
+        current = self.mysql_writer.spool
+        if current is not None and os.path.abspath(current.path) == os.path.abspath(path):
+            return
+        try:
+            self.mysql_writer.set_spool(MySQLSpool(path))
+        except Exception as e:
+            logging.error(f"Could not open the MySQL spool '{path}': {e}. Writes during outages stay in memory.")
+            self.mysql_writer.set_spool(None)
+
     def save_project(self):
         if self.current_project_path:
             return self._save_to_path(self.current_project_path)
@@ -658,6 +697,7 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Project As", "", "Project Files (*.json)")
         if file_path:
             self.current_project_path = file_path
+            self._attach_mysql_spool()
             return self._save_to_path(file_path)
         return False
 
@@ -842,8 +882,13 @@ class MainWindow(QMainWindow):
                 QPushButton:disabled { background-color: #2b2b2b; border: 1px solid #444; }
             """)
 
+        self.profile_selector = QComboBox()
+        self.profile_selector.addItems([profile.value for profile in ExecutionProfile])
+        self.profile_selector.setToolTip("Execution Profile: Visual animates each step, Fast skips pacing, Headless also skips highlighting")
+
         # Add buttons to the layout
         sequencer_toolbar.addStretch()
+        sequencer_toolbar.addWidget(self.profile_selector)
         sequencer_toolbar.addWidget(self.run_button)
         sequencer_toolbar.addWidget(self.continue_button)
         sequencer_toolbar.addWidget(self.step_over_button)
@@ -1149,6 +1194,7 @@ class MainWindow(QMainWindow):
             self.async_runner.submit(self.disconnect())
         
         self.current_project_path = None
+        self._attach_mysql_spool()
         self.project_is_active = False
         self.title_bar.title_label.setText("NodeFlow")
         self.show_start_page()
@@ -1222,6 +1268,10 @@ class MainWindow(QMainWindow):
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        self.mysql_runner.shutdown()
+        self.script_pool.shutdown()
+        await asyncio.to_thread(self.mysql_writer.close)
+        self.mysql_pool.close_all()
         logging.shutdown()
         QApplication.instance().quit()
 
@@ -1336,6 +1386,7 @@ class MainWindow(QMainWindow):
             return
         current_grid = self.dashboard_area.widget(self.current_page_index)
         new_widget = widget_class(config, self.opcua_logic, current_grid, self.async_runner)
+        new_widget.update_dispatcher = self.update_dispatcher
         
         if 'widget_state' in widget_data and hasattr(new_widget, 'restore_state'):
             new_widget.restore_state(widget_data['widget_state'])
@@ -1515,6 +1566,7 @@ class MainWindow(QMainWindow):
             show_error_message("Error", f"A sequence named '{new_name}' already exists.")
             return
         self.sequences[new_name] = self.sequences.pop(old_name)
+        self.plan_cache.invalidate(old_name)
         if old_name in self.open_sequence_editors:
             editor = self.open_sequence_editors.pop(old_name)
             self.open_sequence_editors[new_name] = editor
@@ -1539,17 +1591,19 @@ class MainWindow(QMainWindow):
                         self.close_sequence_tab(i)
                         break
             del self.sequences[name]
+            self.plan_cache.invalidate(name)
             self._update_sequence_list()
             self.set_project_dirty(True)
 
-    def run_sequence_by_name(self, name, is_loop):
+    def run_sequence_by_name(self, name, is_loop, profile=None):
         if name in self.running_sequences:
             show_error_message("Already Running", f"Sequence '{name}' is already running.")
             return
 
         active_editor = self.open_sequence_editors.get(name)
         if active_editor:
-            data = active_editor.serialize()
+            # Unchanged since the last run: the same dict, so the cached plan is reused.
+            data = active_editor.snapshot()
             self.sequences[name] = data # Ensure latest version is saved
         elif name in self.sequences:
             data = self.sequences[name]
@@ -1563,7 +1617,7 @@ class MainWindow(QMainWindow):
             self.tab_widget.setCurrentWidget(self.sequencer_tab_container)
         
         # --- Create a new engine for this run ---
-        engine = SequenceEngine(self.opcua_logic, self.async_runner, self.global_variables)
+        engine = SequenceEngine(self.opcua_logic, self.async_runner, self.global_variables, self.plan_cache, self.mysql_pool, self.mysql_writer, self.mysql_runner, self.script_pool)
         engine.execution_finished.connect(self.on_sequence_finished)
 
         # Connect UI update signals
@@ -1580,8 +1634,9 @@ class MainWindow(QMainWindow):
                 if isinstance(widget, SequenceWidget) and widget.sequence_name == name:
                     widget.set_running_state(True, is_loop)
         
-        engine.run(name, self.sequences, loop=is_loop)
-        logging.info(f"Started sequence '{name}' (Loop: {is_loop})")
+        profile = profile or self.profile_selector.currentText()
+        engine.run(name, self.sequences, loop=is_loop, profile=profile)
+        logging.info(f"Started sequence '{name}' (Loop: {is_loop}, Profile: {engine.profile.value})")
         self._set_running_toolbar_state()
 
     def stop_sequence_loop(self, name):
@@ -1710,7 +1765,11 @@ class MainWindow(QMainWindow):
 
     def open_application_settings_dialog(self):
         dialog = SettingsDialog(self)
-        dialog.exec()
+        if dialog.exec():
+            settings = QSettings("MyCompany", "NodeFlow")
+            self.update_dispatcher.set_frame_rate(settings.value("ui_frame_rate", DEFAULT_FRAME_RATE, type=int))
+            self.mysql_pool.configure_from_settings(settings)
+            self.mysql_runner.configure_from_settings(settings)
 
     def apply_theme(self, theme_name):
         style_sheet = ""
@@ -1750,11 +1809,19 @@ class MainWindow(QMainWindow):
             return
         editor = SequenceEditor(main_window=self, parent=self)
         editor.load_data(self.sequences[name])
+        editor.scene_changed.connect(lambda: self.invalidate_editor_plan(editor))
         index = self.sequence_tab_widget.addTab(editor, name)
         self.sequence_tab_widget.setCurrentIndex(index)
         self.open_sequence_editors[name] = editor
         self.on_sequence_tab_changed(index)
 
+    def invalidate_editor_plan(self, editor):
+        """Drops the cached execution plan of the sequence shown in an editor after an edit."""
+        for name, open_editor in self.open_sequence_editors.items():
+            if open_editor is editor:
+                self.plan_cache.invalidate(name)
+                break
+
     def close_sequence_tab(self, index):
         name = self.sequence_tab_widget.tabText(index)
         if name in self.open_sequence_editors:
@@ -5,10 +5,11 @@ This module contains the PythonScriptDialog, which embeds a QPlainTextEdit
 with a custom QSyntaxHighlighter for editing Python scripts within the application.
 """
 import sys
-from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QPlainTextEdit, QDialogButtonBox, QPushButton)
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QPlainTextEdit, QDialogButtonBox, QPushButton, QCheckBox)
 from PyQt6.QtCore import QRegularExpression
 from PyQt6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
 from .error_dialog import show_error_message, show_info_message
+from app.core.script_worker import ALLOWED_SCRIPT_MODULES
 
 from pygments import highlight
 from pygments.lexers.python import PythonLexer
@@ -105,7 +106,7 @@ class PythonScriptDialog(QDialog):
     and modifying Python scripts associated with a Python Script Node in the
     sequencer.
     """
-    def __init__(self, parent=None, script=""):
+    def __init__(self, parent=None, script="", run_in_process=False):
         """
         Initializes the PythonScriptDialog.
 
@@ -113,6 +114,8 @@ class PythonScriptDialog(QDialog):
             parent (QWidget, optional): The parent widget. Defaults to None.
             script (str, optional): The initial script text to load into the
                                     editor. Defaults to "".
+            run_in_process (bool, optional): The initial state of the "Run in
+                                             worker process" option. Defaults to False.
         """
         super().__init__(parent)
         self.setWindowTitle("Python Script Node")
@@ -131,6 +134,15 @@ class PythonScriptDialog(QDialog):
 
         layout.addWidget(self.editor)
 
+        self.run_in_process_checkbox = QCheckBox("Run in worker process")
+        self.run_in_process_checkbox.setToolTip(
+            "Runs the script in a separate process so long computations do not block\n"
+            "the user interface or other sequences. INPUT, output and the variables the\n"
+            "script uses must be picklable; large NumPy arrays are passed via shared memory.\n"
+            "Scripts can use NumPy as 'np' and import: " + ", ".join(sorted(ALLOWED_SCRIPT_MODULES)) + ".")
+        self.run_in_process_checkbox.setChecked(run_in_process)
+        layout.addWidget(self.run_in_process_checkbox)
+
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         
         # --- FEATURE: VERIFY SCRIPT ---
@@ -161,3 +173,12 @@ class PythonScriptDialog(QDialog):
             str: The Python script as a string.
         """
         return self.editor.toPlainText()
+
+    def is_run_in_process(self):
+        """
+        Tells whether the script should run in a worker process.
+
+        Returns:
+            bool: True if "Run in worker process" is checked.
+        """
+        return self.run_in_process_checkbox.isChecked()
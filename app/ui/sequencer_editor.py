@@ -11,16 +11,20 @@ This module contains all the components required for the sequencer UI, including
 """
 import logging
 import asyncio
+import time
 import uuid
 import copy
+import math
+import operator
 from enum import Enum
+import numpy as np
 from PyQt6.QtWidgets import (QGraphicsView, QGraphicsScene, QGraphicsObject, QGraphicsTextItem,
-                             QStyleOptionGraphicsItem, QWidget, QGraphicsPathItem, QStyle,
+                             QStyleOptionGraphicsItem, QWidget, QGraphicsPathItem, QStyle, QGraphicsItem,
                              QInputDialog, QLineEdit, QDialog, QFormLayout, QDialogButtonBox, QVBoxLayout, QMenu,
-                             QComboBox, QGraphicsProxyWidget, QToolTip, QColorDialog, QPushButton, QTextEdit, QMessageBox, QLabel, QHBoxLayout, QRadioButton, QButtonGroup)
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal, QObject, QPropertyAnimation
+                             QComboBox, QGraphicsProxyWidget, QToolTip, QColorDialog, QPushButton, QTextEdit, QMessageBox, QLabel, QHBoxLayout, QRadioButton, QButtonGroup, QCheckBox, QSpinBox)
+from PyQt6.QtCore import Qt, QRectF, QPointF, QSize, pyqtSignal, QObject, QPropertyAnimation, QTimer
 from PyQt6.QtGui import (QPainter, QColor, QBrush, QPen, QPainterPath, QKeyEvent,
-                         QPainterPathStroker, QUndoCommand, QUndoStack, QFont, QTransform, QAction, QIcon)
+                         QPainterPathStroker, QUndoCommand, QUndoStack, QFont, QTransform, QAction, QIcon, QPolygonF, QPixmap)
 
 # --- Local Imports ---
 from .condition_dialog import ConditionDialog
@@ -30,7 +34,12 @@ from .error_dialog import show_error_message
 from app.ui.widgets.find_widget import FindWidget
 from app.utils.paths import resource_path
 from .python_script_dialog import PythonScriptDialog
-from app.core.mysql_manager import MySQLManager
+from app.core.mysql_manager import MySQLManager, MySQLConnectionPool, MySQLWriteBuffer, MySQLTaskRunner, infer_column_type
+from app.core.execution_plan import ExecutionPlanCache
+from app.core.result_sets import OUTPUT_FORMATS, OUTPUT_ROWS, materialize
+from app.core.expressions import expression_cache, script_cache
+from app.core.script_worker import ScriptProcessPool, script_globals_for
+from app.core.array_expressions import COMPUTE_MODE_VECTORIZED, VECTORIZED_GLOBALS, as_array_input, to_output
 from PyQt6.QtCore import QSettings
 
 class VariableNodeDialog(QDialog):
@@ -84,6 +93,25 @@ class MySQLReadNodeDialog(QDialog):
         self.query_input = QTextEdit(self.config.get('query', ''))
         self.form_layout.addRow(QLabel("SELECT Query:"), self.query_input)
 
+        self.output_format_combo = QComboBox()
+        self.output_format_combo.addItems(OUTPUT_FORMATS)
+        self.output_format_combo.setCurrentText(self.config.get('output_format', OUTPUT_ROWS))
+        self.form_layout.addRow(QLabel("Result Format:"), self.output_format_combo)
+
+        self.stream_checkbox = QCheckBox("Fetch one chunk per execution")
+        self.stream_checkbox.setToolTip("Each run of the node outputs the next chunk of rows and returns True,\n"
+                                        "or False once all rows were read. Use it as the input of a While Loop\n"
+                                        "('is' True) to process large results with constant memory.")
+        self.stream_checkbox.setChecked(self.config.get('stream', False))
+        self.form_layout.addRow(QLabel("Streaming:"), self.stream_checkbox)
+
+        self.chunk_size_spinbox = QSpinBox()
+        self.chunk_size_spinbox.setRange(1, 1000000)
+        self.chunk_size_spinbox.setValue(self.config.get('chunk_size', 1000))
+        self.chunk_size_spinbox.setEnabled(self.stream_checkbox.isChecked())
+        self.stream_checkbox.toggled.connect(self.chunk_size_spinbox.setEnabled)
+        self.form_layout.addRow(QLabel("Rows per Chunk:"), self.chunk_size_spinbox)
+
         self.layout.addLayout(self.form_layout)
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -93,6 +121,9 @@ class MySQLReadNodeDialog(QDialog):
 
     def get_config(self):
         self.config['query'] = self.query_input.toPlainText()
+        self.config['output_format'] = self.output_format_combo.currentText()
+        self.config['stream'] = self.stream_checkbox.isChecked()
+        self.config['chunk_size'] = self.chunk_size_spinbox.value()
         self.config['label'] = f"Read: {self.config['query'][:20]}..."
         return self.config
 
@@ -277,6 +308,81 @@ class DebugState(Enum):
     RUNNING = 1
     PAUSED = 2
 
+class ExecutionProfile(Enum):
+    """
+    Controls the visual pacing and UI feedback of a sequence run.
+
+    - VISUAL: Animated execution with pauses between steps for highlighting.
+    - FAST: No pacing; node/connection highlights are coalesced to the UI frame rate.
+    - HEADLESS: No pacing and no highlighting at all, for production cycles.
+    """
+    VISUAL = "Visual"
+    FAST = "Fast"
+    HEADLESS = "Headless"
+
+# Seconds to pause at each pacing point of the engine, per execution profile.
+EXECUTION_PROFILE_PACING = {
+    ExecutionProfile.VISUAL: {'connection_idle': 0.1, 'node_finished': 0.2, 'connection_active': 0.2, 'loop_cycle': 0.5, 'while_iteration': 0.01},
+    ExecutionProfile.FAST: {'connection_idle': 0, 'node_finished': 0, 'connection_active': 0, 'loop_cycle': 0, 'while_iteration': 0},
+    ExecutionProfile.HEADLESS: {'connection_idle': 0, 'node_finished': 0, 'connection_active': 0, 'loop_cycle': 0, 'while_iteration': 0},
+}
+
+# Evaluation namespaces for Compute node and condition expressions. They are
+# shared between evaluations; `eval` does not modify a globals dict that
+# already defines __builtins__.
+_COMPUTE_GLOBALS = {"__builtins__": None}
+_CONDITION_GLOBALS = {"__builtins__": {}}
+
+_COMPARISON_OPERATORS = {"==": operator.eq, "!=": operator.ne, ">": operator.gt,
+                         "<": operator.lt, ">=": operator.ge, "<=": operator.le}
+
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+# The dot grid is hidden below this zoom level, where it would only add noise.
+GRID_MIN_LOD = 0.4
+# Below this zoom level nodes and connections are drawn simplified and text is skipped.
+DETAIL_MIN_LOD = 0.5
+# How often connection paths are rebuilt while nodes are being dragged (about 60 fps).
+PATH_REFRESH_INTERVAL_MS = 16
+# How often the minimap re-renders changed parts of the scene, and how many
+# separate changed regions it tracks before merging them into one.
+MINIMAP_REFRESH_INTERVAL_MS = 250
+MINIMAP_MAX_DIRTY_RECTS = 16
+# The largest side, in pixels, of the minimap's raster of the scene.
+MINIMAP_MAX_RASTER_SIZE = 2048
+# Grid points per side of the cached block the background is tiled with.
+_GRID_TILE_POINTS = 64
+
+def _isolated_value(value):
+    """
+    Returns a version of a global variable a script cannot modify in place.
+
+    Immutable values need no copy and NumPy arrays are exposed as read-only
+    views, so large arrays are shared instead of copied. Other values are
+    deep-copied.
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    return copy.deepcopy(value)
+
+def _value_changed(old, new):
+    """
+    Tells whether a script changed a variable's value.
+
+    Identical objects count as unchanged. Values whose comparison is not a
+    plain bool (e.g. NumPy arrays) count as changed.
+    """
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except (ValueError, TypeError):
+        return True
+
 class NodeType(Enum):
     """Defines the different types of nodes available in the sequencer."""
     METHOD_CALL = "Method Call"
@@ -295,6 +401,33 @@ class NodeType(Enum):
     PYTHON_SCRIPT = "Python Script"
     MYSQL_WRITE = "MySQL Write"
     MYSQL_READ = "MySQL Read"
+    BATCH_READ = "Batch Read"
+    BATCH_WRITE = "Batch Write"
+
+def level_of_detail(painter):
+    """
+    Returns the zoom level a graphics item is being painted at.
+
+    Args:
+        painter (QPainter): The painter passed to `paint`.
+
+    Returns:
+        float: 1.0 at 100% zoom, smaller when zoomed out.
+    """
+    return QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+
+class LodTextItem(QGraphicsTextItem):
+    """
+    A text item for titles and labels that is not drawn when zoomed out.
+
+    Text layout is the most expensive part of painting a node, and is
+    unreadable below DETAIL_MIN_LOD anyway.
+    """
+    def paint(self, painter, option, widget=None):
+        """Paints the text unless the view is zoomed out below DETAIL_MIN_LOD."""
+        if level_of_detail(painter) < DETAIL_MIN_LOD:
+            return
+        super().paint(painter, option, widget)
 
 class CommentNode(QGraphicsTextItem):
     """
@@ -497,6 +630,103 @@ class WriteValueDialog(QDialog):
         self.config['value_to_write'] = self.value_input.text()
         return self.config
 
+class BatchValueDialog(QDialog):
+    """
+    A dialog for configuring Batch Read and Batch Write nodes.
+
+    Nodes are entered one per line. For a Batch Write node each line has the
+    form `node_id = value`.
+    """
+    def __init__(self, parent=None, current_config=None, is_write=False):
+        """
+        Initializes the BatchValueDialog.
+
+        Args:
+            parent (QWidget, optional): The parent widget.
+            current_config (dict, optional): The existing node configuration.
+            is_write (bool, optional): True to configure a Batch Write node.
+        """
+        super().__init__(parent)
+        self.is_write = is_write
+        self.setWindowTitle("Configure Batch Write Node" if is_write else "Configure Batch Read Node")
+        self.config = current_config or {}
+        self.setMinimumWidth(400)
+        layout = QVBoxLayout(self)
+
+        if is_write:
+            lines = [f"{item['node_id']} = {item.get('value', '')}" for item in self.config.get('items', [])]
+            hint = ("One write per line as 'node_id = value' (e.g., ns=2;i=1234 = 12.5).\n"
+                    "A connected input providing a list (in line order) or a dict keyed by\n"
+                    "node ID overrides the static values.")
+        else:
+            lines = list(self.config.get('node_ids', []))
+            hint = "One Node ID per line (e.g., ns=2;i=1234). The output is a list of values in line order."
+
+        layout.addWidget(QLabel(hint))
+        self.items_input = QTextEdit("\n".join(lines))
+        layout.addWidget(self.items_input)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def get_config(self):
+        """
+        Retrieves the updated configuration from the dialog.
+
+        Returns:
+            dict: The updated configuration dictionary, or None if a line is invalid.
+        """
+        lines = [line.strip() for line in self.items_input.toPlainText().splitlines() if line.strip()]
+        if not self.is_write:
+            self.config['node_ids'] = lines
+            self.config['label'] = f"Batch Read ({len(lines)})"
+            return self.config
+
+        items = []
+        for line in lines:
+            node_id, separator, value = line.rpartition(" = ")
+            if not separator or not node_id.strip():
+                show_error_message("Configuration Error", f"Invalid line '{line}'. Expected 'node_id = value'.")
+                return None
+            items.append({'node_id': node_id.strip(), 'value': value.strip()})
+        self.config['items'] = items
+        self.config['label'] = f"Batch Write ({len(items)})"
+        return self.config
+
+def _paint_simplified_path(painter, pen, path):
+    """
+    Draws a connection as a thin straight line between its end points.
+
+    Args:
+        painter (QPainter): The painter passed to `paint`.
+        pen (QPen): The pen the full path would be drawn with; only its color is used.
+        path (QPainterPath): The connection path.
+    """
+    if path.elementCount() == 0:
+        return
+    start = path.elementAt(0)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+    painter.setPen(QPen(pen.color(), 0))
+    painter.drawLine(QPointF(start.x, start.y), path.currentPosition())
+
+def _update_connection_paths(endpoint, connections):
+    """
+    Updates the paths of the connections attached to a moved port or socket.
+
+    Inside a move transaction of the SequenceScene the update is deferred
+    to the scene's next path refresh.
+    """
+    if not connections:
+        return
+    scene = endpoint.scene()
+    if isinstance(scene, SequenceScene):
+        scene.update_connection_paths(connections)
+    else:
+        for conn in connections:
+            conn.update_path()
+
 class Port(QGraphicsObject):
     """
     A visual port on a SequenceNode for execution flow connections.
@@ -513,7 +743,7 @@ class Port(QGraphicsObject):
         self.connections = []
         self.label = label
         if self.label:
-            self.label_item = QGraphicsTextItem(self.label, self)
+            self.label_item = LodTextItem(self.label, self)
             self.label_item.setDefaultTextColor(Qt.GlobalColor.white)
             if self.is_output:
                 self.label_item.setPos(self.radius + 5, -self.label_item.boundingRect().height() / 2)
@@ -525,7 +755,9 @@ class Port(QGraphicsObject):
         return QRectF(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius)
 
     def paint(self, painter, option, widget=None):
-        """Paints the port as a circle."""
+        """Paints the port as a circle; ports are omitted when zoomed out."""
+        if level_of_detail(painter) < DETAIL_MIN_LOD:
+            return
         painter.setBrush(QBrush(QColor("#5a98d1")))
         painter.setPen(QPen(Qt.GlobalColor.white, 1))
         painter.drawEllipse(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius)
@@ -542,7 +774,7 @@ class Port(QGraphicsObject):
             The result of the parent's itemChange method.
         """
         if change == QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged:
-            for conn in self.connections: conn.update_path()
+            _update_connection_paths(self, self.connections)
         return value
 
 class Connection(QGraphicsPathItem):
@@ -560,7 +792,7 @@ class Connection(QGraphicsPathItem):
         self.setZValue(-1)
         self.setFlag(QGraphicsPathItem.GraphicsItemFlag.ItemIsSelectable)
         self.condition, self.state = None, "idle"
-        self.condition_label = QGraphicsTextItem(self)
+        self.condition_label = LodTextItem(self)
         self.condition_label.setDefaultTextColor(QColor("#a9d1ff"))
         self.start_port.connections.append(self)
         if self.end_port: self.end_port.connections.append(self)
@@ -590,7 +822,8 @@ class Connection(QGraphicsPathItem):
         Paints the connection path.
 
         The color changes based on its execution state (idle/active) or
-        if it is selected.
+        if it is selected. When zoomed out, a thin straight line is drawn
+        instead of the curve.
 
         Args:
             painter (QPainter): The painter to use for drawing.
@@ -601,6 +834,9 @@ class Connection(QGraphicsPathItem):
         width = 3 if self.state == "active" else 2
         pen = QPen(QColor(color), width)
         if self.isSelected(): pen.setColor(QColor("#ffc400"))
+        if level_of_detail(painter) < DETAIL_MIN_LOD:
+            _paint_simplified_path(painter, pen, self.path())
+            return
         painter.setPen(pen); painter.drawPath(self.path())
 
     def set_condition(self, condition):
@@ -671,13 +907,15 @@ class SequenceEngine(QObject):
         connection_state_changed (pyqtSignal): Emitted when a connection's visual state changes.
                                                Passes sequence_name, start_uuid, end_uuid, and state (str).
     """
+    STATE_FLUSH_INTERVAL = 1 / 30  # Seconds between coalesced state emissions in FAST mode.
+
     execution_paused = pyqtSignal(str, str)
     execution_finished = pyqtSignal(str, bool)
     node_state_changed = pyqtSignal(str, str, str)
     connection_state_changed = pyqtSignal(str, str, str, str)
     global_variable_changed = pyqtSignal(str, object)
 
-    def __init__(self, opcua_logic, async_runner, global_variables):
+    def __init__(self, opcua_logic, async_runner, global_variables, plan_cache=None, mysql_pool=None, mysql_writer=None, mysql_runner=None, script_pool=None):
         """
         Initializes the SequenceEngine.
 
@@ -685,11 +923,33 @@ class SequenceEngine(QObject):
             opcua_logic (OpcuaClientLogic): The OPC-UA logic handler.
             async_runner (AsyncRunner): The utility for running async tasks.
             global_variables (dict): A dictionary for storing global variables.
+            plan_cache (ExecutionPlanCache, optional): A shared cache of compiled
+                sequence plans. If None, the engine uses a private cache.
+            mysql_pool (MySQLConnectionPool, optional): A shared pool of MySQL
+                connections. If None, a private pool is configured from settings.
+            mysql_writer (MySQLWriteBuffer, optional): A shared write-behind
+                buffer for MySQL Write nodes. If None, a private buffer on
+                `mysql_pool` is used.
+            mysql_runner (MySQLTaskRunner, optional): The thread pool running
+                blocking MySQL I/O. If None, a private runner on `mysql_pool`
+                is configured from settings.
+            script_pool (ScriptProcessPool, optional): The worker processes
+                for Python Script nodes set to run out of process. If None,
+                a private pool is used.
         """
         super().__init__()
         self.opcua_logic = opcua_logic
         self.async_runner = async_runner
         self.global_variables = global_variables
+        self.plan_cache = plan_cache if plan_cache is not None else ExecutionPlanCache()
+        self.mysql_pool = mysql_pool if mysql_pool is not None else MySQLConnectionPool.from_settings(QSettings("MyCompany", "NodeFlow"))
+        self.mysql_writer = mysql_writer if mysql_writer is not None else MySQLWriteBuffer(self.mysql_pool)
+        self.mysql_runner = mysql_runner if mysql_runner is not None else MySQLTaskRunner.from_settings(self.mysql_pool, QSettings("MyCompany", "NodeFlow"))
+        self.script_pool = script_pool if script_pool is not None else ScriptProcessPool()
+        self._worker_tasks = set()
+        self._mysql_streams = {}
+        self._active_plans = {}
+        self._node_plans = {}
         self.is_running = False
         self.debug_state = DebugState.IDLE
         self._stop_requested = False
@@ -701,6 +961,12 @@ class SequenceEngine(QObject):
         self._pause_event = asyncio.Event()
         self._step_event = asyncio.Event()
         self._step_into = False
+        self.profile = ExecutionProfile.VISUAL
+        self._pacing = EXECUTION_PROFILE_PACING[self.profile]
+        self._pending_node_states = {}
+        self._pending_connection_states = {}
+        self._last_state_flush = 0.0
+        self._flush_handle = None
 
     def resume(self):
         """Resumes execution if it is currently paused."""
@@ -724,7 +990,7 @@ class SequenceEngine(QObject):
             self._step_event.set()
             self._pause_event.set()
 
-    def run(self, sequence_name, all_sequences, loop=False):
+    def run(self, sequence_name, all_sequences, loop=False, profile=ExecutionProfile.VISUAL):
         """
         Starts the execution of a sequence.
 
@@ -732,20 +998,30 @@ class SequenceEngine(QObject):
             sequence_name (str): The name of the sequence to run.
             all_sequences (dict): A dictionary containing all sequences in the project.
             loop (bool, optional): If True, the sequence will loop indefinitely.
+            profile (ExecutionProfile | str, optional): The execution profile
+                controlling pacing and UI feedback. Defaults to VISUAL.
         """
         if self.debug_state != DebugState.IDLE: return
 
+        self.set_profile(profile)
         self.current_sequence_name = sequence_name
         self.is_looping = loop
         self.all_sequences = all_sequences
         self.execution_context.clear()
+        self._active_plans.clear()
+        self._node_plans.clear()
 
-        main_sequence_data = self.all_sequences.get(sequence_name)
-        if not main_sequence_data:
+        main_plan = self.get_plan(sequence_name)
+        if not main_plan:
             logging.error(f"Could not find sequence data for '{sequence_name}'.")
             return
 
-        start_node = self.find_start_node(main_sequence_data)
+        if any(node.get('config', {}).get('node_type') == NodeType.PYTHON_SCRIPT.value
+               and node.get('config', {}).get('run_in_process') for node in main_plan.nodes.values()):
+            # Start the worker processes now rather than on the first script.
+            self.script_pool.warm_up()
+
+        start_node = main_plan.start_node
         if not start_node:
             logging.error(f"No start node found for sequence '{sequence_name}'.")
             self.execution_finished.emit(self.current_sequence_name, False)
@@ -755,7 +1031,115 @@ class SequenceEngine(QObject):
         self.is_running = True
         self._stop_requested = False
         self._pause_event.set()
-        self.async_runner.submit(self._run_main_loop(start_node, main_sequence_data))
+        self.async_runner.submit(self._run_main_loop(start_node, main_plan))
+
+    def set_profile(self, profile):
+        """
+        Sets the execution profile used for pacing and state emissions.
+
+        Args:
+            profile (ExecutionProfile | str): The profile or its value string.
+                Unknown values fall back to VISUAL.
+        """
+        if not isinstance(profile, ExecutionProfile):
+            try:
+                profile = ExecutionProfile(profile)
+            except ValueError:
+                logging.warning(f"Unknown execution profile '{profile}'. Using '{ExecutionProfile.VISUAL.value}'.")
+                profile = ExecutionProfile.VISUAL
+        self.profile = profile
+        self._pacing = EXECUTION_PROFILE_PACING[profile]
+
+    async def _pace(self, point):
+        """
+        Pauses at a pacing point according to the active profile.
+
+        Profiles without pacing still yield once to the event loop so the UI
+        and OPC-UA callbacks keep running during tight sequences.
+
+        Args:
+            point (str): The pacing point key (e.g., 'node_finished').
+        """
+        await asyncio.sleep(self._pacing[point])
+
+    def _emit_node_state(self, sequence_name, node_uuid, state):
+        """Emits or coalesces a node state change according to the active profile."""
+        if self.profile == ExecutionProfile.VISUAL:
+            self.node_state_changed.emit(sequence_name, node_uuid, state)
+        elif self.profile == ExecutionProfile.FAST:
+            self._pending_node_states[(sequence_name, node_uuid)] = state
+            self._flush_states()
+
+    def _emit_connection_state(self, sequence_name, connection_data, state):
+        """Emits or coalesces a connection state change according to the active profile."""
+        start_uuid, end_uuid = connection_data['start_node_uuid'], connection_data['end_node_uuid']
+        if self.profile == ExecutionProfile.VISUAL:
+            self.connection_state_changed.emit(sequence_name, start_uuid, end_uuid, state)
+        elif self.profile == ExecutionProfile.FAST:
+            self._pending_connection_states[(sequence_name, start_uuid, end_uuid)] = state
+            self._flush_states()
+
+    def _flush_states(self, force=False):
+        """
+        Emits the latest coalesced node and connection states.
+
+        Args:
+            force (bool, optional): If True, flushes regardless of the flush interval.
+        """
+        now = time.monotonic()
+        remaining = self.STATE_FLUSH_INTERVAL - (now - self._last_state_flush)
+        if not force and remaining > 0:
+            # Make sure the latest states still reach the UI if nothing else is emitted.
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_event_loop().call_later(remaining, self._flush_states, True)
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._last_state_flush = now
+        node_states, self._pending_node_states = self._pending_node_states, {}
+        connection_states, self._pending_connection_states = self._pending_connection_states, {}
+        for (sequence_name, node_uuid), state in node_states.items():
+            self.node_state_changed.emit(sequence_name, node_uuid, state)
+        for (sequence_name, start_uuid, end_uuid), state in connection_states.items():
+            self.connection_state_changed.emit(sequence_name, start_uuid, end_uuid, state)
+
+    def get_plan(self, sequence_name):
+        """
+        Returns the compiled execution plan for a sequence.
+
+        Plans come from the shared plan cache and are only recompiled when the
+        sequence data has changed. The nodes of every plan handed out are
+        indexed so executors can find the plan that owns a given node.
+
+        Args:
+            sequence_name (str): The name of the sequence.
+
+        Returns:
+            ExecutionPlan or None: The plan, or None if the sequence does not exist.
+        """
+        sequence_data = self.all_sequences.get(sequence_name)
+        if not sequence_data:
+            return None
+        plan = self.plan_cache.get(sequence_name, sequence_data, self.evaluate_condition)
+        if self._active_plans.get(sequence_name) is not plan:
+            self._active_plans[sequence_name] = plan
+            for node_uuid in plan.nodes:
+                self._node_plans[node_uuid] = plan
+        return plan
+
+    def plan_for_node(self, node_data):
+        """
+        Returns the execution plan that contains the given node.
+
+        Args:
+            node_data (dict): The data for a node being executed.
+
+        Returns:
+            ExecutionPlan: The owning plan, falling back to the current sequence's plan.
+        """
+        plan = self._node_plans.get(node_data['uuid'])
+        return plan if plan is not None else self.get_plan(self.current_sequence_name)
 
     def stop(self):
         """Requests a graceful stop of the current execution."""
@@ -763,9 +1147,12 @@ class SequenceEngine(QObject):
             logging.info("Stop requested for sequence execution.")
             self.is_looping = False
             self._stop_requested = True
+            self.mysql_writer.request_flush()
+            for task in list(self._worker_tasks):
+                task.cancel()
             self.resume()
 
-    async def _run_main_loop(self, start_node, sequence_data):
+    async def _run_main_loop(self, start_node, plan):
         """
         The top-level async loop that handles the 'loop' toggle.
 
@@ -773,18 +1160,21 @@ class SequenceEngine(QObject):
 
         Args:
             start_node (dict): The node to start execution from.
-            sequence_data (dict): The data for the entire sequence.
+            plan (ExecutionPlan): The compiled plan of the sequence.
         """
         try:
-            await self._execute_graph(self.current_sequence_name, start_node, sequence_data)
+            await self._execute_graph(self.current_sequence_name, start_node, plan)
         finally:
             logging.info(f"Execution cycle for '{self.current_sequence_name}' finished.")
 
             if self.is_looping and not self._stop_requested:
                 logging.info(f"Looping sequence '{self.current_sequence_name}'. Restarting...")
-                await asyncio.sleep(0.5)
-                self.async_runner.submit(self._run_main_loop(start_node, sequence_data))
+                await self._pace('loop_cycle')
+                self.async_runner.submit(self._run_main_loop(start_node, plan))
             else:
+                self._flush_states(force=True)
+                await self._close_mysql_streams()
+                await self._flush_mysql_writes()
                 self.debug_state = DebugState.IDLE
                 self.is_running = False
                 was_stopped = self._stop_requested
@@ -792,7 +1182,82 @@ class SequenceEngine(QObject):
                 self.is_looping = False
                 self.execution_finished.emit(self.current_sequence_name, was_stopped)
 
-    async def _execute_graph(self, sequence_name, start_node, sequence_data, is_sub_sequence=False):
+    async def _run_mysql(self, func):
+        """
+        Runs blocking MySQL work off the event loop, cancellable by `stop`.
+
+        Args:
+            func (callable): Called with a pooled MySQLManager on a worker thread.
+
+        Returns:
+            The return value of `func`.
+
+        Raises:
+            ConnectionError: If the sequence was stopped while the work was running.
+        """
+        return await self._await_mysql(self.mysql_runner.run(func))
+
+    async def _await_mysql(self, coroutine):
+        """
+        Awaits a MySQLTaskRunner operation as a task that `stop` can cancel.
+
+        Args:
+            coroutine (Coroutine): The runner operation.
+
+        Returns:
+            The result of the operation.
+
+        Raises:
+            ConnectionError: If the sequence was stopped while the work was running.
+        """
+        return await self._await_worker(coroutine, ConnectionError("MySQL query cancelled because the sequence was stopped."))
+
+    async def _await_worker(self, coroutine, stopped_error):
+        """
+        Awaits work running outside the event loop as a task that `stop` can cancel.
+
+        Args:
+            coroutine (Coroutine): The operation to await.
+            stopped_error (Exception): Raised instead of CancelledError when
+                the sequence was stopped while the work was running.
+
+        Returns:
+            The result of the operation.
+        """
+        task = asyncio.ensure_future(coroutine)
+        self._worker_tasks.add(task)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if task.cancelled() and self._stop_requested:
+                raise stopped_error
+            raise
+        finally:
+            self._worker_tasks.discard(task)
+
+    async def _close_mysql_streams(self):
+        """Closes the result streams of MySQL Read nodes that were not read to the end."""
+        streams, self._mysql_streams = self._mysql_streams, {}
+        for stream in streams.values():
+            try:
+                await stream.close()
+            except Exception as e:
+                logging.error(f"Failed to close MySQL result stream: {e}")
+
+    async def _flush_mysql_writes(self):
+        """Writes all buffered MySQL rows without blocking the event loop."""
+        if not self.mysql_writer.pending_rows():
+            return
+        try:
+            result = await asyncio.to_thread(self.mysql_writer.flush)
+            if result.retried:
+                logging.error(f"{result.retried} buffered MySQL rows could not be written and will be retried.")
+            if result.rejected:
+                logging.error(f"MySQL rejected {result.rejected} buffered rows; they were dropped.")
+        except Exception as e:
+            logging.error(f"Failed to flush buffered MySQL rows: {e}")
+
+    async def _execute_graph(self, sequence_name, start_node, plan, is_sub_sequence=False):
         """
         Executes a given sequence graph from a start node.
 
@@ -803,7 +1268,7 @@ class SequenceEngine(QObject):
         Args:
             sequence_name (str): The name of the sequence being executed.
             start_node (dict): The node to start execution from.
-            sequence_data (dict): The data for the entire sequence.
+            plan (ExecutionPlan): The compiled plan of the sequence.
             is_sub_sequence (bool, optional): True if this is a sub-sequence call.
 
         Returns:
@@ -812,13 +1277,12 @@ class SequenceEngine(QObject):
         active_connection_data = None
         current_node = start_node
 
-        node_map = {node_data['uuid']: node_data for node_data in sequence_data.get('nodes', [])}
-
         while current_node and not self._stop_requested:
             if current_node.get('has_breakpoint') and self._pause_event.is_set():
                 if not (is_sub_sequence and not self._step_into):
                     self.debug_state = DebugState.PAUSED
                     self._pause_event.clear()
+                    self._flush_states(force=True)
                     self.execution_paused.emit(sequence_name, current_node['uuid'])
 
             await self._pause_event.wait()
@@ -829,10 +1293,10 @@ class SequenceEngine(QObject):
                 self._step_event.clear()
 
             if active_connection_data:
-                self.connection_state_changed.emit(sequence_name, active_connection_data['start_node_uuid'], active_connection_data['end_node_uuid'], "idle")
-                await asyncio.sleep(0.1)
+                self._emit_connection_state(sequence_name, active_connection_data, "idle")
+                await self._pace('connection_idle')
 
-            self.node_state_changed.emit(sequence_name, current_node['uuid'], "running")
+            self._emit_node_state(sequence_name, current_node['uuid'], "running")
 
             value, success = await self.execute_node(current_node, self._step_into)
 
@@ -841,22 +1305,22 @@ class SequenceEngine(QObject):
                     logging.debug(f"Branch execution paused, waiting for join at node {current_node['uuid']}.")
                     return None, True
                 else:
-                    self.node_state_changed.emit(sequence_name, current_node['uuid'], "failed")
+                    self._emit_node_state(sequence_name, current_node['uuid'], "failed")
                     return None, False
 
-            self.node_state_changed.emit(sequence_name, current_node['uuid'], "success")
-            await asyncio.sleep(0.2)
+            self._emit_node_state(sequence_name, current_node['uuid'], "success")
+            await self._pace('node_finished')
 
-            next_node_uuid, active_connection_data = self.find_next_node_and_connection(current_node, value, sequence_data)
+            next_node_uuid, active_connection_data = self.find_next_node_and_connection(current_node, value, plan)
 
             if active_connection_data:
-                self.connection_state_changed.emit(sequence_name, active_connection_data['start_node_uuid'], active_connection_data['end_node_uuid'], "active")
-                await asyncio.sleep(0.2)
+                self._emit_connection_state(sequence_name, active_connection_data, "active")
+                await self._pace('connection_active')
 
-            current_node = node_map.get(next_node_uuid) if next_node_uuid else None
+            current_node = plan.get_node(next_node_uuid) if next_node_uuid else None
 
         if active_connection_data:
-            self.connection_state_changed.emit(sequence_name, active_connection_data['start_node_uuid'], active_connection_data['end_node_uuid'], "idle")
+            self._emit_connection_state(sequence_name, active_connection_data, "idle")
 
         return value, True
 
@@ -888,6 +1352,8 @@ class SequenceEngine(QObject):
             NodeType.PYTHON_SCRIPT.value: self.execute_python_script_node,
             NodeType.MYSQL_WRITE.value: self.execute_mysql_write_node,
             NodeType.MYSQL_READ.value: self.execute_mysql_read_node,
+            NodeType.BATCH_READ.value: self.execute_batch_read_node,
+            NodeType.BATCH_WRITE.value: self.execute_batch_write_node,
         }
         executor = execution_map.get(node_type)
         if executor:
@@ -900,6 +1366,10 @@ class SequenceEngine(QObject):
         """
         Evaluates a mathematical or logical expression using data inputs.
 
+        In the 'Vectorized' mode, list inputs are converted to NumPy arrays and
+        the expression can use a whitelisted NumPy namespace as `np`, so whole
+        arrays and result columns are processed in a single evaluation.
+
         Args:
             node_data (dict): The data for the compute node.
 
@@ -913,23 +1383,25 @@ class SequenceEngine(QObject):
                 raise ValueError("Compute node has no expression.")
 
             local_vars = {}
-            current_sequence_data = self.all_sequences[self.current_sequence_name]
-            data_connections = current_sequence_data.get('data_connections', [])
-
-            for conn in data_connections:
-                if conn['end_node_uuid'] == node_data['uuid']:
-                    input_label = conn.get('end_socket_label')
-                    source_uuid = conn['start_node_uuid']
-                    if input_label and source_uuid in self.execution_context:
-                        local_vars[input_label] = self.execution_context[source_uuid]
-                    else:
-                        logging.warning(f"Could not find pre-computed value for input '{input_label}' from node '{source_uuid}'.")
-                        return None, False
+            plan = self.plan_for_node(node_data)
+
+            for conn in plan.get_data_inputs(node_data['uuid']):
+                input_label = conn.get('end_socket_label')
+                source_uuid = conn['start_node_uuid']
+                if input_label and source_uuid in self.execution_context:
+                    local_vars[input_label] = self.execution_context[source_uuid]
+                else:
+                    logging.warning(f"Could not find pre-computed value for input '{input_label}' from node '{source_uuid}'.")
+                    return None, False
 
             logging.info(f"Evaluating expression: '{expression}' with inputs: {local_vars}")
             # Extract the 'value' from each input dictionary if it's a dict, otherwise use the value directly
             eval_vars = {k: v['value'] if isinstance(v, dict) and 'value' in v else v for k, v in local_vars.items()}
-            result = eval(expression, {"__builtins__": None}, eval_vars)
+            if config.get('mode') == COMPUTE_MODE_VECTORIZED:
+                eval_vars = {k: as_array_input(v) for k, v in eval_vars.items()}
+                result = to_output(eval(expression_cache.compile(expression), VECTORIZED_GLOBALS, eval_vars))
+            else:
+                result = eval(expression_cache.compile(expression), _COMPUTE_GLOBALS, eval_vars)
             logging.info(f"Expression result: {result}")
             self.execution_context[node_data['uuid']] = result
             return result, True
@@ -950,25 +1422,25 @@ class SequenceEngine(QObject):
         Returns:
             tuple: A tuple containing the final result ("Finished") and a success boolean.
         """
-        current_sequence_data = self.all_sequences[self.current_sequence_name]
-        node_map = {n['uuid']: n for n in current_sequence_data['nodes']}
+        plan = self.plan_for_node(node_data)
 
         negate_condition = node_data['config'].get('while_negate_condition', True)
         condition_target_str = node_data['config'].get('while_condition_value', '')
 
-        loop_body_start_node_uuid, _ = self.find_next_node_and_connection(node_data, "Loop Body", current_sequence_data)
+        loop_body_start_node_uuid, _ = plan.loop_body_entries.get(node_data['uuid'], (None, None))
         if not loop_body_start_node_uuid:
             logging.warning("While Loop has no 'Loop Body' connected.")
             return "Finished", True
 
-        loop_start_node = node_map.get(loop_body_start_node_uuid)
+        loop_start_node = plan.get_node(loop_body_start_node_uuid)
 
-        source_node_uuid = next((conn['start_node_uuid'] for conn in current_sequence_data.get('data_connections', []) if conn['end_node_uuid'] == node_data['uuid']), None)
-        if not source_node_uuid:
+        source_conn = plan.get_data_source(node_data['uuid'])
+        if not source_conn:
             logging.error("While Loop requires a data input connection for its condition.")
             return None, False
 
-        source_node_data = node_map.get(source_node_uuid)
+        source_node_uuid = source_conn['start_node_uuid']
+        source_node_data = plan.get_node(source_node_uuid)
         if not source_node_data:
             logging.error(f"Could not find the source node ({source_node_uuid}) for the While Loop condition.")
             return None, False
@@ -978,9 +1450,9 @@ class SequenceEngine(QObject):
         while iteration_count < max_iterations:
             if self._stop_requested: break
 
-            self.node_state_changed.emit(self.current_sequence_name, source_node_data['uuid'], "running")
+            self._emit_node_state(plan.name, source_node_data['uuid'], "running")
             live_value, success = await self.execute_node(source_node_data)
-            self.node_state_changed.emit(self.current_sequence_name, source_node_data['uuid'], "success" if success else "failed")
+            self._emit_node_state(plan.name, source_node_data['uuid'], "success" if success else "failed")
 
             if not success:
                 logging.error("Failed to evaluate While Loop condition.")
@@ -1005,10 +1477,10 @@ class SequenceEngine(QObject):
 
             logging.info(f"While Loop condition met. Executing loop body (Iteration {iteration_count + 1}).")
             if loop_start_node:
-                await self._execute_graph(self.current_sequence_name, loop_start_node, current_sequence_data, is_sub_sequence=True)
+                await self._execute_graph(plan.name, loop_start_node, plan, is_sub_sequence=True)
 
             iteration_count += 1
-            await asyncio.sleep(0.01)
+            await self._pace('while_iteration')
 
         if iteration_count >= max_iterations:
             logging.warning(f"While Loop exceeded maximum iterations ({max_iterations}).")
@@ -1028,21 +1500,21 @@ class SequenceEngine(QObject):
             tuple: A tuple containing the final result ("Finished") and a success boolean.
         """
         iterations = int(node_data['config'].get('iterations', 1))
+        plan = self.plan_for_node(node_data)
 
-        loop_body_start_node_uuid, _ = self.find_next_node_and_connection(node_data, "Loop Body", self.all_sequences[self.current_sequence_name])
+        loop_body_start_node_uuid, _ = plan.loop_body_entries.get(node_data['uuid'], (None, None))
 
         if not loop_body_start_node_uuid:
             logging.warning("For Loop has no 'Loop Body' connected.")
         else:
-            node_map = {n['uuid']: n for n in self.all_sequences[self.current_sequence_name]['nodes']}
+            loop_start_node = plan.get_node(loop_body_start_node_uuid)
             for i in range(iterations):
                 if self._stop_requested:
                     break
 
                 logging.info(f"For Loop iteration {i + 1}/{iterations}")
-                loop_start_node = node_map.get(loop_body_start_node_uuid)
                 if loop_start_node:
-                    await self._execute_graph(self.current_sequence_name, loop_start_node, self.all_sequences[self.current_sequence_name], is_sub_sequence=True)
+                    await self._execute_graph(plan.name, loop_start_node, plan, is_sub_sequence=True)
 
         return "Finished", True
 
@@ -1064,18 +1536,18 @@ class SequenceEngine(QObject):
             logging.error("Run Sequence node has no sequence name configured.")
             return None, False
 
-        sub_sequence_data = self.all_sequences.get(sub_sequence_name)
-        if not sub_sequence_data:
+        sub_plan = self.get_plan(sub_sequence_name)
+        if not sub_plan:
             logging.error(f"Could not find sub-sequence data for '{sub_sequence_name}'.")
             return None, False
 
-        start_node = self.find_start_node(sub_sequence_data)
+        start_node = sub_plan.start_node
         if not start_node:
             logging.error(f"No start node found for sub-sequence '{sub_sequence_name}'.")
             return None, False
 
         logging.info(f"--- Starting sub-sequence: {sub_sequence_name} ---")
-        result, success = await self._execute_graph(sub_sequence_name, start_node, sub_sequence_data, is_sub_sequence=True)
+        result, success = await self._execute_graph(sub_sequence_name, start_node, sub_plan, is_sub_sequence=True)
         logging.info(f"--- Finished sub-sequence: {sub_sequence_name} (Success: {success}) ---")
 
         return result, success
@@ -1106,14 +1578,10 @@ class SequenceEngine(QObject):
             except (ValueError, TypeError):
                 return arg_text
 
-        data_connections = self.all_sequences.get(sequence_name, {}).get('data_connections', [])
-        source_node_uuid = None
-        connection_uuid = None
-        for conn in data_connections:
-            if conn['end_node_uuid'] == node_data['uuid']:
-                source_node_uuid = conn['start_node_uuid']
-                connection_uuid = conn.get('uuid')
-                break
+        plan = self._node_plans.get(node_data['uuid']) or self.get_plan(sequence_name)
+        source_conn = plan.get_data_source(node_data['uuid']) if plan else None
+        source_node_uuid = source_conn['start_node_uuid'] if source_conn else None
+        connection_uuid = source_conn.get('uuid') if source_conn else None
 
         if source_node_uuid:
             if source_node_uuid in self.execution_context:
@@ -1160,7 +1628,7 @@ class SequenceEngine(QObject):
             else:
                 logging.info(f"Executing method: {method_bname}")
 
-            result = await parent_node.call_method(method_node, *args)
+            result = await self.opcua_logic.call_method(parent_node, method_node, *args)
             logging.info(f"Method '{method_bname}' returned: {result}")
             self.execution_context[node_data['uuid']] = result
             return result, True
@@ -1215,7 +1683,7 @@ class SequenceEngine(QObject):
 
             current_sequence = self.current_sequence_name
             value = await self.resolve_argument_value(node_data, current_sequence)
-            datatype = await target_node.read_data_type_as_variant_type()
+            datatype = await self.opcua_logic.get_variant_type(target_node)
             logging.info(f"Writing value '{value}' to node {node_id}")
             await self.opcua_logic.write_value(target_node, value, datatype)
             return True, True
@@ -1223,6 +1691,84 @@ class SequenceEngine(QObject):
             logging.error(f"Failed to execute write value node: {e}")
             return None, False
 
+    async def execute_batch_read_node(self, node_data):
+        """
+        Reads several OPC UA nodes with a single batched Read request.
+
+        Args:
+            node_data (dict): The data for the batch read node.
+
+        Returns:
+            tuple: A tuple containing the list of read values and a success boolean.
+        """
+        try:
+            node_ids = node_data['config'].get('node_ids', [])
+            if not node_ids:
+                raise ValueError("Batch Read node has no Node IDs configured.")
+
+            nodes = [await self.opcua_logic.find_node(node_id, "By Node ID") for node_id in node_ids]
+            values = await self.opcua_logic.read_values(nodes)
+            logging.info(f"Batch read {len(values)} values for node '{node_data['config']['label']}'")
+            self.execution_context[node_data['uuid']] = values
+            return values, True
+        except Exception as e:
+            logging.error(f"Failed to execute batch read node: {e}")
+            return None, False
+
+    async def execute_batch_write_node(self, node_data):
+        """
+        Writes several OPC UA nodes with a single batched Write request.
+
+        The static values configured on the node are used unless a data
+        connection provides a list (in configured order) or a dict keyed by
+        Node ID. The data types of all targets are resolved in one batched
+        request instead of one round trip per node.
+
+        Args:
+            node_data (dict): The data for the batch write node.
+
+        Returns:
+            tuple: A tuple containing True and a success boolean.
+        """
+        try:
+            config = node_data['config']
+            items = config.get('items', [])
+            if not items:
+                raise ValueError("Batch Write node has no writes configured.")
+
+            node_ids = [item['node_id'] for item in items]
+            values = []
+            for item in items:
+                try:
+                    values.append(float(item.get('value', '')))
+                except (ValueError, TypeError):
+                    values.append(item.get('value', ''))
+
+            plan = self.plan_for_node(node_data)
+            source_conn = plan.get_data_source(node_data['uuid'], "In") if plan else None
+            if source_conn:
+                source_uuid = source_conn['start_node_uuid']
+                if source_uuid not in self.execution_context:
+                    raise ValueError(f"Source node '{source_uuid}' has not executed or produced a value.")
+                connected = self.execution_context[source_uuid]
+                if source_conn.get('uuid'):
+                    self.data_connection_values[source_conn['uuid']] = connected
+                if isinstance(connected, dict):
+                    values = [connected.get(node_id, value) for node_id, value in zip(node_ids, values)]
+                elif isinstance(connected, (list, tuple)) and len(connected) == len(items):
+                    values = list(connected)
+                else:
+                    raise ValueError(f"Connected input must be a dict or a list of {len(items)} values.")
+
+            nodes = [await self.opcua_logic.find_node(node_id, "By Node ID") for node_id in node_ids]
+            datatypes = await self.opcua_logic.read_variant_types(nodes)
+            logging.info(f"Batch writing {len(nodes)} values for node '{config['label']}'")
+            await self.opcua_logic.write_values(list(zip(nodes, values, datatypes)))
+            return True, True
+        except Exception as e:
+            logging.error(f"Failed to execute batch write node: {e}")
+            return None, False
+
     async def execute_static_value_node(self, node_data):
         """
         Executes a static value node.
@@ -1321,22 +1867,20 @@ class SequenceEngine(QObject):
         Returns:
             tuple: A tuple containing True and a success boolean.
         """
-        sequence_data = self.all_sequences[self.current_sequence_name]
-        node_map = {n['uuid']: n for n in sequence_data['nodes']}
+        plan = self.plan_for_node(node_data)
 
         branches = []
-        for conn_data in sequence_data.get('exec_connections', []):
-            if conn_data['start_node_uuid'] == node_data['uuid']:
-                next_node_uuid = conn_data['end_node_uuid']
-                if next_node_uuid in node_map:
-                    branches.append(node_map[next_node_uuid])
+        for conn_data in plan.get_outgoing(node_data['uuid']):
+            next_node = plan.get_node(conn_data['end_node_uuid'])
+            if next_node:
+                branches.append(next_node)
 
         if not branches:
             logging.warning(f"Fork node '{node_data['uuid']}' has no outgoing connections.")
             return True, True
 
         logging.info(f"Forking execution into {len(branches)} branches.")
-        tasks = [asyncio.create_task(self._execute_graph(self.current_sequence_name, start_node, sequence_data, is_sub_sequence=True)) for start_node in branches]
+        tasks = [asyncio.create_task(self._execute_graph(plan.name, start_node, plan, is_sub_sequence=True)) for start_node in branches]
         await asyncio.gather(*tasks)
         logging.info(f"All forked branches from '{node_data['uuid']}' have completed.")
         return True, True
@@ -1345,13 +1889,23 @@ class SequenceEngine(QObject):
         """
         Executes a 'Python Script' node.
         
-        The script is executed in a restricted scope with access to an 'INPUT'
-        variable and any defined global variables. Global variables that are
-        dictionaries containing a 'current_value' key are "unwrapped" so the script
-        can access their actual value directly. The script can modify these unwrapped
-        variables, and the changes will be written back to the 'current_value' key.
-        The script can also set an 'output' variable, which is then
-        placed in the execution context.
+        The script is compiled once per node and executed in a restricted scope
+        with access to an 'INPUT' variable and the global variables it references.
+        Global variables that are dictionaries containing a 'current_value' key
+        are "unwrapped" so the script can access their actual value directly. The
+        script can modify these unwrapped variables, and the changes will be
+        written back to the 'current_value' key. Other referenced variables are
+        isolated (immutable values as-is, NumPy arrays as read-only views,
+        anything else as a deep copy), so the script cannot modify them.
+        Variables the script does not reference are neither exposed nor copied.
+        NumPy is available as 'np', and the modules in ALLOWED_SCRIPT_MODULES
+        can be imported. The script can also set an 'output' variable, which
+        is then placed in the execution context.
+
+        With the node's 'run_in_process' option the script runs in the
+        engine's ScriptProcessPool instead, so it does not block the event
+        loop; the same variables are sent to the worker and the unwrapped ones
+        are written back from its results.
         
         Args:
             node_data (dict): The data for the Python script node.
@@ -1365,51 +1919,54 @@ class SequenceEngine(QObject):
             if not script:
                 return None, True
 
+            compiled = script_cache.get(node_data['uuid'], script, config.get('label'))
             input_value = await self.resolve_argument_value(node_data, self.current_sequence_name)
 
-            # Use a deepcopy to prevent script from modifying nested structures of non-unwrapped variables
-            script_globals = copy.deepcopy(self.global_variables)
+            variables = {}
             unwrapped_keys = set()  # To track which keys were unwrapped for write-back
 
             # --- Smart Unwrapping Logic ---
             # Make global variables with a 'current_value' directly accessible by their name
-            for key, value in self.global_variables.items():
+            for key in compiled.names:
+                if key not in self.global_variables:
+                    continue
+                value = self.global_variables[key]
                 if isinstance(value, dict) and 'current_value' in value:
-                    script_globals[key] = value['current_value']
+                    variables[key] = value['current_value']
                     unwrapped_keys.add(key)
+                else:
+                    variables[key] = value
+
+            if config.get('run_in_process'):
+                # The worker receives copies, so nothing needs isolating here.
+                logging.debug(f"Executing Python script in a worker process with variables: {sorted(variables)}")
+                output_value, updates = await self._await_worker(
+                    self.script_pool.run(compiled.source, config.get('label') or node_data['uuid'],
+                                         input_value, variables, unwrapped_keys),
+                    RuntimeError("Python script abandoned because the sequence was stopped."))
+            else:
+                # Provide a safe subset of builtins (and whitelisted imports) to the script
+                script_globals = script_globals_for(
+                    {key: value if key in unwrapped_keys else _isolated_value(value)
+                     for key, value in variables.items()},
+                    input_value)
 
-            script_globals['INPUT'] = input_value
-            script_globals['output'] = None
-            # Provide a safe subset of builtins to the script's execution environment
-            safe_builtins = {
-                'abs': abs, 'all': all, 'any': any, 'bool': bool, 'dict': dict,
-                'float': float, 'int': int, 'len': len, 'list': list, 'max': max,
-                'min': min, 'pow': pow, 'range': range, 'round': round, 'set': set,
-                'str': str, 'sum': sum, 'tuple': tuple, 'True': True, 'False': False,
-                'None': None
-            }
-            script_globals['__builtins__'] = safe_builtins
-
-            logging.debug(f"Executing Python script with globals: {script_globals}")
-            exec(script, script_globals)
+                logging.debug(f"Executing Python script with variables: {sorted(script_globals.keys() - {'__builtins__'})}")
+                exec(compiled.code, script_globals)
+                output_value = script_globals.get('output')
+                updates = {key: script_globals.get(key) for key in unwrapped_keys}
 
             # --- Intelligent Write-Back Logic ---
-            for key, new_value in script_globals.items():
-                if key in ['__builtins__', 'INPUT', 'output']:
-                    continue
+            for key, new_value in updates.items():
+                original_var_dict = self.global_variables.get(key)
+                if isinstance(original_var_dict, dict):
+                    # Check if the value actually changed before updating and emitting
+                    if _value_changed(original_var_dict.get('current_value'), new_value):
+                        original_var_dict['current_value'] = new_value
+                        # Emit the new primitive value for UI updates
+                        self.global_variable_changed.emit(key, new_value)
+                        logging.info(f"Script updated global variable '{key}' to {new_value}")
 
-                # If the key was an unwrapped global variable, update its 'current_value'
-                if key in unwrapped_keys:
-                    original_var_dict = self.global_variables.get(key)
-                    if isinstance(original_var_dict, dict):
-                        # Check if the value actually changed before updating and emitting
-                        if original_var_dict.get('current_value') != new_value:
-                            original_var_dict['current_value'] = new_value
-                            # Emit the new primitive value for UI updates
-                            self.global_variable_changed.emit(key, new_value)
-                            logging.info(f"Script updated global variable '{key}' to {new_value}")
-
-            output_value = script_globals.get('output')
             self.execution_context[node_data['uuid']] = output_value
             logging.info(f"Python script node executed. Output: {output_value}")
             return output_value, True
@@ -1422,11 +1979,16 @@ class SequenceEngine(QObject):
         """
         Executes a 'MySQL Write' node.
 
-        It connects to the configured MySQL database, resolves input values,
-        and inserts or updates a row in the specified table.
+        It resolves input values and queues a row for the specified table in the
+        write-behind buffer, which writes rows in bulk in the background.
         - If a 'Key' is designated in the node config, it performs an UPSERT.
         - Otherwise, it performs a standard INSERT.
-        It will also dynamically add columns to the table if they do not exist.
+        It will also dynamically add columns to the table if they do not exist,
+        typed after the first value written. Table schemas are cached, so once
+        a table is known no database round trip is made before queueing.
+        Buffered rows are flushed when the sequence finishes or is stopped.
+        While MySQL is unreachable, rows go to the local spool instead of
+        failing the node.
         """
         try:
             config = node_data['config']
@@ -1437,74 +1999,60 @@ class SequenceEngine(QObject):
             if not table_name or not mappings:
                 raise ValueError("MySQL Write node is not configured.")
 
-            settings = QSettings("MyCompany", "NodeFlow")
-            host, user, password, database = settings.value("mysql/host"), settings.value("mysql/user"), settings.value("mysql/password"), settings.value("mysql/database")
-            if not all([host, user, database]):
-                raise ConnectionError("MySQL connection details are not configured in settings.")
-
-            manager = MySQLManager(host, user, password, database)
-            conn_success, conn_msg = manager.connect()
-            if not conn_success:
-                raise ConnectionError(f"MySQL connection failed: {conn_msg}")
+            plan = self.plan_for_node(node_data)
+            column_values = {}
+            for input_name in inputs:
+                column_name = mappings.get(input_name)
+                if not column_name: continue
 
-            try:
-                column_values = {}
-                for input_name in inputs:
-                    column_name = mappings.get(input_name)
-                    if not column_name: continue
+                source_conn = plan.get_data_source(node_data['uuid'], input_name)
+                source_node_uuid = source_conn['start_node_uuid'] if source_conn else None
 
-                    source_node_uuid = next((conn['start_node_uuid'] for conn in self.all_sequences[self.current_sequence_name].get('data_connections', []) if conn['end_node_uuid'] == node_data['uuid'] and conn.get('end_socket_label') == input_name), None)
-
-                    if source_node_uuid and source_node_uuid in self.execution_context:
-                        column_values[column_name] = self.execution_context[source_node_uuid]
-                    else:
-                        logging.warning(f"No input value found for '{input_name}' on MySQL Write node.")
-                        column_values[column_name] = None
-
-                if not column_values:
-                    logging.warning("MySQL Write node has no values to insert.")
-                    return True, True
-
-                db_columns = manager.get_table_columns(table_name)
-                if isinstance(db_columns, str) and "1146" in db_columns:
-                    manager.execute_query(f"CREATE TABLE `{table_name}` (id INT AUTO_INCREMENT PRIMARY KEY);")
-                    db_columns = []
-
-                for col_name in column_values.keys():
-                    if col_name not in db_columns:
-                        logging.info(f"Column '{col_name}' not found in table '{table_name}'. Adding it.")
-                        add_success, add_msg = manager.add_column_to_table(table_name, col_name, "VARCHAR(255)")
-                        if not add_success: raise Exception(f"Failed to add column '{col_name}': {add_msg}")
-
-                # UPSERT vs INSERT logic
-                unique_key_input = config.get('unique_key_input')
-                key_column = mappings.get(unique_key_input) if unique_key_input else None
-
-                columns_str = ', '.join([f"`{c}`" for c in column_values.keys()])
-                placeholders = ', '.join(['%s'] * len(column_values))
-                values_tuple = tuple(column_values.values())
-
-                if key_column and key_column in column_values:
-                    # UPSERT
-                    update_pairs = [f"`{col}` = VALUES(`{col}`)" for col in column_values.keys() if col != key_column]
-                    if not update_pairs:
-                        logging.warning(f"UPSERT for key '{key_column}' has no other columns to update. Performing INSERT instead.")
-                        query = f"INSERT IGNORE INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
-                    else:
-                        update_clause = ', '.join(update_pairs)
-                        query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {update_clause}"
-                    logging.info(f"Executing MySQL UPSERT: {query} with values {values_tuple}")
+                if source_node_uuid and source_node_uuid in self.execution_context:
+                    column_values[column_name] = self.execution_context[source_node_uuid]
                 else:
-                    # INSERT
-                    query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
-                    logging.info(f"Executing MySQL INSERT: {query} with values {values_tuple}")
-
-                result = manager.execute_query(query, values_tuple)
-                if isinstance(result, str) and result.startswith("Error:"):
-                    raise Exception(f"Failed to write to database: {result}")
+                    logging.warning(f"No input value found for '{input_name}' on MySQL Write node.")
+                    column_values[column_name] = None
+
+            if not column_values:
+                logging.warning("MySQL Write node has no values to insert.")
+                return True, True
+
+            column_types = {col: infer_column_type(value) for col, value in column_values.items()}
+            cached_columns = self.mysql_pool.schema_cache.get(table_name)
+            if (cached_columns is None or any(col not in cached_columns for col in column_values)) and not self.mysql_writer.is_spooling:
+                try:
+                    await self._run_mysql(lambda manager: manager.ensure_columns(table_name, column_types))
+                except (ConnectionError, TimeoutError) as e:
+                    if self.mysql_writer.spool is None:
+                        raise
+                    # The buffer creates the columns when it replays the spooled row.
+                    logging.warning(f"MySQL is unavailable ({e}). The row for '{table_name}' will be spooled.")
+
+            # UPSERT vs INSERT logic
+            unique_key_input = config.get('unique_key_input')
+            key_column = mappings.get(unique_key_input) if unique_key_input else None
+
+            columns_str = ', '.join([f"`{c}`" for c in column_values.keys()])
+            placeholders = ', '.join(['%s'] * len(column_values))
+            values_tuple = tuple(column_values.values())
+
+            if key_column and key_column in column_values:
+                # UPSERT
+                update_pairs = [f"`{col}` = VALUES(`{col}`)" for col in column_values.keys() if col != key_column]
+                if not update_pairs:
+                    logging.warning(f"UPSERT for key '{key_column}' has no other columns to update. Performing INSERT instead.")
+                    query = f"INSERT IGNORE INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
+                else:
+                    update_clause = ', '.join(update_pairs)
+                    query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {update_clause}"
+                logging.debug(f"Buffering MySQL UPSERT: {query} with values {values_tuple}")
+            else:
+                # INSERT
+                query = f"INSERT INTO `{table_name}` ({columns_str}) VALUES ({placeholders})"
+                logging.debug(f"Buffering MySQL INSERT: {query} with values {values_tuple}")
 
-            finally:
-                manager.close()
+            self.mysql_writer.enqueue(query, values_tuple, (table_name, column_types))
 
             return True, True
         except Exception as e:
@@ -1515,49 +2063,77 @@ class SequenceEngine(QObject):
         """
         Executes a 'MySQL Read' node.
 
-        It connects to the database, executes the configured SELECT query,
-        and places the result into the execution context for other nodes to use.
+        It executes the configured SELECT query on a pooled connection off the
+        event loop, and places the result into the execution context for other
+        nodes to use, as a list of rows, a NumPy structured array or a pandas
+        DataFrame depending on the node's result format.
+
+        In streaming mode, each execution outputs only the next chunk of rows
+        and returns True, or outputs an empty chunk and returns False once the
+        result is exhausted. The query is re-run on the execution after that.
         """
         try:
             config = node_data['config']
             query = config.get('query')
+            output_format = config.get('output_format', OUTPUT_ROWS)
 
             if not query or not query.strip().upper().startswith("SELECT"):
                 raise ValueError("MySQL Read node requires a valid SELECT query.")
 
-            # Load MySQL settings from QSettings
-            settings = QSettings("MyCompany", "NodeFlow")
-            host = settings.value("mysql/host")
-            user = settings.value("mysql/user")
-            password = settings.value("mysql/password")
-            database = settings.value("mysql/database")
+            if config.get('stream'):
+                return await self._read_mysql_chunk(node_data, query, output_format)
 
-            if not all([host, user, database]):
-                raise ConnectionError("MySQL connection details are not configured in settings.")
+            def read(manager):
+                result = manager.execute(query)
+                if not result.has_result_set:
+                    raise ValueError("MySQL Read query did not return any rows.")
+                return result.row_count, materialize(result.rows, result.columns, output_format)
 
-            manager = MySQLManager(host, user, password, database)
-            conn_success, conn_msg = manager.connect()
-            if not conn_success:
-                raise ConnectionError(f"MySQL connection failed: {conn_msg}")
-
-            try:
-                logging.info(f"Executing MySQL Read: {query}")
-                result = manager.execute_query(query)
-                if isinstance(result, str) and result.startswith("Error:"):
-                    raise Exception(f"Failed to execute query: {result}")
+            logging.info(f"Executing MySQL Read: {query}")
+            row_count, result = await self._run_mysql(read)
 
-                # Store result for the output data socket
-                self.execution_context[node_data['uuid']] = result
-                logging.info(f"MySQL Read returned {len(result)} rows.")
-
-            finally:
-                manager.close()
+            # Store result for the output data socket
+            self.execution_context[node_data['uuid']] = result
+            logging.info(f"MySQL Read returned {row_count} rows.")
 
             return result, True
         except Exception as e:
             logging.error(f"Failed to execute MySQL Read node: {e}")
             return None, False
 
+    async def _read_mysql_chunk(self, node_data, query, output_format):
+        """
+        Outputs the next chunk of a streaming MySQL Read node.
+
+        Args:
+            node_data (dict): The MySQL Read node.
+            query (str): The SELECT statement.
+            output_format (str): The container for the chunk (see result_sets).
+
+        Returns:
+            tuple: (True, True) if a chunk was output, (False, True) once the
+                   result is exhausted.
+        """
+        node_uuid = node_data['uuid']
+        chunk_size = int(node_data['config'].get('chunk_size', 1000))
+        stream = self._mysql_streams.get(node_uuid)
+        if stream is None:
+            logging.info(f"Opening MySQL Read stream: {query}")
+            stream = await self._await_mysql(self.mysql_runner.open_stream(query))
+            self._mysql_streams[node_uuid] = stream
+
+        try:
+            rows = await self._await_mysql(stream.fetch(chunk_size))
+        except BaseException:
+            self._mysql_streams.pop(node_uuid, None)
+            raise
+
+        if stream.closed:
+            self._mysql_streams.pop(node_uuid, None)
+        self.execution_context[node_uuid] = await asyncio.to_thread(materialize, rows, stream.columns, output_format)
+        logging.debug(f"MySQL Read stream produced {len(rows)} rows.")
+        return bool(rows), True
+
     async def execute_join_node(self, node_data):
         """
         Executes a 'Join' node.
@@ -1576,7 +2152,7 @@ class SequenceEngine(QObject):
         join_uuid = node_data['uuid']
 
         if join_uuid not in self.execution_context:
-            num_incoming = sum(1 for conn in self.all_sequences[self.current_sequence_name].get('exec_connections', []) if conn['end_node_uuid'] == join_uuid)
+            num_incoming = self.plan_for_node(node_data).join_arity.get(join_uuid, 0)
             self.execution_context[join_uuid] = {'arrivals': 1, 'expected': num_incoming}
             logging.debug(f"Join node '{join_uuid}' first arrival. Expecting {num_incoming} total.")
         else:
@@ -1592,23 +2168,21 @@ class SequenceEngine(QObject):
             del self.execution_context[join_uuid]
             return True, True
 
-    def find_next_node_and_connection(self, current_node_data, result, sequence_data):
+    def find_next_node_and_connection(self, current_node_data, result, plan):
         """
         Finds the next node to execute based on outgoing connections and their conditions.
 
         Args:
             current_node_data (dict): The node that just finished executing.
             result: The output result of the current node.
-            sequence_data (dict): The data for the entire sequence.
+            plan (ExecutionPlan): The compiled plan of the sequence.
 
         Returns:
             tuple: A tuple containing the UUID of the next node and its connection data, or (None, None).
         """
-        exec_connections = sequence_data.get('exec_connections', [])
-        for conn_data in exec_connections:
-            if conn_data['start_node_uuid'] == current_node_data['uuid']:
-                if self.evaluate_condition(conn_data, result):
-                    return conn_data['end_node_uuid'], conn_data
+        for conn_data in plan.get_outgoing(current_node_data['uuid']):
+            if self.evaluate_condition(conn_data, result):
+                return conn_data['end_node_uuid'], conn_data
         return None, None
 
     def evaluate_condition(self, connection_data, result):
@@ -1630,7 +2204,7 @@ class SequenceEngine(QObject):
             expression = condition.get('expression')
             if not expression: return True
             try:
-                return bool(eval(expression, {"__builtins__": {}}, {'INPUT': result}))
+                return bool(eval(expression_cache.compile(expression), _CONDITION_GLOBALS, {'INPUT': result}))
             except Exception as e:
                 logging.error(f"Error evaluating condition expression '{expression}': {e}")
                 return False
@@ -1655,34 +2229,14 @@ class SequenceEngine(QObject):
         except (ValueError, TypeError):
             val = val_str
 
-        ops_map = {"==": lambda a, b: a == b, "!=": lambda a, b: a != b, ">": lambda a, b: a > b,
-                   "<": lambda a, b: a < b, ">=": lambda a, b: a >= b, "<=": lambda a, b: a <= b}
-        if op in ops_map:
+        compare = _COMPARISON_OPERATORS.get(op)
+        if compare:
             try:
-                return ops_map[op](result, val)
+                return compare(result, val)
             except TypeError: # Mismatched types
                 return False
         return False
 
-    def find_start_node(self, sequence_data):
-        """
-        Finds the start node of a sequence (a node with no incoming execution connections).
-
-        Args:
-            sequence_data (dict): The data for the sequence.
-
-        Returns:
-            dict or None: The data for the start node, or None if not found.
-        """
-        nodes = sequence_data.get('nodes', [])
-        if not nodes: return None
-
-        end_node_uuids = {conn['end_node_uuid'] for conn in sequence_data.get('exec_connections', [])}
-        for node_data in nodes:
-            if node_data['uuid'] not in end_node_uuids:
-                return node_data
-        return None
-
 class DataSocket(QGraphicsObject):
     """
     A visual socket on a SequenceNode for data flow connections.
@@ -1708,7 +2262,7 @@ class DataSocket(QGraphicsObject):
         self.setZValue(1)
 
         if self.label:
-            self.label_item = QGraphicsTextItem(self.label, self)
+            self.label_item = LodTextItem(self.label, self)
             self.label_item.setDefaultTextColor(QColor("#ffc400"))
             font = self.label_item.font()
             font.setBold(True)
@@ -1726,13 +2280,15 @@ class DataSocket(QGraphicsObject):
 
     def paint(self, painter, option, widget=None):
         """
-        Paints the socket as a square.
+        Paints the socket as a square; sockets are omitted when zoomed out.
 
         Args:
             painter (QPainter): The painter to use for drawing.
             option (QStyleOptionGraphicsItem): Provides style options.
             widget (QWidget, optional): The widget being painted on. Defaults to None.
         """
+        if level_of_detail(painter) < DETAIL_MIN_LOD:
+            return
         painter.setBrush(QBrush(QColor("#ffc400")))
         painter.setPen(QPen(Qt.GlobalColor.black, 1))
         painter.drawRect(-self.radius, -self.radius, 2 * self.radius, 2 * self.radius)
@@ -1749,8 +2305,7 @@ class DataSocket(QGraphicsObject):
             The result of the parent's itemChange method.
         """
         if change == QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged:
-            for conn in self.connections:
-                conn.update_path()
+            _update_connection_paths(self, self.connections)
         return value
 
 class DataConnection(QGraphicsPathItem):
@@ -1819,6 +2374,10 @@ class DataConnection(QGraphicsPathItem):
         if self.isSelected():
             pen.setColor(QColor("#ffffff"))
             pen.setStyle(Qt.PenStyle.SolidLine)
+        if level_of_detail(painter) < DETAIL_MIN_LOD:
+            # Dash patterns are expensive to stroke and invisible at this size.
+            _paint_simplified_path(painter, pen, self.path())
+            return
         painter.setPen(pen)
         painter.drawPath(self.path())
 
@@ -1888,8 +2447,10 @@ class SequenceNode(QGraphicsObject):
         self.width, self.height = 180, 80
         self.state = "idle"
 
-        self.title = QGraphicsTextItem(self)
+        self.title = LodTextItem(self)
         self.title.setDefaultTextColor(Qt.GlobalColor.white)
+        # The title only changes on edits; keep its rendering between repaints.
+        self.title.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         font = QFont()
         font.setPointSize(10)
@@ -1967,6 +2528,12 @@ class SequenceNode(QGraphicsObject):
             self.data_in_socket.setPos(self.width / 2, 0)
             self.data_out_socket = DataSocket(self, is_output=True, label="Out")
             self.data_out_socket.setPos(self.width / 2, self.height)
+        elif node_type == NodeType.BATCH_READ.value:
+            self.data_out_socket = DataSocket(self, is_output=True, label="Out")
+            self.data_out_socket.setPos(self.width / 2, self.height)
+        elif node_type == NodeType.BATCH_WRITE.value:
+            self.data_in_socket = DataSocket(self, is_output=False, label="In")
+            self.data_in_socket.setPos(self.width / 2, 0)
 
     def toggle_breakpoint(self):
         """Toggles the breakpoint state for this node and triggers a repaint."""
@@ -1995,15 +2562,13 @@ class SequenceNode(QGraphicsObject):
         Paints the node's shape, color, and breakpoint indicator.
 
         The color is determined by the node's type, selection state, and execution state.
+        When zoomed out, the node is drawn as a plain filled rectangle.
 
         Args:
             painter (QPainter): The painter to use for drawing.
             option (QStyleOptionGraphicsItem): Provides style options.
             widget (QWidget, optional): The widget being painted on. Defaults to None.
         """
-        path = QPainterPath()
-        path.addRoundedRect(self.boundingRect(), 10, 10)
-
         node_type = self.config.get('node_type')
 
         # --- Custom Color Logic ---
@@ -2015,6 +2580,8 @@ class SequenceNode(QGraphicsObject):
             if node_type == NodeType.METHOD_CALL.value: base_color = "#2E4053"
             elif node_type == NodeType.DELAY.value: base_color = "#483D8B"
             elif node_type == NodeType.WRITE_VALUE.value: base_color = "#556B2F"
+            elif node_type == NodeType.BATCH_READ.value: base_color = "#2E5E4E"
+            elif node_type == NodeType.BATCH_WRITE.value: base_color = "#4F6B2F"
             elif node_type == NodeType.STATIC_VALUE.value: base_color = "#006464"
             elif node_type == NodeType.RUN_SEQUENCE.value: base_color = "#6A1B9A"
             elif node_type == NodeType.FOR_LOOP.value: base_color = "#8B4513"
@@ -2024,6 +2591,12 @@ class SequenceNode(QGraphicsObject):
         state_colors = {"running": "#f0e68c", "success": "#90ee90", "failed": "#ff6347", "paused": "#6495ED"}
         color = state_colors.get(self.state, base_color if not self.isSelected() else "#5a98d1")
 
+        if level_of_detail(painter) < DETAIL_MIN_LOD:
+            painter.fillRect(self.boundingRect(), QColor(color))
+            return
+
+        path = QPainterPath()
+        path.addRoundedRect(self.boundingRect(), 10, 10)
         painter.setBrush(QBrush(QColor(color)))
         painter.setPen(QPen(QColor("#888"), 1))
         painter.drawPath(path)
@@ -2033,37 +2606,6 @@ class SequenceNode(QGraphicsObject):
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(self.width - 20, 5, 15, 15)
 
-    def itemChange(self, change, value):
-        """
-        Propagates position changes to all connections.
-
-        Args:
-            change (QGraphicsItem.GraphicsItemChange): The type of change.
-            value: The new value.
-
-        Returns:
-            The result of the parent's itemChange method.
-        """
-        if change == QGraphicsObject.GraphicsItemChange.ItemPositionHasChanged:
-            self.in_port.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-            self.out_port.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-            if self.data_in_socket:
-                self.data_in_socket.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-            if self.data_out_socket:
-                self.data_out_socket.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-            for socket in self.data_in_sockets.values(): # NEW
-                socket.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-            if hasattr(self, 'out_port_loop_body'):
-                self.out_port_loop_body.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-                self.out_port_finished.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-            if hasattr(self, 'in_ports'):
-                for port in self.in_ports.values():
-                    port.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-            if hasattr(self, 'out_ports'):
-                for port in self.out_ports.values():
-                    port.itemChange(QGraphicsObject.GraphicsItemChange.ItemScenePositionHasChanged, None)
-        return super().itemChange(change, value)
-
     def destroy(self):
         """Removes the node and all its connections from the scene."""
         for conn in self.in_port.connections[:]: conn.destroy()
@@ -2486,11 +3028,6 @@ class DeleteItemsCommand(QUndoCommand):
         self.scene.scene_changed.emit()
 
     def undo(self):
-        nodes_map = {}
-        for item in self.scene.items():
-            if isinstance(item, (SequenceNode, CommentNode)):
-                nodes_map[item.uuid] = item
-
         # Re-add nodes and comments first
         for data in self.items_data:
             if data['type'] == 'node':
@@ -2498,19 +3035,17 @@ class DeleteItemsCommand(QUndoCommand):
                 node.setPos(data['pos'])
                 self.scene.addItem(node)
                 data['item'] = node
-                nodes_map[node.uuid] = node
             elif data['type'] == 'comment':
                 node = CommentNode(data['text'], data['uuid'])
                 node.setPos(data['pos'])
                 self.scene.addItem(node)
                 data['item'] = node
-                nodes_map[node.uuid] = node
 
-        # Then, re-add connections
+        # Then, re-add connections; the scene's index now holds the re-added nodes too
         for data in self.items_data:
             if data['type'] == 'connection':
-                start_node = nodes_map.get(data['start_uuid'])
-                end_node = nodes_map.get(data['end_uuid'])
+                start_node = self.scene.find_node_by_uuid(data['start_uuid'])
+                end_node = self.scene.find_node_by_uuid(data['end_uuid'])
                 if start_node and end_node:
                     conn = Connection(start_node.out_port, end_node.in_port, self.scene)
                     if data['condition']:
@@ -2518,8 +3053,8 @@ class DeleteItemsCommand(QUndoCommand):
                     self.scene.addItem(conn)
                     data['item'] = conn
             elif data['type'] == 'data_connection':
-                start_node = nodes_map.get(data['start_uuid'])
-                end_node = nodes_map.get(data['end_uuid'])
+                start_node = self.scene.find_node_by_uuid(data['start_uuid'])
+                end_node = self.scene.find_node_by_uuid(data['end_uuid'])
                 if start_node and end_node:
                     end_socket = None
                     # Find the correct socket on the target node using the saved label
@@ -2547,14 +3082,21 @@ class MoveNodesCommand(QUndoCommand):
         self.setText("Move Nodes")
 
     def redo(self):
-        for node, pos in zip(self.nodes, self.new_positions):
-            node.setPos(pos)
-        self.nodes[0].scene().scene_changed.emit()
+        self._move_to(self.new_positions)
 
     def undo(self):
-        for node, pos in zip(self.nodes, self.old_positions):
-            node.setPos(pos)
-        self.nodes[0].scene().scene_changed.emit()
+        self._move_to(self.old_positions)
+
+    def _move_to(self, positions):
+        """Moves the nodes, rebuilding each affected connection path once."""
+        scene = self.nodes[0].scene()
+        scene.begin_move()
+        try:
+            for node, pos in zip(self.nodes, positions):
+                node.setPos(pos)
+        finally:
+            scene.end_move()
+        scene.scene_changed.emit()
 
 class SequenceScene(QGraphicsScene):
     """The canvas for the sequencer editor, with a grid background and snap-to-grid functionality."""
@@ -2570,12 +3112,103 @@ class SequenceScene(QGraphicsScene):
         # Set a large scene rectangle for a scrollable/pannable canvas
         self.setSceneRect(-5000, -5000, 10000, 10000)
         self.setBackgroundBrush(self.background_color)
+        self._grid_tile = None
 
         self.temp_connection = None
         self.mouse_move_pos = QPointF(0,0)
         self.delete_mode = False
         self.undo_stack = QUndoStack(self)
         self.moving_nodes = {}
+        # Move transactions: while one is open, connection paths are rebuilt
+        # at most once per frame, and only for connections whose ends moved.
+        self._move_depth = 0
+        self._dirty_connections = set()
+        self._path_refresh_timer = QTimer(self)
+        self._path_refresh_timer.setSingleShot(True)
+        self._path_refresh_timer.setInterval(PATH_REFRESH_INTERVAL_MS)
+        self._path_refresh_timer.timeout.connect(self.flush_connection_paths)
+        self._drag_in_progress = False
+        # Lookup indexes for runtime highlighting, kept in sync by addItem/removeItem/clear.
+        self._nodes_by_uuid = {}
+        self._connections_by_uuids = {}
+
+    def begin_move(self):
+        """Opens a move transaction; transactions may be nested."""
+        self._move_depth += 1
+
+    def end_move(self):
+        """Closes a move transaction, rebuilding pending paths when the last one ends."""
+        self._move_depth = max(0, self._move_depth - 1)
+        if self._move_depth == 0:
+            self.flush_connection_paths()
+
+    def update_connection_paths(self, connections):
+        """
+        Rebuilds connection paths, or defers it while a move transaction is open.
+
+        Args:
+            connections (list): Connections attached to a port or socket that moved.
+        """
+        if self._move_depth:
+            self._dirty_connections.update(connections)
+            if not self._path_refresh_timer.isActive():
+                self._path_refresh_timer.start()
+        else:
+            for conn in connections:
+                conn.update_path()
+
+    def flush_connection_paths(self):
+        """Rebuilds every deferred connection path once."""
+        self._path_refresh_timer.stop()
+        dirty, self._dirty_connections = self._dirty_connections, set()
+        for conn in dirty:
+            if conn.scene() is self:
+                conn.update_path()
+
+    def addItem(self, item):
+        """Adds an item to the scene and to the lookup indexes."""
+        super().addItem(item)
+        self._index_item(item)
+
+    def removeItem(self, item):
+        """Removes an item from the scene and from the lookup indexes."""
+        self._unindex_item(item)
+        super().removeItem(item)
+
+    def clear(self):
+        """Removes all items from the scene and empties the lookup indexes."""
+        self._nodes_by_uuid.clear()
+        self._connections_by_uuids.clear()
+        self._dirty_connections.clear()
+        super().clear()
+
+    def _index_item(self, item):
+        """
+        Registers a node or a complete execution connection for O(1) lookup.
+
+        Connections still being dragged (without an end port) are indexed
+        once they are dropped onto a port.
+        """
+        if isinstance(item, (SequenceNode, CommentNode)):
+            self._nodes_by_uuid[item.uuid] = item
+        elif isinstance(item, Connection) and item.end_port:
+            key = (item.start_port.parentItem().uuid, item.end_port.parentItem().uuid)
+            connections = self._connections_by_uuids.setdefault(key, [])
+            if item not in connections:
+                connections.append(item)
+
+    def _unindex_item(self, item):
+        """Drops a node or an execution connection from the lookup indexes."""
+        if isinstance(item, (SequenceNode, CommentNode)):
+            if self._nodes_by_uuid.get(item.uuid) is item:
+                del self._nodes_by_uuid[item.uuid]
+        elif isinstance(item, Connection) and item.end_port:
+            key = (item.start_port.parentItem().uuid, item.end_port.parentItem().uuid)
+            connections = self._connections_by_uuids.get(key)
+            if connections and item in connections:
+                connections.remove(item)
+                if not connections:
+                    del self._connections_by_uuids[key]
 
     def group_selected_nodes(self):
         selected_nodes = [item for item in self.selectedItems() if isinstance(item, SequenceNode)]
@@ -2612,39 +3245,56 @@ class SequenceScene(QGraphicsScene):
         self.scene_changed.emit()
 
     def drawBackground(self, painter: QPainter, rect: QRectF):
-        """Draws a dot grid background, inspired by Node-RED."""
+        """
+        Draws a dot grid background, inspired by Node-RED.
+
+        The grid is drawn as translated copies of a cached block of points,
+        one `drawPoints` call per block, and is hidden when zoomed out below
+        GRID_MIN_LOD.
+        """
         super().drawBackground(painter, rect)
 
-        left = int(rect.left())
-        right = int(rect.right())
-        top = int(rect.top())
-        bottom = int(rect.bottom())
+        if level_of_detail(painter) < GRID_MIN_LOD:
+            return
+
+        tile, pen = self._get_grid_tile()
+        tile_span = self.grid_size * _GRID_TILE_POINTS
 
-        # Align to the grid
-        first_left = left - (left % self.grid_size)
-        first_top = top - (top % self.grid_size)
+        # Align to the tile grid, which is aligned to the dot grid
+        first_left = math.floor(rect.left() / tile_span) * tile_span
+        first_top = math.floor(rect.top() / tile_span) * tile_span
 
-        # Draw grid points
-        pen = QPen(self.grid_color)
-        pen.setWidth(1)
+        painter.save()
         painter.setPen(pen)
+        for x in range(first_left, math.ceil(rect.right()), tile_span):
+            for y in range(first_top, math.ceil(rect.bottom()), tile_span):
+                painter.drawPoints(tile.translated(x, y))
+        painter.restore()
 
-        for x in range(first_left, right, self.grid_size):
-            for y in range(first_top, bottom, self.grid_size):
-                painter.drawPoint(x, y)
+    def _get_grid_tile(self):
+        """
+        Returns the cached block of grid points and the pen to draw it with.
+
+        The cache is rebuilt when the grid size or color changes.
+
+        Returns:
+            tuple: (QPolygonF, QPen)
+        """
+        key = (self.grid_size, self.grid_color.rgba())
+        if self._grid_tile is None or self._grid_tile[0] != key:
+            points = QPolygonF([QPointF(i * self.grid_size, j * self.grid_size)
+                                for i in range(_GRID_TILE_POINTS) for j in range(_GRID_TILE_POINTS)])
+            pen = QPen(self.grid_color)
+            pen.setWidth(1)
+            self._grid_tile = (key, points, pen)
+        return self._grid_tile[1], self._grid_tile[2]
 
     def find_node_by_uuid(self, uuid_str):
-        for item in self.items():
-            if isinstance(item, (SequenceNode, CommentNode)) and item.uuid == uuid_str:
-                return item
-        return None
+        return self._nodes_by_uuid.get(uuid_str)
 
     def find_connection_by_uuids(self, start_uuid, end_uuid):
-        for item in self.items():
-            if isinstance(item, Connection):
-                if item.start_port.parentItem().uuid == start_uuid and item.end_port.parentItem().uuid == end_uuid:
-                    return item
-        return None
+        connections = self._connections_by_uuids.get((start_uuid, end_uuid))
+        return connections[0] if connections else None
 
     def contextMenuEvent(self, event):
         item_at_pos = self.itemAt(event.scenePos(), self.views()[0].transform())
@@ -2686,6 +3336,8 @@ class SequenceScene(QGraphicsScene):
             add_method_action.setEnabled(False)
             add_delay_action = add_node_menu.addAction(NodeType.DELAY.value)
             add_write_action = add_node_menu.addAction(NodeType.WRITE_VALUE.value)
+            add_batch_read_action = add_node_menu.addAction(NodeType.BATCH_READ.value)
+            add_batch_write_action = add_node_menu.addAction(NodeType.BATCH_WRITE.value)
             add_static_action = add_node_menu.addAction(NodeType.STATIC_VALUE.value)
             add_compute_action = add_node_menu.addAction(NodeType.COMPUTE.value) # NEW
             add_node_menu.addSeparator()
@@ -2715,6 +3367,10 @@ class SequenceScene(QGraphicsScene):
                 self.add_new_node_requested.emit(NodeType.DELAY, pos)
             elif action == add_write_action:
                 self.add_new_node_requested.emit(NodeType.WRITE_VALUE, pos)
+            elif action == add_batch_read_action:
+                self.add_new_node_requested.emit(NodeType.BATCH_READ, pos)
+            elif action == add_batch_write_action:
+                self.add_new_node_requested.emit(NodeType.BATCH_WRITE, pos)
             elif action == add_static_action:
                 self.add_new_node_requested.emit(NodeType.STATIC_VALUE, pos)
             elif action == add_run_sequence_action:
@@ -2796,6 +3452,10 @@ class SequenceScene(QGraphicsScene):
             for selected_item in self.selectedItems():
                 if isinstance(selected_item, (SequenceNode, CommentNode)):
                     self.moving_nodes[selected_item] = selected_item.pos()
+            if not self._drag_in_progress and any(isinstance(item, (SequenceNode, GroupNode)) for item in self.selectedItems()):
+                # Defer path rebuilds while the selection is dragged
+                self.begin_move()
+                self._drag_in_progress = True
 
     def mouseMoveEvent(self, event):
         self.mouse_move_pos = event.scenePos()
@@ -2822,6 +3482,9 @@ class SequenceScene(QGraphicsScene):
                 command = MoveNodesCommand(moved_nodes, old_positions, new_positions)
                 self.undo_stack.push(command)
         self.moving_nodes.clear()
+        if self._drag_in_progress:
+            self._drag_in_progress = False
+            self.end_move()
 
         if self.temp_connection:
             item = self.itemAt(event.scenePos(), self.views()[0].transform())
@@ -2848,6 +3511,7 @@ class SequenceScene(QGraphicsScene):
                     self.temp_connection.end_port = target_port
                     target_port.connections.append(self.temp_connection)
                     self.temp_connection.update_path()
+                    self._index_item(self.temp_connection)
 
                     if self.temp_connection.start_port.parentItem().config.get('node_.type') in [NodeType.FOR_LOOP.value, NodeType.WHILE_LOOP.value]:
                         condition = {'operator': self.temp_connection.start_port.label}
@@ -2894,10 +3558,16 @@ class SequenceScene(QGraphicsScene):
                 dialog = MySQLReadNodeDialog(self.views()[0], current_config=item.config)
             elif node_type == NodeType.METHOD_CALL.value or node_type == NodeType.WRITE_VALUE.value:
                 dialog = NodeConfigDialog(self.views()[0], current_config=item.config)
+            elif node_type in (NodeType.BATCH_READ.value, NodeType.BATCH_WRITE.value):
+                dialog = BatchValueDialog(self.views()[0], current_config=item.config,
+                                          is_write=node_type == NodeType.BATCH_WRITE.value)
             elif node_type == NodeType.PYTHON_SCRIPT.value:
-                dialog = PythonScriptDialog(self.views()[0], script=item.config.get('script', ''))
+                dialog = PythonScriptDialog(self.views()[0], script=item.config.get('script', ''),
+                                            run_in_process=item.config.get('run_in_process', False))
                 if dialog.exec():
                     item.config['script'] = dialog.get_script()
+                    item.config['run_in_process'] = dialog.is_run_in_process()
+                    script_cache.invalidate(item.uuid)
                     self.scene_changed.emit()
                 return
             elif node_type == NodeType.DELAY.value:
@@ -2948,20 +3618,133 @@ class SequenceScene(QGraphicsScene):
         super().mouseDoubleClickEvent(event)
 
 class Minimap(QGraphicsView):
+    """
+    An overview of the sequence scene in the corner of the editor.
+
+    Instead of rendering the scene's items live through a second view, the
+    minimap shows a cached raster of the scene at its own resolution. The
+    scene's `changed` signal marks regions of the raster dirty; they are
+    re-rendered together at most every MINIMAP_REFRESH_INTERVAL_MS, and not
+    at all while the minimap is hidden. The main view's visible area is
+    drawn on top in `drawForeground`, so scrolling and zooming the main
+    view only repaints the overlay.
+
+    Args:
+        main_view (SequenceEditor): The editor whose scene is shown.
+    """
     def __init__(self, main_view):
         super().__init__(main_view.viewport())
         self.main_view = main_view
-        self.setScene(self.main_view.scene)
+        self.source_scene = self.main_view.scene
+        # The minimap's own scene stays empty; it only provides the coordinate
+        # system (identical to the source scene's) and the paint callbacks.
+        self.setScene(QGraphicsScene(self.source_scene.sceneRect(), self))
         self._is_panning = False
         self._is_dragging_viewport = False
         self._drag_start_pos = QPointF()
 
+        self._raster = None
+        self._raster_scale = 0.0
+        self._raster_view_scale = 0.0
+        self._dirty_rects = []
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(MINIMAP_REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh_raster)
+        self.source_scene.changed.connect(self.on_scene_changed)
+
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.setInteractive(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setStyleSheet("border: 1px solid #555;") # Add a border for visibility
 
+    def on_scene_changed(self, regions):
+        """
+        Marks changed scene regions for the next throttled raster refresh.
+
+        Args:
+            regions (list[QRectF]): The changed areas, in scene coordinates.
+        """
+        if self._raster is None or not self.isVisible():
+            # The raster is rebuilt completely when the minimap is shown again.
+            self._raster = None
+            self._dirty_rects.clear()
+            return
+        self._dirty_rects.extend(regions)
+        if len(self._dirty_rects) > MINIMAP_MAX_DIRTY_RECTS:
+            # Many scattered changes: one pass over their bounding rect is cheaper.
+            bounds = QRectF()
+            for rect in self._dirty_rects:
+                bounds = bounds.united(rect)
+            self._dirty_rects = [bounds]
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def refresh_raster(self):
+        """Re-renders the dirty regions of the raster and repaints the minimap."""
+        self._refresh_timer.stop()
+        dirty, self._dirty_rects = self._dirty_rects, []
+        if self._raster is None or not dirty:
+            return
+        painter = QPainter(self._raster)
+        try:
+            for rect in dirty:
+                self._render_region(painter, rect)
+        finally:
+            painter.end()
+        self.viewport().update()
+
+    def rebuild_raster(self):
+        """Renders the whole source scene into a raster matching the current zoom."""
+        self._refresh_timer.stop()
+        self._dirty_rects.clear()
+        scene_rect = self.source_scene.sceneRect()
+        self._raster_view_scale = self.transform().m11()
+        # Normally the minimap's own zoom; capped in case it has not been fitted yet.
+        self._raster_scale = min(self._raster_view_scale,
+                                 MINIMAP_MAX_RASTER_SIZE / max(scene_rect.width(), scene_rect.height(), 1.0))
+        size = QSize(max(1, math.ceil(scene_rect.width() * self._raster_scale)),
+                     max(1, math.ceil(scene_rect.height() * self._raster_scale)))
+        self._raster = QPixmap(size)
+        painter = QPainter(self._raster)
+        try:
+            self._render_region(painter, scene_rect)
+        finally:
+            painter.end()
+
+    def _render_region(self, painter, scene_region):
+        """
+        Renders a region of the source scene into the raster.
+
+        The region is widened to whole raster pixels so repeated partial
+        renders do not leave seams.
+
+        Args:
+            painter (QPainter): A painter on the raster.
+            scene_region (QRectF): The region to render, in scene coordinates.
+        """
+        scene_rect = self.source_scene.sceneRect()
+        scale = self._raster_scale
+        target = QRectF((scene_region.x() - scene_rect.x()) * scale, (scene_region.y() - scene_rect.y()) * scale,
+                        scene_region.width() * scale, scene_region.height() * scale)
+        target = QRectF(target.toAlignedRect()).intersected(QRectF(self._raster.rect()))
+        if target.isEmpty():
+            return
+        source = QRectF(scene_rect.x() + target.x() / scale, scene_rect.y() + target.y() / scale,
+                        target.width() / scale, target.height() / scale)
+        painter.save()
+        painter.setClipRect(target)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(target, self.source_scene.backgroundBrush())
+        self.source_scene.render(painter, target, source, Qt.AspectRatioMode.IgnoreAspectRatio)
+        painter.restore()
+
+    def drawBackground(self, painter, rect):
+        """Draws the cached raster of the source scene."""
+        if self._raster is None or not math.isclose(self._raster_view_scale, self.transform().m11()):
+            self.rebuild_raster()
+        painter.drawPixmap(self.source_scene.sceneRect(), self._raster, QRectF(self._raster.rect()))
+
     def get_viewport_polygon(self):
         """Calculates and returns the viewport polygon in minimap coordinates."""
         main_viewport_rect = self.main_view.viewport().rect()
@@ -2969,12 +3752,16 @@ class Minimap(QGraphicsView):
         return self.mapFromScene(visible_scene_poly)
 
     def drawForeground(self, painter, rect):
+        """Draws the main view's visible area over the raster."""
         super().drawForeground(painter, rect)
-        minimap_viewport_poly = self.get_viewport_polygon()
+        # The painter works in scene coordinates here.
+        visible_scene_poly = self.main_view.mapToScene(self.main_view.viewport().rect())
 
-        painter.setPen(QPen(QColor(255, 255, 255, 128), 1))
+        pen = QPen(QColor(255, 255, 255, 128), 1)
+        pen.setCosmetic(True)
+        painter.setPen(pen)
         painter.setBrush(QBrush(QColor(255, 255, 255, 70)))
-        painter.drawPolygon(minimap_viewport_poly)
+        painter.drawPolygon(visible_scene_poly)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
@@ -3034,6 +3821,11 @@ class SequenceEditor(QGraphicsView):
         self.setScene(self.scene)
         self.scene.scene_changed.connect(self.scene_changed)
         self.scene.add_new_node_requested.connect(self.on_add_new_node)
+        # Counts edits, so `snapshot` can hand out the same dict until the next one.
+        self.revision = 0
+        self._snapshot = None
+        self._snapshot_revision = -1
+        self.scene_changed.connect(self._on_edited)
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
         self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
@@ -3057,8 +3849,8 @@ class SequenceEditor(QGraphicsView):
 
         # --- Minimap ---
         self.minimap = Minimap(self)
-        self.horizontalScrollBar().valueChanged.connect(self.minimap.update)
-        self.verticalScrollBar().valueChanged.connect(self.minimap.update)
+        self.horizontalScrollBar().valueChanged.connect(self.minimap.viewport().update)
+        self.verticalScrollBar().valueChanged.connect(self.minimap.viewport().update)
 
         # --- Minimap Toggle Button ---
         self.minimap_toggle_button = QPushButton(self)
@@ -3169,13 +3961,13 @@ class SequenceEditor(QGraphicsView):
         """Scales the view up by 20%."""
         self.scale(1.2, 1.2)
         if self.minimap:
-            self.minimap.update()
+            self.minimap.viewport().update()
 
     def zoom_out(self):
         """Scales the view down by 20%."""
         self.scale(1 / 1.2, 1 / 1.2)
         if self.minimap:
-            self.minimap.update()
+            self.minimap.viewport().update()
 
     def reset_zoom(self):
         """Resets the view's transformation to the default state."""
@@ -3324,6 +4116,12 @@ class SequenceEditor(QGraphicsView):
             config['label'] = "Write Value"
             config['node_id'] = ""
             config['has_argument'] = True
+        elif node_type == NodeType.BATCH_READ:
+            config['label'] = "Batch Read (0)"
+            config['node_ids'] = []
+        elif node_type == NodeType.BATCH_WRITE:
+            config['label'] = "Batch Write (0)"
+            config['items'] = []
         elif node_type == NodeType.STATIC_VALUE:
             config['label'] = "Static Value"
             config['static_value'] = "0"
@@ -3369,6 +4167,9 @@ class SequenceEditor(QGraphicsView):
         elif node_type == NodeType.MYSQL_READ:
             config['label'] = "MySQL Read"
             config['query'] = "SELECT * FROM my_table"
+            config['output_format'] = OUTPUT_ROWS
+            config['stream'] = False
+            config['chunk_size'] = 1000
 
         command = AddNodeCommand(self.scene, config, position)
         self.scene.undo_stack.push(command)
@@ -3382,6 +4183,26 @@ class SequenceEditor(QGraphicsView):
         else:
             super().keyPressEvent(event)
 
+    def _on_edited(self):
+        """Bumps the revision after any edit of the scene."""
+        self.revision += 1
+
+    def snapshot(self):
+        """
+        Returns the serialized scene, reserializing only after an edit.
+
+        The same dictionary is returned while `revision` is unchanged, so the
+        execution plan cache, which matches plans to the dictionary they were
+        compiled from, reuses the plan across runs.
+
+        Returns:
+            dict: The serialized sequence. Callers must not modify it.
+        """
+        if self._snapshot is None or self._snapshot_revision != self.revision:
+            self._snapshot = self.serialize()
+            self._snapshot_revision = self.revision
+        return self._snapshot
+
     def serialize(self):
         """Serializes the scene to a dictionary."""
         nodes = []
@@ -3405,6 +4226,7 @@ class SequenceEditor(QGraphicsView):
 
     def load_data(self, data):
         """Loads a scene from a dictionary."""
+        self._snapshot = None
         self.scene.clear()
         self.scene.undo_stack.clear()
         nodes_map = {}
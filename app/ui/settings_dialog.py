@@ -8,10 +8,11 @@ and MySQL database credentials using Qt's QSettings.
 import logging
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QLineEdit,
                              QDialogButtonBox, QComboBox, QLabel, QCheckBox,
-                             QTabWidget, QWidget, QPushButton, QMessageBox, QHBoxLayout)
+                             QTabWidget, QWidget, QPushButton, QMessageBox, QHBoxLayout, QSpinBox)
 from PyQt6.QtCore import QSettings
 
 from app.core.mysql_manager import MySQLManager
+from app.ui.widgets.update_dispatcher import DEFAULT_FRAME_RATE
 
 class SettingsDialog(QDialog):
     """
@@ -75,6 +76,11 @@ class SettingsDialog(QDialog):
         self.switch_to_sequencer_checkbox = QCheckBox("Switch to Sequencer tab on run")
         layout.addRow(self.switch_to_sequencer_checkbox)
 
+        self.ui_frame_rate_spinbox = QSpinBox()
+        self.ui_frame_rate_spinbox.setRange(1, 120)
+        self.ui_frame_rate_spinbox.setSuffix(" fps")
+        layout.addRow(QLabel("Dashboard Refresh Rate:"), self.ui_frame_rate_spinbox)
+
     def setup_mysql_tab(self):
         """
         Sets up the UI for the 'MySQL' settings tab.
@@ -92,6 +98,18 @@ class SettingsDialog(QDialog):
         layout.addRow(QLabel("Password:"), self.mysql_password_input)
         layout.addRow(QLabel("Database Name:"), self.mysql_db_input)
 
+        self.mysql_pool_size_spinbox = QSpinBox()
+        self.mysql_pool_size_spinbox.setRange(1, 32)
+        self.mysql_pool_size_spinbox.setToolTip("Maximum number of persistent connections shared by running sequences.")
+        layout.addRow(QLabel("Connection Pool Size:"), self.mysql_pool_size_spinbox)
+
+        self.mysql_query_timeout_spinbox = QSpinBox()
+        self.mysql_query_timeout_spinbox.setRange(0, 3600)
+        self.mysql_query_timeout_spinbox.setSuffix(" s")
+        self.mysql_query_timeout_spinbox.setSpecialValueText("No timeout")
+        self.mysql_query_timeout_spinbox.setToolTip("Time after which a MySQL node's query is aborted.")
+        layout.addRow(QLabel("Query Timeout:"), self.mysql_query_timeout_spinbox)
+
         button_layout = QHBoxLayout()
         test_button = QPushButton("Test Connection")
         test_button.clicked.connect(self.test_mysql_connection)
@@ -163,12 +181,15 @@ class SettingsDialog(QDialog):
         self.server_url_input.setText(server_url)
         self.theme_combo.setCurrentText(theme)
         self.switch_to_sequencer_checkbox.setChecked(switch_on_run)
+        self.ui_frame_rate_spinbox.setValue(self.settings.value("ui_frame_rate", DEFAULT_FRAME_RATE, type=int))
 
         # MySQL settings
         self.mysql_host_input.setText(self.settings.value("mysql/host", "localhost"))
         self.mysql_user_input.setText(self.settings.value("mysql/user", "root"))
         self.mysql_password_input.setText(self.settings.value("mysql/password", ""))
         self.mysql_db_input.setText(self.settings.value("mysql/database", "nodeflow_db"))
+        self.mysql_pool_size_spinbox.setValue(self.settings.value("mysql/pool_size", 4, type=int))
+        self.mysql_query_timeout_spinbox.setValue(self.settings.value("mysql/query_timeout", 30, type=int))
 
 
     def save_settings(self):
@@ -179,6 +200,7 @@ class SettingsDialog(QDialog):
         self.settings.setValue("server_url", self.server_url_input.text())
         self.settings.setValue("theme", self.theme_combo.currentText())
         self.settings.setValue("switch_on_run", self.switch_to_sequencer_checkbox.isChecked())
+        self.settings.setValue("ui_frame_rate", self.ui_frame_rate_spinbox.value())
 
         # MySQL settings
         self.settings.beginGroup("mysql")
@@ -186,6 +208,8 @@ class SettingsDialog(QDialog):
         self.settings.setValue("user", self.mysql_user_input.text())
         self.settings.setValue("password", self.mysql_password_input.text())
         self.settings.setValue("database", self.mysql_db_input.text())
+        self.settings.setValue("pool_size", self.mysql_pool_size_spinbox.value())
+        self.settings.setValue("query_timeout", self.mysql_query_timeout_spinbox.value())
         self.settings.endGroup()
 
         self.accept()
@@ -17,7 +17,14 @@ class BaseWidget(QFrame):
         request_copy (pyqtSignal): Emitted when the user requests to copy the widget's config.
         request_duplicate (pyqtSignal): Emitted when the user requests to duplicate the widget.
         state_changed (pyqtSignal): Emitted when the widget's state (e.g., minimized) changes.
+        DEFAULT_PUBLISHING_INTERVAL (int): The update rate (ms) requested when the
+                                           config does not set 'publishing_interval'.
+        DEFAULT_QUEUE_SIZE (int): The monitored item queue size requested when the
+                                  config does not set 'queue_size'.
     """
+    DEFAULT_PUBLISHING_INTERVAL = 500
+    DEFAULT_QUEUE_SIZE = 1
+
     request_delete = pyqtSignal(QWidget)
     request_copy = pyqtSignal(dict)
     request_duplicate = pyqtSignal(dict)
@@ -38,6 +45,8 @@ class BaseWidget(QFrame):
         self.opcua_logic = opcua_logic
         self.async_runner = async_runner
         self.node = None
+        # Set by the dashboard to coalesce subscription updates into UI ticks.
+        self.update_dispatcher = None
         
         self.is_deletable = False
         self.drag_position = None
@@ -225,6 +234,40 @@ class BaseWidget(QFrame):
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
+    async def subscribe_to_node(self, callback, batch_callback=None, max_pending=None, include_timestamp=False, node=None):
+        """
+        Subscribes to the widget's node at the rate requested in its config.
+
+        When an update dispatcher is set, updates are delivered on its UI tick
+        instead of on every notification: `callback` receives only the latest
+        value, or `batch_callback` (if given) receives all values since the
+        last tick as a list.
+
+        Args:
+            callback (callable): Called with a new value of the node.
+            batch_callback (callable, optional): Called with a list of new values.
+            max_pending (int, optional): The maximum number of values buffered
+                                         for `batch_callback` while hidden.
+            include_timestamp (bool, optional): True to receive (value, timestamp)
+                                                pairs instead of bare values.
+            node (asyncua.Node, optional): The node to subscribe to. Defaults
+                                           to the widget's own node.
+
+        Returns:
+            The subscription handle from `OpcuaClientLogic.subscribe_to_node_change`.
+        """
+        if self.update_dispatcher is not None:
+            if batch_callback is not None:
+                callback = self.update_dispatcher.all_values_channel(self, batch_callback, max_pending)
+            else:
+                callback = self.update_dispatcher.latest_value_channel(self, callback)
+        return await self.opcua_logic.subscribe_to_node_change(
+            node or self.node, callback,
+            self.config.get('publishing_interval', self.DEFAULT_PUBLISHING_INTERVAL),
+            self.config.get('queue_size', self.DEFAULT_QUEUE_SIZE),
+            include_timestamp
+        )
+
     def stop_subscription(self):
         """
         Virtual method to be overridden by subclasses that use subscriptions.
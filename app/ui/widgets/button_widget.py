@@ -118,7 +118,7 @@ class ButtonWidget(BaseWidget):
                 self.show_result(f"<font color='red'>Error: Method '{method_bname}' not found.</font>")
                 return
 
-            result = await self.node.call_method(method_node, *args)
+            result = await self.opcua_logic.call_method(self.node, method_node, *args)
             self.show_result(f"<b>Result:</b> {result}")
         except Exception as e:
             self.show_result(f"<font color='red'><b>Call Error:</b><br>{e}</font>")
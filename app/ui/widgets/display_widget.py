@@ -66,7 +66,7 @@ class DisplayWidget(BaseWidget):
              self.status_label.setText(f"Node: {self.node.nodeid.to_string()}")
         
         # Subscribe to the node, passing our on_data_changed method as the callback.
-        self.subscription_handle = await self.opcua_logic.subscribe_to_node_change(self.node, self.on_data_changed)
+        self.subscription_handle = await self.subscribe_to_node(self.on_data_changed)
 
     def on_data_changed(self, value):
         """
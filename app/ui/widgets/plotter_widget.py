@@ -1,17 +1,104 @@
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QVBoxLayout
 from app.ui.widgets.base_widget import BaseWidget
-from collections import deque
+from app.core.ring_buffer import TimeSeriesRingBuffer
+from app.core.decimation import MinMaxPyramid
 import numpy as np
 
+# Pen colors for the overlaid channels, in order.
+CHANNEL_COLORS = ['y', 'c', 'm', 'g', 'r', 'w', (255, 128, 0), (128, 128, 255)]
+
+
+class PlotChannel:
+    """
+    One plotted node: its sample buffer, decimation pyramid and curve.
+
+    Attributes:
+        identifier (str): The node identifier of the channel.
+        node (asyncua.Node): The subscribed node, once found.
+        buffer (TimeSeriesRingBuffer): The channel's timestamped samples.
+        pyramid (MinMaxPyramid): The min/max summary used for rendering.
+        curve (pyqtgraph.PlotDataItem): The curve drawing the channel.
+        subscription_handle: The handle of the channel's subscription.
+    """
+    def __init__(self, identifier, capacity, curve):
+        """
+        Initializes a PlotChannel.
+
+        Args:
+            identifier (str): The node identifier of the channel.
+            capacity (int): The number of samples kept in the buffer.
+            curve (pyqtgraph.PlotDataItem): The curve drawing the channel.
+        """
+        self.identifier = identifier
+        self.node = None
+        self.buffer = TimeSeriesRingBuffer(capacity)
+        self.pyramid = MinMaxPyramid()
+        self.curve = curve
+        self.subscription_handle = None
+        self._pending_samples = 0
+
+    def append(self, samples):
+        """
+        Appends (value, timestamp) samples, ignoring non-numeric values.
+
+        Args:
+            samples (list): (value, timestamp) pairs, oldest first.
+
+        Returns:
+            bool: True if any sample was appended.
+        """
+        if not samples:
+            return False
+        values, timestamps = zip(*samples)
+        try:
+            values = np.asarray(values, dtype=np.float64)
+        except (ValueError, TypeError):
+            # Ignore non-numeric values
+            numeric = [(t, float(v)) for v, t in samples if _is_numeric(v)]
+            if not numeric:
+                return False
+            timestamps, values = zip(*numeric)
+        self.buffer.extend(timestamps, values)
+        self._pending_samples += len(values)
+        return True
+
+    def render(self, columns, x_range=None):
+        """
+        Draws the channel's min/max envelope for the given range.
+
+        Args:
+            columns (int): The plot width in pixels.
+            x_range (tuple, optional): The visible (start, end) time range.
+                                       Defaults to the full buffer.
+        """
+        if self._pending_samples:
+            # Only the pyramid blocks covering the new samples are recomputed.
+            self.pyramid.extend(self.buffer.timestamps(), self.buffer.values(), self._pending_samples)
+            self._pending_samples = 0
+        x_min, x_max = x_range if x_range else (None, None)
+        x, y = self.pyramid.decimate(columns, x_min, x_max)
+        self.curve.setData(x, y, skipFiniteCheck=True)
+
+
 class PlotterWidget(BaseWidget):
     """
-    A widget for plotting real-time data from an OPC UA node.
+    A widget for plotting real-time data from one or more OPC UA nodes.
 
     It uses `pyqtgraph` to display a line chart that updates with new values
-    received from an OPC UA subscription. A deque is used as a circular buffer
-    to store a moving window of the most recent data points.
+    received from OPC UA subscriptions. Samples are kept with their server
+    timestamps in a preallocated NumPy ring buffer per channel. Only a min/max
+    envelope per pixel column of the visible range is handed to pyqtgraph, so
+    long histories stay interactive while zooming and panning. Additional
+    nodes configured under 'extra_identifiers' are overlaid on the same time
+    axis.
+
+    Plots default to a faster update rate than other widgets, with a server-side
+    queue so that samples taken between publishes are not lost.
     """
+    DEFAULT_PUBLISHING_INTERVAL = 100
+    DEFAULT_QUEUE_SIZE = 10
+
     def __init__(self, config, opcua_logic, parent=None, async_runner=None):
         """
         Initializes the PlotterWidget.
@@ -23,50 +110,96 @@ class PlotterWidget(BaseWidget):
             async_runner (AsyncRunner, optional): The runner for async tasks. Defaults to None.
         """
         super().__init__(config, opcua_logic, parent, async_runner)
-        self.plot_widget = pg.PlotWidget()
+        self.plot_widget = pg.PlotWidget(axisItems={'bottom': pg.DateAxisItem()})
         self.content_area_layout.addWidget(self.plot_widget)
 
-        buffer_size = config.get('buffer_size', 100)
-        self.data_buffer = deque(maxlen=buffer_size)
-        self.plot_curve = self.plot_widget.plot(pen='y')
+        self.buffer_size = max(1, int(config.get('buffer_size', 100)))
+        identifiers = [config.get('identifier', '')] + list(config.get('extra_identifiers', []))
+        if len(identifiers) > 1:
+            self.plot_widget.addLegend()
+
+        self.channels = []
+        for i, identifier in enumerate(identifiers):
+            name = config.get('label', identifier) if i == 0 else identifier
+            curve = self.plot_widget.plot(pen=CHANNEL_COLORS[i % len(CHANNEL_COLORS)], name=name)
+            self.channels.append(PlotChannel(identifier, self.buffer_size, curve))
+        self.plot_curve = self.channels[0].curve
+
+        view_box = self.plot_widget.getViewBox()
+        view_box.sigXRangeChanged.connect(self.on_view_changed)
+        view_box.sigResized.connect(self.render_all_channels)
 
     async def setup_widget(self):
         """
-        Subscribes to the OPC UA node to start receiving data for plotting.
+        Subscribes to the OPC UA node(s) to start receiving data for plotting.
         """
         self.status_label.setText("Status: Subscribing...")
         try:
-            self.subscription_handle = await self.opcua_logic.subscribe_to_node_change(self.node, self.on_data_change)
+            primary = self.channels[0]
+            primary.node = self.node
+            for channel in self.channels[1:]:
+                channel.node = await self.opcua_logic.find_node(channel.identifier, "By Node ID")
+            for channel in self.channels:
+                channel.subscription_handle = await self.subscribe_to_node(
+                    lambda sample, c=channel: self.on_channel_batch(c, [sample]),
+                    batch_callback=lambda samples, c=channel: self.on_channel_batch(c, samples),
+                    max_pending=self.buffer_size, include_timestamp=True, node=channel.node
+                )
+            self.subscription_handle = primary.subscription_handle
             self.status_label.setText("Status: OK")
         except Exception as e:
             self.set_error_state(f"Sub Error: {e}")
 
-    def on_data_change(self, value):
+    def on_channel_batch(self, channel, samples):
+        """
+        Appends new samples to a channel and redraws it once.
+
+        Args:
+            channel (PlotChannel): The channel that received the samples.
+            samples (list): (value, timestamp) pairs, oldest first.
+        """
+        if channel.append(samples):
+            self.render_channel(channel)
+
+    def on_view_changed(self, *args):
+        """
+        Redraws all channels after the user zooms or pans the plot.
+
+        While the view follows the data (auto-range), channels are redrawn as
+        data arrives instead, so range changes caused by that are ignored.
         """
-        Callback method for the OPC UA subscription.
+        if self.plot_widget.getViewBox().autoRangeEnabled()[0]:
+            return
+        self.render_all_channels()
+
+    def render_all_channels(self, *args):
+        """Redraws every channel, e.g. after the plot was resized."""
+        for channel in self.channels:
+            self.render_channel(channel)
 
-        This is called every time the subscribed node's value changes. It adds
-        the new value to the data buffer and updates the plot.
+    def render_channel(self, channel):
+        """
+        Draws a channel decimated to the plot's current width and time range.
 
         Args:
-            value: The new value received from the subscription.
+            channel (PlotChannel): The channel to draw.
         """
-        try:
-            self.data_buffer.append(float(value))
-            self.plot_curve.setData(np.array(self.data_buffer))
-        except (ValueError, TypeError):
-            # Ignore non-numeric values
-            pass
+        view_box = self.plot_widget.getViewBox()
+        columns = max(1, int(view_box.width()))
+        x_range = None if view_box.autoRangeEnabled()[0] else view_box.viewRange()[0]
+        channel.render(columns, x_range)
 
     def stop_subscription(self):
         """
-        Stops the OPC UA subscription for this widget.
+        Stops the OPC UA subscriptions for this widget.
 
         This is called before the widget is deleted to ensure proper cleanup.
         """
-        if hasattr(self, 'subscription_handle') and self.subscription_handle:
-            self.async_runner.submit(self.opcua_logic.unsubscribe_from_node_change(self.node, self.subscription_handle))
-            self.subscription_handle = None
+        for channel in self.channels:
+            if channel.subscription_handle and self.async_runner:
+                self.async_runner.submit(self.opcua_logic.unsubscribe_from_node_change(channel.node, channel.subscription_handle))
+            channel.subscription_handle = None
+        self.subscription_handle = None
 
     def serialize(self):
         """
@@ -76,5 +209,14 @@ class PlotterWidget(BaseWidget):
             dict: A dictionary containing the widget's state.
         """
         base_data = super().serialize()
-        base_data['config']['buffer_size'] = self.data_buffer.maxlen
+        base_data['config']['buffer_size'] = self.buffer_size
         return base_data
+
+
+def _is_numeric(value):
+    """Returns True if the value can be plotted as a float."""
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
@@ -3,6 +3,9 @@ from PyQt6.QtGui import QAction
 from PyQt6.QtCore import pyqtSignal, Qt
 from .base_widget import BaseWidget
 
+# Mirrors the values of ExecutionProfile in the sequencer engine.
+EXECUTION_PROFILES = ["Visual", "Fast", "Headless"]
+
 class SequenceWidget(BaseWidget):
     """
     A dashboard widget to control a pre-defined sequence.
@@ -14,11 +17,12 @@ class SequenceWidget(BaseWidget):
 
     Attributes:
         run_sequence_requested (pyqtSignal): Emitted to request a sequence run.
-                                             Passes sequence_name (str) and loop (bool).
+                                             Passes sequence_name (str), loop (bool)
+                                             and the execution profile name (str).
         stop_sequence_requested (pyqtSignal): Emitted to request a sequence stop.
                                               Passes sequence_name (str).
     """
-    run_sequence_requested = pyqtSignal(str, bool)
+    run_sequence_requested = pyqtSignal(str, bool, str)
     stop_sequence_requested = pyqtSignal(str)
     widget_changed = pyqtSignal()
 
@@ -35,6 +39,7 @@ class SequenceWidget(BaseWidget):
         super().__init__(config, opcua_logic, parent, async_runner)
         
         self.sequence_name = config.get('sequence_name', 'N/A')
+        self.execution_profile = config.get('execution_profile', EXECUTION_PROFILES[0])
         
         self.is_running = False
 
@@ -83,7 +88,18 @@ class SequenceWidget(BaseWidget):
             self.stop_sequence_requested.emit(self.sequence_name)
         else:
             # Default click action is still to run once.
-            self.run_sequence_requested.emit(self.sequence_name, False)
+            self.run_sequence_requested.emit(self.sequence_name, False, self.execution_profile)
+
+    def set_execution_profile(self, profile_name):
+        """
+        Sets the execution profile used when this widget starts its sequence.
+
+        Args:
+            profile_name (str): One of 'Visual', 'Fast' or 'Headless'.
+        """
+        self.execution_profile = profile_name
+        self.config['execution_profile'] = profile_name
+        self.state_changed.emit(self.is_minimized)
 
     def set_running_state(self, is_running, is_looping=False):
         """
@@ -133,13 +149,21 @@ class SequenceWidget(BaseWidget):
             context_menu.addAction(stop_action)
         else:
             run_once_action = QAction("Run Once", self)
-            run_once_action.triggered.connect(lambda: self.run_sequence_requested.emit(self.sequence_name, False))
+            run_once_action.triggered.connect(lambda: self.run_sequence_requested.emit(self.sequence_name, False, self.execution_profile))
             context_menu.addAction(run_once_action)
 
             run_loop_action = QAction("Run in Loop", self)
-            run_loop_action.triggered.connect(lambda: self.run_sequence_requested.emit(self.sequence_name, True))
+            run_loop_action.triggered.connect(lambda: self.run_sequence_requested.emit(self.sequence_name, True, self.execution_profile))
             context_menu.addAction(run_loop_action)
 
+            profile_menu = context_menu.addMenu("Execution Profile")
+            for profile_name in EXECUTION_PROFILES:
+                profile_action = QAction(profile_name, self)
+                profile_action.setCheckable(True)
+                profile_action.setChecked(profile_name == self.execution_profile)
+                profile_action.triggered.connect(lambda checked, name=profile_name: self.set_execution_profile(name))
+                profile_menu.addAction(profile_action)
+
         context_menu.addSeparator()
         
         if self.is_minimized:
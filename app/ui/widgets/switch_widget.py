@@ -64,7 +64,7 @@ class SwitchWidget(BaseWidget):
             self.on_data_changed(initial_value) # Use callback to set initial state
             self.status_label.setText(f"Node: {self.node.nodeid.to_string()}")
 
-            self.subscription_handle = await self.opcua_logic.subscribe_to_node_change(self.node, self.on_data_changed)
+            self.subscription_handle = await self.subscribe_to_node(self.on_data_changed)
 
         except Exception as e:
             self.set_error_state(f"Setup Error: {e}")
@@ -0,0 +1,190 @@
+"""
+Coalesced, Frame-Rate-Limited Dashboard Updates.
+
+This module provides the UpdateDispatcher, which sits between OPC-UA data
+change notifications and dashboard widgets. Instead of repainting a widget on
+every sample, incoming values are buffered per subscription and delivered on a
+fixed UI tick. Display-style widgets only ever see the latest value of a tick,
+while plot-style widgets receive every sample collected since the last tick in
+a single batch. Widgets that are not visible (e.g. on a hidden dashboard page)
+are skipped until they are shown again.
+"""
+import logging
+from collections import deque
+from PyQt6.QtCore import QObject, QTimer, QEvent
+
+DEFAULT_FRAME_RATE = 30
+
+
+class UpdateChannel:
+    """
+    Buffers the values of one widget subscription between UI ticks.
+
+    Instances are callable, so a channel can be used directly as an OPC-UA
+    subscription callback.
+
+    Attributes:
+        widget (QWidget): The widget receiving the updates.
+        callback (callable): Called with the latest value, or with a list of
+                             values when `accumulate` is True.
+        accumulate (bool): True to deliver every value, False for only the latest.
+    """
+    def __init__(self, dispatcher, widget, callback, accumulate=False, max_pending=None):
+        """
+        Initializes an UpdateChannel.
+
+        Args:
+            dispatcher (UpdateDispatcher): The dispatcher flushing this channel.
+            widget (QWidget): The widget receiving the updates.
+            callback (callable): The widget's update method.
+            accumulate (bool, optional): True to deliver all values as a list.
+            max_pending (int, optional): In accumulate mode, the maximum number of
+                                         values kept while the widget is hidden.
+        """
+        self.dispatcher = dispatcher
+        self.widget = widget
+        self.callback = callback
+        self.accumulate = accumulate
+        self.pending = deque(maxlen=max_pending) if accumulate else None
+        self.latest = None
+
+    def __call__(self, value):
+        """Buffers a new value and schedules the channel for the next tick."""
+        if self.accumulate:
+            self.pending.append(value)
+        else:
+            self.latest = value
+        self.dispatcher.mark_dirty(self)
+
+    def flush(self):
+        """Delivers the buffered value(s) to the widget."""
+        if self.accumulate:
+            values = list(self.pending)
+            self.pending.clear()
+            self.callback(values)
+        else:
+            value, self.latest = self.latest, None
+            self.callback(value)
+
+
+class UpdateDispatcher(QObject):
+    """
+    Delivers buffered widget updates on a configurable UI tick.
+
+    Channels with new data are flushed at most once per tick. The tick timer
+    only runs while there is pending data for visible widgets: channels of
+    hidden widgets are parked, and re-scheduled when their widget is shown.
+
+    Args:
+        frame_rate (int, optional): The number of UI ticks per second.
+        parent (QObject, optional): The parent object.
+    """
+    def __init__(self, frame_rate=DEFAULT_FRAME_RATE, parent=None):
+        super().__init__(parent)
+        self._dirty = {}
+        self._parked = {}
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self.set_frame_rate(frame_rate)
+
+    def set_frame_rate(self, frame_rate):
+        """
+        Changes the UI tick rate.
+
+        Args:
+            frame_rate (int): Ticks per second. Values below 1 are clamped to 1.
+        """
+        self.frame_rate = max(1, int(frame_rate))
+        self._timer.setInterval(int(1000 / self.frame_rate))
+
+    def latest_value_channel(self, widget, callback):
+        """
+        Creates a channel that delivers only the most recent value per tick.
+
+        Args:
+            widget (QWidget): The widget receiving the updates.
+            callback (callable): Called with a single value.
+
+        Returns:
+            UpdateChannel: A callable to use as the subscription callback.
+        """
+        return UpdateChannel(self, widget, callback)
+
+    def all_values_channel(self, widget, callback, max_pending=None):
+        """
+        Creates a channel that delivers every value received since the last tick.
+
+        Args:
+            widget (QWidget): The widget receiving the updates.
+            callback (callable): Called with a list of values.
+            max_pending (int, optional): The maximum number of values kept while
+                                         the widget is hidden.
+
+        Returns:
+            UpdateChannel: A callable to use as the subscription callback.
+        """
+        return UpdateChannel(self, widget, callback, accumulate=True, max_pending=max_pending)
+
+    def mark_dirty(self, channel):
+        """Schedules a channel to be flushed on the next tick."""
+        if id(channel) in self._parked:
+            # The widget is hidden; the value stays buffered until it is shown.
+            return
+        self._dirty[id(channel)] = channel
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """
+        Flushes all dirty channels whose widgets are visible.
+
+        Channels of hidden widgets are parked and flushed once the widget
+        becomes visible again. Channels of deleted widgets are dropped.
+        """
+        for key, channel in list(self._dirty.items()):
+            try:
+                if not channel.widget.isVisible():
+                    del self._dirty[key]
+                    self._park(key, channel)
+                    continue
+            except RuntimeError:
+                # The underlying C++ widget has been deleted.
+                del self._dirty[key]
+                continue
+            del self._dirty[key]
+            try:
+                channel.flush()
+            except Exception as e:
+                logging.error(f"Failed to update widget '{channel.widget.config.get('label', 'N/A')}': {e}")
+        if not self._dirty:
+            self._timer.stop()
+
+    def _park(self, key, channel):
+        """Sets a hidden widget's channel aside until the widget is shown."""
+        for parked_key, parked in list(self._parked.items()):
+            try:
+                parked.widget.isVisible()
+            except RuntimeError:
+                # The underlying C++ widget has been deleted.
+                del self._parked[parked_key]
+        self._parked[key] = channel
+        channel.widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        """
+        Re-schedules the parked channels of a widget when it is shown.
+
+        Args:
+            watched (QObject): The widget the event is for.
+            event (QEvent): The event.
+
+        Returns:
+            bool: Always False, so the widget still handles the event.
+        """
+        if event.type() == QEvent.Type.Show:
+            for key, channel in list(self._parked.items()):
+                if channel.widget is watched:
+                    del self._parked[key]
+                    self.mark_dirty(channel)
+            watched.removeEventFilter(self)
+        return False
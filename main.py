@@ -8,6 +8,7 @@ It also handles the graceful shutdown of the application.
 import sys
 import asyncio
 import logging
+import multiprocessing
 import os
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
@@ -66,4 +67,6 @@ def main():
                 raise
 
 if __name__ == "__main__":
+    # Script worker processes are spawned from the frozen executable as well.
+    multiprocessing.freeze_support()
     main()